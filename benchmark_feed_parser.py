@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Benchmark for the crawler's feed parsing
+Compares StreamingFeedParser with feedparser on a synthetic RSS feed:
+CPU time per feed when reading the first --limit entries.
+"""
+
+import sys
+import time
+import argparse
+
+import feedparser
+
+from news_crawler import StreamingFeedParser
+
+
+def make_feed(items):
+    """Build a realistic news RSS feed with HTML descriptions and full content"""
+    parts = ['<?xml version="1.0" encoding="UTF-8"?>',
+             '<rss version="2.0" xmlns:content="http://purl.org/rss/1.0/modules/content/" '
+             'xmlns:dc="http://purl.org/dc/elements/1.1/"><channel><title>Example News</title>']
+    for i in range(items):
+        parts.append(
+            f"<item><title>Company announces quarterly results {i}</title>"
+            f"<link>https://www.example.com/news/2025/09/{i:08d}/company-announces-quarterly-results</link>"
+            f"<guid isPermaLink=\"false\">item-{i}</guid>"
+            f"<pubDate>Mon, 06 Oct 2025 {i % 24:02d}:00:00 GMT</pubDate>"
+            f"<dc:creator>Reporter {i % 17}</dc:creator>"
+            f"<description>&lt;p&gt;Summary of article {i} with &lt;a href=\"/x\"&gt;a link&lt;/a&gt;.&lt;/p&gt;</description>"
+            f"<content:encoded><![CDATA[{'<p>Paragraph of the full article text. </p>' * 20}]]></content:encoded></item>")
+    parts.append('</channel></rss>')
+    return ''.join(parts).encode('utf-8')
+
+
+def run_benchmark(name, parse, content, rounds):
+    """Measure CPU time per parse for one implementation"""
+    start = time.process_time()
+    for _ in range(rounds):
+        count = parse(content)
+    elapsed = (time.process_time() - start) / rounds
+    print(f"{name:<32}{count:>10}{elapsed * 1000:>14.1f}")
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark feed parser implementations")
+    parser.add_argument('--items', type=int, default=2000, help="Number of items in the feed (default: 2000)")
+    parser.add_argument('--limit', type=int, default=50, help="Entries the crawler keeps (max_articles_per_site, default: 50)")
+    parser.add_argument('--rounds', type=int, default=5, help="Parses per implementation (default: 5)")
+    args = parser.parse_args()
+
+    content = make_feed(args.items)
+    print(f"Feed parser benchmark: {args.items:,} items ({len(content) / 1048576:.1f} MB), first {args.limit} kept")
+    print(f"{'Implementation':<32}{'Entries':>10}{'CPU ms/feed':>14}")
+    print("-" * 56)
+    baseline = run_benchmark('feedparser', lambda body: len(feedparser.parse(body).entries[:args.limit]), content, args.rounds)
+    streamed = run_benchmark('StreamingFeedParser', lambda body: len(StreamingFeedParser.parse(body, args.limit)), content, args.rounds)
+    run_benchmark('StreamingFeedParser (all items)', lambda body: len(StreamingFeedParser.parse(body)), content, args.rounds)
+    print(f"Speedup with limit: {baseline / streamed:.0f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Benchmark for the crawler's seen-URL set
+Compares UrlFingerprintSet with a plain Python set of URL strings:
+bytes per URL, inserts/sec and lookups/sec.
+"""
+
+import sys
+import time
+import argparse
+import tracemalloc
+
+from news_crawler import UrlFingerprintSet
+
+
+def make_url(i):
+    """Build a realistic news article URL"""
+    return f"https://www.example{i % 500}.com/news/2025/09/{i:08d}/company-announces-quarterly-results-{i}"
+
+
+class StringSet:
+    """Plain set of URL strings behind one lock, as the crawler used to do"""
+
+    def __init__(self):
+        import threading
+        self.lock = threading.Lock()
+        self.urls = set()
+
+    def add(self, url):
+        with self.lock:
+            if url in self.urls:
+                return False
+            self.urls.add(url)
+            return True
+
+    def __contains__(self, url):
+        with self.lock:
+            return url in self.urls
+
+
+def run_benchmark(name, factory, count, lookups):
+    """Measure insert/lookup throughput and memory for one implementation"""
+    # Throughput (without tracemalloc overhead)
+    seen = factory()
+    start = time.perf_counter()
+    for i in range(count):
+        seen.add(make_url(i))
+    insert_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for i in range(0, count, max(count // lookups, 1)):
+        make_url(i) in seen
+    for i in range(count, count + lookups):
+        make_url(i) in seen
+    lookup_time = time.perf_counter() - start
+    lookup_ops = len(range(0, count, max(count // lookups, 1))) + lookups
+    del seen
+
+    # Memory (separate build, traced)
+    tracemalloc.start()
+    seen = factory()
+    for i in range(count):
+        seen.add(make_url(i))
+    memory, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del seen
+
+    print(f"{name:<20}{memory / count:>12.1f}{count / insert_time:>16,.0f}{lookup_ops / lookup_time:>16,.0f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark seen-URL set implementations")
+    parser.add_argument('--count', type=int, default=10_000_000, help="Number of URLs to insert (default: 10M)")
+    parser.add_argument('--lookups', type=int, default=1_000_000, help="Number of hit + miss lookups (default: 1M)")
+    parser.add_argument('--skip-string-set', action='store_true', help="Only benchmark UrlFingerprintSet")
+    args = parser.parse_args()
+
+    print(f"Seen-URL set benchmark: {args.count:,} URLs, {args.lookups:,} lookups")
+    print(f"{'Implementation':<20}{'Bytes/URL':>12}{'Inserts/sec':>16}{'Lookups/sec':>16}")
+    print("-" * 64)
+    run_benchmark('UrlFingerprintSet', UrlFingerprintSet, args.count, args.lookups)
+    if not args.skip_string_set:
+        run_benchmark('set of strings', StringSet, args.count, args.lookups)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
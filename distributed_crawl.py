@@ -0,0 +1,467 @@
+#!/usr/bin/env python3
+"""
+Distributed crawl mode for the news crawler
+A coordinator puts one discovery task per website into a shared work queue.
+Any number of worker processes (on this machine or on other nodes sharing the
+queue) lease tasks, discover article URLs and push them back as article tasks
+sharded by host, process articles, and write matches to a merged result store.
+Leases are kept alive by heartbeats; leases that expire are re-queued.
+
+Usage:
+    python distributed_crawl.py coordinator --local-workers 4
+    python distributed_crawl.py worker --queue sqlite:///shared/crawl_queue.db
+"""
+
+import os
+import sys
+import json
+import time
+import socket
+import sqlite3
+import argparse
+import threading
+import subprocess
+from abc import ABC, abstractmethod
+from typing import List, Dict, Optional, Tuple
+from urllib.parse import urlparse
+
+from news_crawler import NewsWebsiteCrawler, StoredResult, RetryQueue
+
+
+class WorkQueue(ABC):
+    """Interface of the shared work queue; subclass it to plug in another broker"""
+
+    @abstractmethod
+    def reset(self):
+        """Remove all tasks, results and metadata"""
+
+    @abstractmethod
+    def add_tasks(self, kind: str, items: List[Tuple[str, str, float]]) -> int:
+        """Add (key, payload, priority) tasks of a kind; tasks whose key already exists are ignored"""
+
+    @abstractmethod
+    def lease(self, worker_id: str, lease_seconds: float) -> Optional[Dict]:
+        """Lease the next pending task (discovery first, then newest articles), or None"""
+
+    @abstractmethod
+    def complete(self, task_id: int, worker_id: str):
+        ...
+
+    @abstractmethod
+    def fail(self, task_id: int, worker_id: str, error: str, max_attempts: int):
+        """Give a task back for another attempt, or mark it failed after max_attempts"""
+
+    @abstractmethod
+    def retry(self, task_id: int, worker_id: str, delay: float):
+        """Give a task back for a retry that no worker may lease before delay seconds have passed"""
+
+    @abstractmethod
+    def heartbeat(self, worker_id: str, lease_seconds: float) -> int:
+        """Extend the leases held by a worker; returns how many were extended"""
+
+    @abstractmethod
+    def requeue_expired(self, max_attempts: int) -> int:
+        """Return tasks whose lease expired to the queue; returns how many were re-queued"""
+
+    @abstractmethod
+    def add_result(self, url: str, data: Dict):
+        ...
+
+    @abstractmethod
+    def iter_results(self):
+        ...
+
+    @abstractmethod
+    def counts(self) -> Dict[str, int]:
+        """Number of tasks per status"""
+
+    @abstractmethod
+    def set_meta(self, key: str, value: str):
+        ...
+
+    @abstractmethod
+    def get_meta(self, key: str) -> Optional[str]:
+        ...
+
+
+class SQLiteWorkQueue(WorkQueue):
+    """Work queue in a SQLite file (WAL mode), shared by processes on one host or a shared disk"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.local = threading.local()
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        with self.connection() as conn:
+            conn.executescript("""
+                CREATE TABLE IF NOT EXISTS tasks (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    kind TEXT NOT NULL,
+                    task_key TEXT NOT NULL UNIQUE,
+                    payload TEXT NOT NULL,
+                    host TEXT NOT NULL,
+                    priority REAL NOT NULL DEFAULT 0,
+                    status TEXT NOT NULL DEFAULT 'pending',
+                    worker TEXT,
+                    lease_expires REAL,
+                    attempts INTEGER NOT NULL DEFAULT 0,
+                    retries INTEGER NOT NULL DEFAULT 0,
+                    not_before REAL,
+                    error TEXT
+                );
+                CREATE INDEX IF NOT EXISTS tasks_pending ON tasks (status, kind, priority);
+                CREATE TABLE IF NOT EXISTS results (url TEXT PRIMARY KEY, data TEXT NOT NULL);
+                CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+            """)
+            # Queues created before retries went through the shared queue
+            columns = {row[1] for row in conn.execute('PRAGMA table_info(tasks)')}
+            if 'retries' not in columns:
+                conn.execute('ALTER TABLE tasks ADD COLUMN retries INTEGER NOT NULL DEFAULT 0')
+                conn.execute('ALTER TABLE tasks ADD COLUMN not_before REAL')
+
+    def connection(self) -> sqlite3.Connection:
+        """Per-thread connection (sqlite3 connections cannot be shared between threads)"""
+        conn = getattr(self.local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=60, isolation_level=None)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            self.local.conn = conn
+        return conn
+
+    def reset(self):
+        conn = self.connection()
+        conn.execute('DELETE FROM tasks')
+        conn.execute('DELETE FROM results')
+        conn.execute('DELETE FROM meta')
+
+    def add_tasks(self, kind: str, items: List[Tuple[str, str, float]]) -> int:
+        conn = self.connection()
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            before = conn.total_changes
+            conn.executemany(
+                'INSERT OR IGNORE INTO tasks (kind, task_key, payload, host, priority) VALUES (?, ?, ?, ?, ?)',
+                [(kind, f"{kind}:{key}", payload, urlparse(payload).hostname or '', priority)
+                 for key, payload, priority in items]
+            )
+            added = conn.total_changes - before
+            conn.execute('COMMIT')
+        except Exception:
+            conn.execute('ROLLBACK')
+            raise
+        return added
+
+    def lease(self, worker_id: str, lease_seconds: float) -> Optional[Dict]:
+        conn = self.connection()
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            order = "ORDER BY kind = 'article', priority DESC, id LIMIT 1"
+            # Tasks waiting out a retry delay are not due yet
+            due = "status = 'pending' AND (not_before IS NULL OR not_before <= ?)"
+            now = time.time()
+            # Prefer hosts nobody is working on, so one site is not hit from many nodes at once
+            row = conn.execute(
+                f"SELECT id, kind, payload, host, retries FROM tasks WHERE {due} AND host NOT IN "
+                f"(SELECT host FROM tasks WHERE status = 'leased') {order}", (now,)
+            ).fetchone()
+            if row is None:
+                row = conn.execute(f"SELECT id, kind, payload, host, retries FROM tasks WHERE {due} {order}", (now,)).fetchone()
+            if row is None:
+                conn.execute('COMMIT')
+                return None
+            conn.execute(
+                "UPDATE tasks SET status = 'leased', worker = ?, lease_expires = ?, attempts = attempts + 1 WHERE id = ?",
+                (worker_id, time.time() + lease_seconds, row[0])
+            )
+            conn.execute('COMMIT')
+        except Exception:
+            conn.execute('ROLLBACK')
+            raise
+        return {'id': row[0], 'kind': row[1], 'payload': row[2], 'host': row[3], 'retries': row[4]}
+
+    def complete(self, task_id: int, worker_id: str):
+        self.connection().execute(
+            "UPDATE tasks SET status = 'done', lease_expires = NULL WHERE id = ? AND worker = ?",
+            (task_id, worker_id)
+        )
+
+    def fail(self, task_id: int, worker_id: str, error: str, max_attempts: int):
+        self.connection().execute(
+            "UPDATE tasks SET status = CASE WHEN attempts >= ? THEN 'failed' ELSE 'pending' END, "
+            "worker = NULL, lease_expires = NULL, error = ? WHERE id = ? AND worker = ?",
+            (max_attempts, error[:500], task_id, worker_id)
+        )
+
+    def retry(self, task_id: int, worker_id: str, delay: float):
+        # A retry is not a lost lease: it does not count towards max_attempts
+        self.connection().execute(
+            "UPDATE tasks SET status = 'pending', worker = NULL, lease_expires = NULL, not_before = ?, "
+            "attempts = attempts - 1, retries = retries + 1 WHERE id = ? AND worker = ?",
+            (time.time() + delay, task_id, worker_id)
+        )
+
+    def heartbeat(self, worker_id: str, lease_seconds: float) -> int:
+        cursor = self.connection().execute(
+            "UPDATE tasks SET lease_expires = ? WHERE status = 'leased' AND worker = ?",
+            (time.time() + lease_seconds, worker_id)
+        )
+        return cursor.rowcount
+
+    def requeue_expired(self, max_attempts: int) -> int:
+        cursor = self.connection().execute(
+            "UPDATE tasks SET status = CASE WHEN attempts >= ? THEN 'failed' ELSE 'pending' END, "
+            "worker = NULL, lease_expires = NULL, error = 'lease expired' "
+            "WHERE status = 'leased' AND lease_expires < ?",
+            (max_attempts, time.time())
+        )
+        return cursor.rowcount
+
+    def add_result(self, url: str, data: Dict):
+        self.connection().execute(
+            'INSERT OR REPLACE INTO results (url, data) VALUES (?, ?)',
+            (url, json.dumps(data, ensure_ascii=False))
+        )
+
+    def iter_results(self):
+        for (data,) in self.connection().execute('SELECT data FROM results ORDER BY rowid'):
+            yield json.loads(data)
+
+    def counts(self) -> Dict[str, int]:
+        counts = {'pending': 0, 'leased': 0, 'done': 0, 'failed': 0}
+        for status, count in self.connection().execute('SELECT status, COUNT(*) FROM tasks GROUP BY status'):
+            counts[status] = count
+        return counts
+
+    def set_meta(self, key: str, value: str):
+        self.connection().execute('INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)', (key, value))
+
+    def get_meta(self, key: str) -> Optional[str]:
+        row = self.connection().execute('SELECT value FROM meta WHERE key = ?', (key,)).fetchone()
+        return row[0] if row else None
+
+
+# Queue backends by URI scheme; register another WorkQueue subclass here to use a different broker
+WORK_QUEUE_BACKENDS = {
+    'sqlite': lambda location: SQLiteWorkQueue(location),
+}
+
+
+def open_work_queue(uri: str) -> WorkQueue:
+    """Open a work queue from a URI such as sqlite:///output/crawl_queue.db (a bare path means SQLite)"""
+    if '://' not in uri:
+        return SQLiteWorkQueue(uri)
+    scheme, location = uri.split('://', 1)
+    if scheme not in WORK_QUEUE_BACKENDS:
+        raise ValueError(f"Unknown work queue backend '{scheme}' (available: {', '.join(WORK_QUEUE_BACKENDS)})")
+    if scheme == 'sqlite' and location.startswith('/'):
+        # sqlite:///relative/path and sqlite:////absolute/path, as in SQLAlchemy URLs
+        location = location[1:]
+    return WORK_QUEUE_BACKENDS[scheme](location)
+
+
+class TaskRetryQueue(RetryQueue):
+    """RetryQueue for workers: it only picks the delay of a retry, and the task goes back to the shared queue.
+
+    Nothing is held in worker memory, so a retry survives a worker crash and
+    the coordinator keeps waiting for it before merging results.
+    """
+
+    def __init__(self, base_delay: float = 2.0, max_delay: float = 300.0):
+        super().__init__(base_delay, max_delay)
+        self.local = threading.local()
+
+    def schedule(self, item, attempt: int, retry_after: Optional[float] = None) -> float:
+        delay = self.backoff(attempt, retry_after)
+        with self.lock:
+            self.scheduled += 1
+            self.total_delay += delay
+        self.local.delay = delay
+        return delay
+
+    def defer(self, item, attempt: int, delay: float) -> float:
+        self.local.delay = delay
+        return delay
+
+    def take(self) -> Optional[float]:
+        """Delay of the retry the current task asked for in this thread, if any"""
+        delay = getattr(self.local, 'delay', None)
+        self.local.delay = None
+        return delay
+
+
+class CrawlWorker:
+    """Leases tasks from the shared queue and runs them with a local NewsWebsiteCrawler"""
+
+    def __init__(self, queue_uri: str, config_file: str = None):
+        self.queue_uri = queue_uri
+        self.queue = open_work_queue(queue_uri)
+        self.crawler = NewsWebsiteCrawler(config_file)
+        self.config = self.crawler.config
+        self.crawler.retry_queue = TaskRetryQueue(self.config['retry_backoff_base'], self.config['retry_backoff_max'])
+        self.worker_id = f"{socket.gethostname()}-{os.getpid()}"
+        self.lease_seconds = self.config.get('distributed_lease_seconds', 300)
+        self.max_attempts = self.config.get('distributed_max_attempts', 3)
+        self.poll_interval = self.config.get('distributed_poll_interval', 2)
+        self.stop_event = threading.Event()
+        self.tasks_done = 0
+        self.lock = threading.Lock()
+
+    def heartbeat_loop(self):
+        """Keep this worker's leases alive while it is running"""
+        while not self.stop_event.wait(self.lease_seconds / 3):
+            try:
+                self.queue.heartbeat(self.worker_id, self.lease_seconds)
+            except Exception as e:
+                self.crawler.logger.warning(f"Heartbeat failed: {e}")
+
+    def run_task(self, task: Dict):
+        """Run one discovery or article task"""
+        if task['kind'] == 'discover':
+            urls = self.crawler.crawl_website(task['payload'])
+            canonicalize = self.crawler.canonicalizer.canonicalize
+            self.queue.add_tasks('article', [
+                (canonicalize(url), url, self.crawler.url_timestamps.get(canonicalize(url), 0.0))
+                for url in urls
+            ])
+        else:
+            self.run_article(task['payload'], task['retries'])
+
+    def run_article(self, url: str, attempt: int = 0):
+        """Process one article (attempt > 0 for a retry) and store it in the shared results if it matched"""
+        result = self.crawler.process_article(url, attempt)
+        if result is not None and result.found_companies:
+            for watchlist in result.watchlists:
+                stored = StoredResult.from_crawl_result(result, self.crawler.stored_content_chars(), watchlist)
+                self.queue.add_result(f"{watchlist} {result.url}", stored.to_dict())
+
+    def work_loop(self):
+        """Lease and run tasks until the queue is drained"""
+        while not self.stop_event.is_set():
+            task = self.queue.lease(self.worker_id, self.lease_seconds)
+            if task is None:
+                counts = self.queue.counts()
+                if self.queue.get_meta('seeded') and counts['pending'] == 0 and counts['leased'] == 0:
+                    return
+                time.sleep(self.poll_interval)
+                continue
+            try:
+                self.crawler.retry_queue.take()
+                self.run_task(task)
+                # A failed fetch goes back to the shared queue with its backoff delay, and a URL
+                # of a host with an open circuit until the circuit's cooldown ends
+                delay = self.crawler.retry_queue.take()
+                if delay is not None:
+                    self.queue.retry(task['id'], self.worker_id, delay)
+                    continue
+                self.queue.complete(task['id'], self.worker_id)
+                with self.lock:
+                    self.tasks_done += 1
+            except Exception as e:
+                self.crawler.logger.error(f"Task {task['kind']} {task['payload']} failed: {e}")
+                self.queue.fail(task['id'], self.worker_id, str(e), self.max_attempts)
+
+    def run(self):
+        """Run max_workers task threads plus a heartbeat thread"""
+        self.crawler.log_and_flush('info', f"Worker {self.worker_id} started on queue {self.queue_uri}")
+        heartbeat = threading.Thread(target=self.heartbeat_loop, name='LeaseHeartbeat', daemon=True)
+        heartbeat.start()
+        threads = [threading.Thread(target=self.work_loop, name=f'CrawlWorker-{i}')
+                   for i in range(self.config['max_workers'])]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.stop_event.set()
+        self.crawler.save_caches()
+        self.crawler.log_and_flush('info', f"Worker {self.worker_id} finished: {self.tasks_done} tasks, "
+                                           f"{self.crawler.stats['total_urls_processed']} articles processed")
+        self.crawler.flush_logs()
+
+
+class CrawlCoordinator:
+    """Seeds the shared queue with websites, re-queues lost leases and merges the results"""
+
+    def __init__(self, queue_uri: str, config_file: str = None, resume: bool = False):
+        self.queue_uri = queue_uri
+        self.config_file = config_file
+        self.queue = open_work_queue(queue_uri)
+        self.crawler = NewsWebsiteCrawler(config_file)
+        self.config = self.crawler.config
+        self.resume = resume
+        self.symbols = self.crawler.symbols
+
+    def seed(self):
+        """Put one discovery task per website in the queue"""
+        if not self.resume:
+            self.queue.reset()
+        added = self.queue.add_tasks('discover', [(website, website, 0.0) for website in self.crawler.websites])
+        self.queue.set_meta('seeded', str(time.time()))
+        self.crawler.log_and_flush('info', f"{self.symbols.get('rocket')} Seeded {added} website discovery tasks into {self.queue_uri}")
+
+    def start_local_workers(self, count: int) -> List[subprocess.Popen]:
+        """Start worker processes on this machine"""
+        command = [sys.executable, os.path.abspath(__file__), 'worker', '--queue', self.queue_uri]
+        if self.config_file:
+            command += ['--config', self.config_file]
+        return [subprocess.Popen(command) for _ in range(count)]
+
+    def run(self, local_workers: int = 0):
+        """Seed the queue, supervise until every task is finished, then save merged results"""
+        self.seed()
+        processes = self.start_local_workers(local_workers)
+        max_attempts = self.config.get('distributed_max_attempts', 3)
+        poll_interval = self.config.get('distributed_poll_interval', 2)
+
+        last_report = 0
+        while True:
+            requeued = self.queue.requeue_expired(max_attempts)
+            if requeued:
+                self.crawler.log_and_flush('warning', f"{self.symbols.get('warning')} Re-queued {requeued} tasks with expired leases")
+            counts = self.queue.counts()
+            if counts['pending'] == 0 and counts['leased'] == 0:
+                break
+            if time.time() - last_report >= 30:
+                last_report = time.time()
+                self.crawler.log_and_flush('info', f"{self.symbols.get('chart')} Queue: {counts['pending']} pending, "
+                                                   f"{counts['leased']} leased, {counts['done']} done, {counts['failed']} failed")
+            time.sleep(poll_interval)
+
+        self.queue.set_meta('finished', str(time.time()))
+        for process in processes:
+            process.wait()
+
+        counts = self.queue.counts()
+        self.crawler.log_and_flush('info', f"{self.symbols.get('party')} Distributed crawl finished: "
+                                           f"{counts['done']} tasks done, {counts['failed']} failed")
+        for data in self.queue.iter_results():
+            self.crawler.results.append(StoredResult.from_dict(data))
+        self.crawler.save_results()
+        self.crawler.flush_logs()
+
+
+def main(argv: List[str] = None):
+    """Main entry point"""
+    parser = argparse.ArgumentParser(description="Distributed mode for the news crawler")
+    parser.add_argument('role', choices=['coordinator', 'worker'])
+    parser.add_argument('--queue', default='sqlite:///output/crawl_queue.db',
+                        help="Work queue URI (default: sqlite:///output/crawl_queue.db)")
+    parser.add_argument('--config', default=None, help="Path to the JSON config file (default: config.json)")
+    parser.add_argument('--local-workers', type=int, default=0,
+                        help="Coordinator only: number of worker processes to start on this machine")
+    parser.add_argument('--resume', action='store_true',
+                        help="Coordinator only: keep the existing queue contents instead of starting fresh")
+    args = parser.parse_args(argv)
+
+    try:
+        if args.role == 'coordinator':
+            CrawlCoordinator(args.queue, args.config, resume=args.resume).run(args.local_workers)
+        else:
+            CrawlWorker(args.queue, args.config).run()
+    except KeyboardInterrupt:
+        print("\nInterrupted by user.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
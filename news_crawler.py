@@ -23,29 +23,228 @@ import requests
 import threading
 import sys
 import hashlib
-from datetime import datetime
-from collections import defaultdict
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from urllib.parse import urljoin, urlparse, urlencode
+import argparse
+import atexit
+import io
+import queue
+import logging.handlers
+import copy
+import cProfile
+import pstats
+import tracemalloc
+import tempfile
+import zlib
+import multiprocessing
+import gzip
+import glob
+import uuid
+import bisect
+import heapq
+import calendar
+import random
+import socket
+import ipaddress
+import signal
+from array import array
+from itertools import chain
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from html import unescape
+from xml.etree import ElementTree
+from collections import defaultdict, Counter, deque
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed, wait, FIRST_COMPLETED
+from urllib.parse import urljoin, urlparse, urlencode, urlunparse, parse_qsl
+from urllib.robotparser import RobotFileParser
 from dataclasses import dataclass, field
 from typing import List, Dict, Set, Optional, Tuple
 
 import feedparser
 from bs4 import BeautifulSoup
 from requests.adapters import HTTPAdapter
+from results_db import ResultsDatabase
 try:
     from urllib3.util.retry import Retry
+    from urllib3.util.connection import create_connection
+    from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+    from urllib3.connection import HTTPConnection, HTTPSConnection
+    from urllib3.exceptions import NewConnectionError, ConnectTimeoutError
 except ImportError:
     from requests.packages.urllib3.util.retry import Retry
+    from requests.packages.urllib3.util.connection import create_connection
+    from requests.packages.urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+    from requests.packages.urllib3.connection import HTTPConnection, HTTPSConnection
+    from requests.packages.urllib3.exceptions import NewConnectionError, ConnectTimeoutError
 
+# Optional brotli support (urllib3 decodes 'br' responses when one of these is installed)
+try:
+    import brotli  # noqa: F401
+    HAS_BROTLI = True
+except ImportError:
+    try:
+        import brotlicffi  # noqa: F401
+        HAS_BROTLI = True
+    except ImportError:
+        HAS_BROTLI = False
+
+# Optional dnspython: gives the DNS cache real record TTLs instead of a fixed one
+try:
+    import dns.resolver
+    HAS_DNSPYTHON = True
+except ImportError:
+    HAS_DNSPYTHON = False
+
+# Optional zstandard: smaller, faster page archive segments than gzip
+try:
+    import zstandard
+    HAS_ZSTANDARD = True
+except ImportError:
+    HAS_ZSTANDARD = False
+
+
+class BatchingStreamHandler(logging.StreamHandler):
+    """Stream handler that buffers records and writes them in batches.
+
+    Runs behind a QueueListener, so only the background logging thread ever
+    touches the stream. The buffer is written when it reaches batch_size
+    records or when flush_interval seconds have passed, whichever comes first.
+    """
+
+    def __init__(self, stream=None, batch_size: int = 100, flush_interval: float = 0.5):
+        super().__init__(stream)
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.buffer: List[str] = []
+        self._stop_flushing = threading.Event()
+        self._flusher = threading.Thread(target=self._flush_loop, name='LogFlusher', daemon=True)
+        self._flusher.start()
 
-class FlushingHandler(logging.StreamHandler):
-    """Custom handler that forces immediate flushing for real-time logging"""
     def emit(self, record):
-        super().emit(record)
+        try:
+            msg = self.format(record)
+            with self.lock:
+                self.buffer.append(msg)
+                if len(self.buffer) >= self.batch_size:
+                    self._write_buffer()
+        except Exception:
+            self.handleError(record)
+
+    def _write_buffer(self):
+        """Write buffered messages to the stream (caller holds self.lock)"""
+        if self.buffer and self.stream:
+            self.stream.write(self.terminator.join(self.buffer) + self.terminator)
+            self.buffer.clear()
+            if hasattr(self.stream, 'flush'):
+                self.stream.flush()
+
+    def _flush_loop(self):
+        """Time-based flushing so quiet periods do not hold messages back"""
+        while not self._stop_flushing.wait(self.flush_interval):
+            self.flush()
+
+    def flush(self):
+        with self.lock:
+            self._write_buffer()
+
+    def close(self):
+        self._stop_flushing.set()
         self.flush()
-        sys.stdout.flush()
-        sys.stderr.flush()
+        super().close()
+
+
+class BatchingFileHandler(BatchingStreamHandler):
+    """Batching handler that writes to a file"""
+
+    def __init__(self, filename: str, batch_size: int = 100, flush_interval: float = 0.5):
+        self.log_file = open(filename, 'a', encoding='utf-8')
+        super().__init__(self.log_file, batch_size, flush_interval)
+
+    def close(self):
+        super().close()
+        self.log_file.close()
+
+
+class RecordQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler that keeps exception info on queued records.
+
+    The stock prepare() folds the traceback into msg and clears exc_info, so
+    the handlers behind the listener could not format it themselves (e.g. the
+    'exception' field of JsonLinesFormatter). The queue stays in-process, so
+    records do not need to be pickleable.
+    """
+
+    def prepare(self, record):
+        record = copy.copy(record)
+        record.message = record.getMessage()
+        record.msg = record.message
+        record.args = None
+        return record
+
+
+_active_log_listeners: List[logging.handlers.QueueListener] = []
+
+
+def stop_log_listener():
+    """Drain and stop the background logging pipeline, closing its handlers"""
+    while _active_log_listeners:
+        listener = _active_log_listeners.pop()
+        if listener._thread is not None:
+            listener.stop()
+        for handler in listener.handlers:
+            handler.close()
+
+
+atexit.register(stop_log_listener)
+
+
+class JsonLinesFormatter(logging.Formatter):
+    """Formats log records as one JSON object per line"""
+
+    def format(self, record):
+        entry = {
+            'time': datetime.fromtimestamp(record.created).isoformat(),
+            'level': record.levelname,
+            'logger': record.name,
+            'thread': record.threadName,
+            'message': record.getMessage(),
+        }
+        if record.exc_info:
+            entry['exception'] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False)
+
+
+class DebugRateLimitFilter(logging.Filter):
+    """Limits DEBUG records (per-URL messages) to a maximum rate per second.
+
+    Suppressed records are counted and reported on the next DEBUG record that
+    gets through. Other levels are never dropped.
+    """
+
+    def __init__(self, max_per_second: int = 50):
+        super().__init__()
+        self.max_per_second = max_per_second
+        self.window_start = time.time()
+        self.window_count = 0
+        self.suppressed = 0
+        self._lock = threading.Lock()
+
+    def filter(self, record):
+        if record.levelno != logging.DEBUG or self.max_per_second <= 0:
+            return True
+        with self._lock:
+            now = time.time()
+            if now - self.window_start >= 1.0:
+                self.window_start = now
+                self.window_count = 0
+            if self.window_count >= self.max_per_second:
+                self.suppressed += 1
+                return False
+            self.window_count += 1
+            suppressed, self.suppressed = self.suppressed, 0
+        if suppressed:
+            record.msg = f"{record.getMessage()} [{suppressed} debug messages suppressed by rate limit]"
+            record.args = None
+        return True
 
 
 class UnicodeSafeFormatter:
@@ -111,17 +310,1147 @@ class UnicodeSafeFormatter:
             return text.encode('ascii', 'replace').decode('ascii')
 
 
+class CrawlProfiler:
+    """CPU and memory profiler for a crawl run (cProfile or sampling + tracemalloc)"""
+
+    def __init__(self, mode: str = 'cprofile', output_dir: str = 'output',
+                 top_n: int = 30, sample_interval: float = 0.01):
+        self.mode = mode if mode in ('cprofile', 'sampling') else 'cprofile'
+        self.output_dir = output_dir
+        self.top_n = top_n
+        self.sample_interval = sample_interval
+        self.timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+
+        # cProfile mode: one profiler per thread, merged at the end
+        self._local = threading.local()
+        self._profilers: List[cProfile.Profile] = []
+        self._profilers_lock = threading.Lock()
+
+        # Sampling mode: counts of (file, line, function) across all threads
+        self._self_samples = Counter()
+        self._total_samples = Counter()
+        self._sample_count = 0
+        self._sampler_thread = None
+        self._stop_sampling = threading.Event()
+
+        # Memory: one entry per finished phase
+        self.phases: List[Dict] = []
+        self._current_phase = None
+        self._phase_start = 0.0
+        self._last_sizes: Dict = {}
+        self._finished = False
+
+    def start(self, phase: str = 'init'):
+        """Start CPU and memory profiling and open the first phase"""
+        tracemalloc.start()
+
+        if self.mode == 'sampling':
+            self._sampler_thread = threading.Thread(target=self._sample_loop, name='CrawlProfilerSampler', daemon=True)
+            self._sampler_thread.start()
+        else:
+            self._thread_profiler().enable()
+
+        self._current_phase = phase
+        self._phase_start = time.time()
+
+    def _thread_profiler(self) -> cProfile.Profile:
+        """Get (or create) the cProfile profiler of the calling thread"""
+        profiler = getattr(self._local, 'profiler', None)
+        if profiler is None:
+            profiler = cProfile.Profile()
+            self._local.profiler = profiler
+            with self._profilers_lock:
+                self._profilers.append(profiler)
+        return profiler
+
+    def wrap(self, func):
+        """Wrap a worker task so it is profiled in whichever pool thread runs it"""
+        if self.mode != 'cprofile':
+            return func
+
+        def profiled(*args, **kwargs):
+            profiler = self._thread_profiler()
+            profiler.enable()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                profiler.disable()
+
+        return profiled
+
+    def _sample_loop(self):
+        """Periodically sample the stacks of all running threads"""
+        own_ident = threading.get_ident()
+        while not self._stop_sampling.wait(self.sample_interval):
+            for ident, frame in sys._current_frames().items():
+                if ident == own_ident:
+                    continue
+                leaf = frame
+                seen = set()
+                self._self_samples[(leaf.f_code.co_filename, leaf.f_lineno, leaf.f_code.co_name)] += 1
+                while frame is not None:
+                    code = frame.f_code
+                    func_key = (code.co_filename, code.co_firstlineno, code.co_name)
+                    if func_key not in seen:
+                        seen.add(func_key)
+                        self._total_samples[func_key] += 1
+                    frame = frame.f_back
+                self._sample_count += 1
+
+    def phase(self, name: str):
+        """Close the current phase (recording its memory) and start a new one"""
+        self._close_phase()
+        self._current_phase = name
+        self._phase_start = time.time()
+
+    def _close_phase(self):
+        """Record duration, current/peak memory and top allocation growth of the current phase"""
+        if self._current_phase is None:
+            return
+        current, peak = tracemalloc.get_traced_memory()
+
+        # Keep snapshot bookkeeping out of the CPU profile
+        if self.mode == 'cprofile':
+            self._thread_profiler().disable()
+        # Group the snapshot once; growth is diffed against the previous phase's sizes
+        statistics = tracemalloc.take_snapshot().statistics('lineno')
+        sizes = {stat.traceback: stat.size for stat in statistics}
+        growth = sorted(statistics, key=lambda stat: stat.size - self._last_sizes.get(stat.traceback, 0), reverse=True)
+        self.phases.append({
+            'name': self._current_phase,
+            'duration': time.time() - self._phase_start,
+            'current': current,
+            'peak': peak,
+            'top_growth': [f"{stat.traceback}: size={stat.size / 1024:.1f} KiB "
+                           f"(+{(stat.size - self._last_sizes.get(stat.traceback, 0)) / 1024:.1f} KiB), count={stat.count}"
+                           for stat in growth[:self.top_n] if stat.size > self._last_sizes.get(stat.traceback, 0)],
+            'top_sites': [str(stat) for stat in statistics[:self.top_n]],
+        })
+        self._last_sizes = sizes
+        tracemalloc.reset_peak()
+        self._current_phase = None
+        if self.mode == 'cprofile' and not self._finished:
+            self._thread_profiler().enable()
+
+    def finish(self) -> List[str]:
+        """Stop profiling and write the CPU and memory reports, returning their paths"""
+        if self._finished:
+            return []
+        self._finished = True
+        self._close_phase()
+
+        if self._sampler_thread:
+            self._stop_sampling.set()
+            self._sampler_thread.join()
+        tracemalloc.stop()
+
+        os.makedirs(self.output_dir, exist_ok=True)
+        base = os.path.join(self.output_dir, f"profile_{self.timestamp}")
+        written = []
+
+        cpu_file = f"{base}_cpu.txt"
+        with open(cpu_file, 'w', encoding='utf-8') as f:
+            f.write(self.cpu_report())
+        written.append(cpu_file)
+
+        if self.mode == 'cprofile' and self._profilers:
+            stats_file = f"{base}.prof"
+            self._merged_stats().dump_stats(stats_file)
+            written.append(stats_file)
+
+        memory_file = f"{base}_memory.txt"
+        with open(memory_file, 'w', encoding='utf-8') as f:
+            f.write(self.memory_report())
+        written.append(memory_file)
+
+        return written
+
+    def _merged_stats(self) -> pstats.Stats:
+        """Merge the per-thread cProfile profilers into one Stats object"""
+        stream = io.StringIO()
+        stats = pstats.Stats(self._profilers[0], stream=stream)
+        for profiler in self._profilers[1:]:
+            stats.add(profiler)
+        return stats
+
+    def cpu_report(self) -> str:
+        """Render the top functions as text"""
+        lines = [f"CPU profile ({self.mode}) - {self.timestamp}", "=" * 80]
+
+        if self.mode == 'cprofile':
+            if not self._profilers:
+                return "\n".join(lines + ["No profiling data collected"]) + "\n"
+            lines.append(f"Threads profiled: {len(self._profilers)}")
+            for sort_key in ('cumulative', 'tottime'):
+                stats = self._merged_stats()
+                stats.sort_stats(sort_key).print_stats(self.top_n)
+                lines.extend(["", f"Top {self.top_n} functions by {sort_key} time", "-" * 80, stats.stream.getvalue()])
+        else:
+            total = self._sample_count or 1
+            lines.append(f"Samples: {self._sample_count} (every {self.sample_interval * 1000:.1f} ms, all threads)")
+            for title, counter in (('self', self._self_samples), ('cumulative', self._total_samples)):
+                lines.extend(["", f"Top {self.top_n} functions by {title} samples", "-" * 80])
+                for (filename, lineno, name), count in counter.most_common(self.top_n):
+                    lines.append(f"{count / total * 100:6.1f}%  {count:8d}  {name} ({filename}:{lineno})")
+
+        return "\n".join(lines) + "\n"
+
+    def memory_report(self) -> str:
+        """Render per-phase peak memory and top allocation sites as text"""
+        lines = [f"Memory profile (tracemalloc) - {self.timestamp}", "=" * 80, "",
+                 f"{'Phase':<20}{'Duration':>12}{'Current MB':>14}{'Peak MB':>12}", "-" * 58]
+        for phase in self.phases:
+            lines.append(f"{phase['name']:<20}{phase['duration']:>11.1f}s"
+                         f"{phase['current'] / 1048576:>14.1f}{phase['peak'] / 1048576:>12.1f}")
+
+        for phase in self.phases:
+            lines.extend(["", f"Phase '{phase['name']}': top allocation growth", "-" * 80])
+            lines.extend(phase['top_growth'] or ["(none)"])
+            lines.extend(["", f"Phase '{phase['name']}': top live allocation sites at end of phase", "-" * 80])
+            lines.extend(phase['top_sites'] or ["(none)"])
+
+        return "\n".join(lines) + "\n"
+
+
+# Content types accepted by streamed downloads
+PAGE_CONTENT_TYPES = ('html', 'xml')
+FEED_CONTENT_TYPES = ('xml', 'rss', 'atom', 'text/')
+
+
+class ResponseSkipped(Exception):
+    """Raised when a streamed download is aborted because it is not an article/feed"""
+
+
+# Responses worth another attempt later (throttling and transient server errors)
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+
+class RetryableFetchError(requests.RequestException):
+    """A fetch failed in a way that may succeed later (timeout, connection error, 429/5xx)"""
+
+    def __init__(self, message: str, retry_after: Optional[float] = None):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class DeadlineExceeded(requests.RequestException):
+    """An article or discovery task ran past its wall-clock deadline.
+
+    host_fault is True only when the time ran out while the request to the
+    host was in progress, not while waiting for a slot or parsing.
+    """
+
+    def __init__(self, message: str, host_fault: bool = False):
+        super().__init__(message)
+        self.host_fault = host_fault
+
+
+def percentile(values, pct: float) -> float:
+    """Nearest-rank percentile of a sequence of numbers (0.0 if empty)"""
+    ordered = sorted(values)
+    if not ordered:
+        return 0.0
+    return ordered[min(len(ordered) - 1, max(0, int(round(pct / 100 * len(ordered) + 0.5)) - 1))]
+
+
+class CircuitOpenError(Exception):
+    """A fetch was refused because its host's circuit breaker is open"""
+
+    def __init__(self, message: str, retry_after: float):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class RetryQueue:
+    """Delayed-retry queue: failed work waits here with backoff instead of sleeping in a worker thread.
+
+    Delays grow exponentially with the attempt number (base * 2^(attempt-1),
+    capped at max_delay) with +/-50% jitter so retries from one outage don't
+    return in lockstep; a server-sent Retry-After takes precedence.
+    """
+
+    def __init__(self, base_delay: float = 2.0, max_delay: float = 300.0):
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.heap = []
+        self.counter = 0
+        self.lock = threading.Lock()
+        self.scheduled = 0
+        self.total_delay = 0.0
+
+    def backoff(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        """Delay before the given attempt (1 = first retry)"""
+        if retry_after is not None:
+            return min(retry_after, self.max_delay)
+        delay = min(self.base_delay * 2 ** (attempt - 1), self.max_delay)
+        return delay * random.uniform(0.5, 1.5)
+
+    def schedule(self, item, attempt: int, retry_after: Optional[float] = None) -> float:
+        """Queue an item for another attempt; returns the delay chosen"""
+        delay = self.backoff(attempt, retry_after)
+        with self.lock:
+            heapq.heappush(self.heap, (time.time() + delay, self.counter, item, attempt))
+            self.counter += 1
+            self.scheduled += 1
+            self.total_delay += delay
+        return delay
+
+    def defer(self, item, attempt: int, delay: float) -> float:
+        """Queue an item for another attempt after exactly delay seconds (no backoff, jitter or cap)"""
+        with self.lock:
+            heapq.heappush(self.heap, (time.time() + delay, self.counter, item, attempt))
+            self.counter += 1
+        return delay
+
+    def pop_due(self, now: float = None) -> List[Tuple]:
+        """Remove and return the (item, attempt) pairs whose delay has passed"""
+        now = now or time.time()
+        due = []
+        with self.lock:
+            while self.heap and self.heap[0][0] <= now:
+                _, _, item, attempt = heapq.heappop(self.heap)
+                due.append((item, attempt))
+        return due
+
+    def next_due(self) -> Optional[float]:
+        """Time the earliest queued retry becomes due"""
+        with self.lock:
+            return self.heap[0][0] if self.heap else None
+
+    def __len__(self):
+        return len(self.heap)
+
+
+class TransportStats:
+    """Thread-safe request and connection counters for HttpTransport"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.requests = defaultdict(int)
+        self.connections = defaultdict(int)
+        self.bytes_downloaded = 0
+        self.skipped_content_type = 0
+        self.truncated = 0
+        self.handshakes = defaultdict(lambda: {'connections': 0, 'dns': 0.0, 'connect': 0.0, 'tls': 0.0})
+
+    def download_finished(self, size: int, truncated: bool):
+        with self.lock:
+            self.bytes_downloaded += size
+            if truncated:
+                self.truncated += 1
+
+    def download_skipped(self):
+        with self.lock:
+            self.skipped_content_type += 1
+
+    def request_sent(self, host: str):
+        with self.lock:
+            self.requests[host] += 1
+
+    def connection_opened(self, host: str):
+        with self.lock:
+            self.connections[host] += 1
+
+    def handshake_timed(self, host: str, dns_time: float, connect_time: float, tls_time: float = 0.0):
+        """Record how long DNS, TCP connect and TLS took for a new connection"""
+        with self.lock:
+            timing = self.handshakes[host]
+            timing['connections'] += 1
+            timing['dns'] += dns_time
+            timing['connect'] += connect_time
+            timing['tls'] += tls_time
+
+    def handshake_summary(self) -> Dict[str, Dict]:
+        """Average DNS/connect/TLS milliseconds per host"""
+        with self.lock:
+            return {
+                host: {
+                    'connections': timing['connections'],
+                    'dns_ms': timing['dns'] * 1000 / timing['connections'],
+                    'connect_ms': timing['connect'] * 1000 / timing['connections'],
+                    'tls_ms': timing['tls'] * 1000 / timing['connections'],
+                }
+                for host, timing in self.handshakes.items()
+            }
+
+    def summary(self) -> Dict:
+        """Totals plus per-host request/connection counts"""
+        with self.lock:
+            total_requests = sum(self.requests.values())
+            total_connections = sum(self.connections.values())
+            per_host = {
+                host: {'requests': count, 'connections': self.connections.get(host, 0)}
+                for host, count in self.requests.items()
+            }
+        reused = max(total_requests - total_connections, 0)
+        return {
+            'requests': total_requests,
+            'connections_opened': total_connections,
+            'connections_reused': reused,
+            'reuse_rate': reused / total_requests if total_requests else 0.0,
+            'bytes_downloaded': self.bytes_downloaded,
+            'skipped_content_type': self.skipped_content_type,
+            'truncated': self.truncated,
+            'hosts': per_host,
+            'handshakes': self.handshake_summary(),
+        }
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Seconds to wait from a Retry-After header (delta-seconds or HTTP date)"""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    timestamp = UrlFrontier.parse_timestamp(value)
+    return max(timestamp - time.time(), 0.0) if timestamp is not None else None
+
+
+class ConcurrencyController:
+    """AIMD limits on in-flight requests, globally and per host.
+
+    Every request takes a slot before it is sent. Limits grow by one after a
+    window of healthy responses (one success per slot) and are cut
+    multiplicatively on congestion: a host's limit on 429/503 responses or
+    latency well above its baseline, the global limit on timeouts and
+    connection errors (our own bandwidth or CPU saturating). A Retry-After
+    header pauses that host for the requested time.
+
+    Each host's recent request times are also kept: a host whose p95 exceeds
+    slow_host_seconds (or that runs past deadlines) is held to one slot until
+    its p95 drops below half of that, so slow hosts can't tie up the workers.
+    """
+
+    THROTTLE_STATUSES = (429, 503)
+    MAX_RETRY_AFTER = 300
+    TAIL_WINDOW = 50
+    TAIL_MIN_SAMPLES = 10
+
+    def __init__(self, initial: int = 10, min_limit: int = 1, max_limit: int = 32, host_initial: int = 2,
+                 host_max: int = 4, latency_tolerance: float = 2.5, enabled: bool = True, slow_host_seconds: float = 10):
+        self.enabled = enabled
+        self.slow_host_seconds = slow_host_seconds
+        self.limit = min(max(initial, min_limit), max_limit)
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.host_initial = min(host_initial, host_max)
+        self.host_max = host_max
+        self.latency_tolerance = latency_tolerance
+        self.in_flight = 0
+        self.successes = 0
+        self.last_decrease = 0.0
+        self.hosts: Dict[str, Dict] = {}
+        self.condition = threading.Condition()
+        self.logger = logging.getLogger(__name__)
+        self.counters = Counter()
+        self.peak_limit = self.limit
+
+    def host_state(self, host: str) -> Dict:
+        state = self.hosts.get(host)
+        if state is None:
+            state = self.hosts[host] = {
+                'limit': self.host_initial, 'in_flight': 0, 'successes': 0, 'latency': None,
+                'baseline': None, 'samples': 0, 'blocked_until': 0.0, 'last_decrease': 0.0,
+                'crawl_delay': 0.0, 'next_start': 0.0, 'durations': deque(maxlen=self.TAIL_WINDOW), 'slow': False,
+            }
+        return state
+
+    def acquire(self, host: str, deadline: float = None) -> float:
+        """Wait for a global and per-host slot; returns the start time to pass to release().
+
+        With a deadline (a time.monotonic() value), gives up once it passes and
+        raises DeadlineExceeded without touching the host's limits.
+        """
+        with self.condition:
+            state = self.host_state(host)
+            while True:
+                now = time.monotonic()
+                if deadline is not None and now >= deadline:
+                    raise DeadlineExceeded(f"Deadline exceeded waiting for a connection slot for {host}")
+                remaining = deadline - now if deadline is not None else float('inf')
+                ready_at = max(state['blocked_until'], state['next_start'])
+                if ready_at > now:
+                    self.condition.wait(min(ready_at - now, remaining))
+                elif not self.enabled:
+                    break
+                elif self.in_flight < self.limit and state['in_flight'] < (1 if state['slow'] else state['limit']):
+                    self.in_flight += 1
+                    state['in_flight'] += 1
+                    break
+                else:
+                    self.condition.wait(min(1.0, remaining))
+            if state['crawl_delay']:
+                state['next_start'] = now + state['crawl_delay']
+            return now
+
+    def set_crawl_delay(self, host: str, delay: float):
+        """Space request starts to a host at least delay seconds apart (robots.txt Crawl-delay)"""
+        with self.condition:
+            self.host_state(host)['crawl_delay'] = delay
+
+    def release(self, host: str, start: float, status: int = None, error: bool = False, retry_after: str = None,
+                timed_out: bool = False):
+        """Free a slot and feed the outcome of the request into the limits"""
+        if not self.enabled:
+            return
+        now = time.monotonic()
+        with self.condition:
+            state = self.host_state(host)
+            self.in_flight -= 1
+            state['in_flight'] -= 1
+            if timed_out:
+                self._observe_duration(host, state, now - start)
+                self._host_congested(host, state, "deadline exceeded", now)
+            elif status in self.THROTTLE_STATUSES:
+                self._host_congested(host, state, f"HTTP {status}", now, retry_after)
+            elif error:
+                self._global_congested("timeout/connection error", now)
+            elif status is not None and status < 500:
+                self._observe_duration(host, state, now - start)
+                self._observe_latency(host, state, now - start, now)
+            self.condition.notify_all()
+
+    def _observe_duration(self, host: str, state: Dict, duration: float):
+        """Track the host's tail latency and hold chronically slow hosts to one slot"""
+        state['durations'].append(duration)
+        if len(state['durations']) < self.TAIL_MIN_SAMPLES:
+            return
+        p95 = percentile(state['durations'], 95)
+        if not state['slow'] and p95 > self.slow_host_seconds:
+            state['slow'] = True
+            self.counters['slow_host_marks'] += 1
+            self.logger.info(f"Concurrency: {host} is slow (p95 {p95:.1f}s), limited to 1 slot")
+        elif state['slow'] and p95 < self.slow_host_seconds / 2:
+            state['slow'] = False
+            self.logger.info(f"Concurrency: {host} recovered (p95 {p95:.1f}s), limit {state['limit']}")
+
+    def _observe_latency(self, host: str, state: Dict, latency: float, now: float):
+        state['samples'] += 1
+        state['latency'] = latency if state['latency'] is None else 0.2 * latency + 0.8 * state['latency']
+        if state['baseline'] is None or state['latency'] < state['baseline']:
+            state['baseline'] = state['latency']
+        else:
+            # Let the baseline follow slow drifts so one lucky sample doesn't pin it forever
+            state['baseline'] += 0.01 * (state['latency'] - state['baseline'])
+
+        if state['samples'] >= 5 and state['latency'] > state['baseline'] * self.latency_tolerance:
+            self._host_congested(host, state, f"latency {state['latency']:.2f}s vs baseline {state['baseline']:.2f}s", now)
+            return
+
+        state['successes'] += 1
+        if state['successes'] >= state['limit'] and state['limit'] < self.host_max:
+            state['limit'] += 1
+            state['successes'] = 0
+            self.counters['host_increases'] += 1
+            self.logger.debug(f"Concurrency: {host} limit raised to {state['limit']}")
+
+        self.successes += 1
+        if self.successes >= self.limit and self.limit < self.max_limit:
+            self.limit += 1
+            self.successes = 0
+            self.peak_limit = max(self.peak_limit, self.limit)
+            self.counters['global_increases'] += 1
+            self.logger.debug(f"Concurrency: global limit raised to {self.limit}")
+
+    def _host_congested(self, host: str, state: Dict, reason: str, now: float, retry_after: str = None):
+        self.counters['throttled'] += 1
+        delay = parse_retry_after(retry_after)
+        if delay:
+            delay = min(delay, self.MAX_RETRY_AFTER)
+            state['blocked_until'] = max(state['blocked_until'], now + delay)
+            self.counters['retry_after_pauses'] += 1
+            self.logger.info(f"Concurrency: pausing {host} for {delay:.0f}s (Retry-After)")
+        # At most one cut per latency period, so a burst of errors counts as one signal
+        if now - state['last_decrease'] < max(state['latency'] or 0, 1.0):
+            return
+        state['last_decrease'] = now
+        state['successes'] = 0
+        old = state['limit']
+        state['limit'] = max(1, old // 2)
+        if state['limit'] != old:
+            self.counters['host_decreases'] += 1
+            self.logger.info(f"Concurrency: {host} limit {old} -> {state['limit']} ({reason})")
+
+    def _global_congested(self, reason: str, now: float):
+        self.counters['errors'] += 1
+        if now - self.last_decrease < 1.0:
+            return
+        self.last_decrease = now
+        self.successes = 0
+        old = self.limit
+        self.limit = max(self.min_limit, int(old * 0.75))
+        if self.limit != old:
+            self.counters['global_decreases'] += 1
+            self.logger.info(f"Concurrency: global limit {old} -> {self.limit} ({reason})")
+
+    def summary(self) -> Dict:
+        """Current and peak limits plus decision counters"""
+        with self.condition:
+            return {
+                'enabled': self.enabled,
+                'global_limit': self.limit,
+                'peak_global_limit': self.peak_limit,
+                'host_limits': {host: state['limit'] for host, state in self.hosts.items()},
+                'host_p95': {host: percentile(state['durations'], 95) for host, state in self.hosts.items() if state['durations']},
+                'slow_hosts': [host for host, state in self.hosts.items() if state['slow']],
+                **{key: self.counters[key] for key in ('global_increases', 'global_decreases', 'host_increases',
+                                                       'host_decreases', 'throttled', 'retry_after_pauses', 'errors', 'slow_host_marks')},
+            }
+
+
+class DnsCache:
+    """In-process cache of host name lookups.
+
+    Entries live for the record's TTL when dnspython is installed, otherwise
+    for default_ttl seconds. Lookups for one host are serialized, so a burst
+    of new connections to a cold host resolves it once.
+    """
+
+    MIN_TTL = 30
+
+    def __init__(self, default_ttl: float = 300):
+        self.default_ttl = default_ttl
+        self.entries: Dict[str, Tuple[str, float]] = {}
+        self.lock = threading.Lock()
+        self.host_locks = defaultdict(threading.Lock)
+        self.hits = 0
+        self.misses = 0
+
+    def lookup(self, host: str) -> Tuple[str, float]:
+        """Resolve a host without the cache; returns (address, ttl)"""
+        if HAS_DNSPYTHON:
+            try:
+                answer = dns.resolver.resolve(host, 'A')
+                return answer[0].to_text(), max(answer.rrset.ttl, self.MIN_TTL)
+            except Exception:
+                pass  # e.g. names only in /etc/hosts: fall back to the system resolver
+        infos = socket.getaddrinfo(host, None, type=socket.SOCK_STREAM)
+        return infos[0][4][0], self.default_ttl
+
+    def resolve(self, host: str) -> str:
+        """Address for a host name, from the cache while its TTL lasts"""
+        try:
+            ipaddress.ip_address(host.strip('[]'))
+            return host.strip('[]')
+        except ValueError:
+            pass
+        with self.host_locks[host]:
+            with self.lock:
+                entry = self.entries.get(host)
+                if entry and entry[1] > time.time():
+                    self.hits += 1
+                    return entry[0]
+                self.misses += 1
+            address, ttl = self.lookup(host)
+            with self.lock:
+                self.entries[host] = (address, time.time() + ttl)
+            return address
+
+    def invalidate(self, host: str):
+        """Forget a host's address (e.g. after connecting to it failed)"""
+        with self.lock:
+            self.entries.pop(host, None)
+
+
+def open_timed_socket(conn, dns_cache: Optional[DnsCache], fallback):
+    """Open a connection's socket through the DNS cache, timing DNS and TCP connect separately"""
+    started = time.perf_counter()
+    host = conn._dns_host
+    if dns_cache is None:
+        sock = fallback()
+        conn._handshake_timing = (0.0, time.perf_counter() - started)
+        return sock
+    try:
+        address = dns_cache.resolve(host)
+    except OSError:
+        # Let urllib3 resolve (and report the failure) itself
+        sock = fallback()
+        conn._handshake_timing = (0.0, time.perf_counter() - started)
+        return sock
+    resolved = time.perf_counter()
+    try:
+        sock = create_connection((address, conn.port), conn.timeout, source_address=conn.source_address,
+                                 socket_options=conn.socket_options)
+    except socket.timeout as e:
+        dns_cache.invalidate(host)
+        raise ConnectTimeoutError(conn, f"Connection to {conn.host} timed out. (connect timeout={conn.timeout})") from e
+    except OSError as e:
+        dns_cache.invalidate(host)
+        raise NewConnectionError(conn, f"Failed to establish a new connection: {e}") from e
+    conn._handshake_timing = (resolved - started, time.perf_counter() - resolved)
+    return sock
+
+
+class PooledHTTPAdapter(HTTPAdapter):
+    """HTTPAdapter whose connection pools report every new connection to TransportStats.
+
+    Connections resolve host names through the DnsCache (if one is given) and
+    record DNS, TCP connect and TLS handshake times per host.
+    """
+
+    def __init__(self, stats: TransportStats, dns_cache: Optional[DnsCache] = None, **kwargs):
+        self.stats = stats
+        self.dns_cache = dns_cache
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        stats = self.stats
+        dns_cache = self.dns_cache
+
+        class TimedHTTPConnection(HTTPConnection):
+            def _new_conn(self):
+                sock = open_timed_socket(self, dns_cache, super()._new_conn)
+                stats.handshake_timed(self.host, *self._handshake_timing)
+                return sock
+
+        class TimedHTTPSConnection(HTTPSConnection):
+            def _new_conn(self):
+                return open_timed_socket(self, dns_cache, super()._new_conn)
+
+            def connect(self):
+                started = time.perf_counter()
+                super().connect()
+                dns_time, connect_time = getattr(self, '_handshake_timing', (0.0, 0.0))
+                tls_time = max(time.perf_counter() - started - dns_time - connect_time, 0.0)
+                stats.handshake_timed(self.host, dns_time, connect_time, tls_time)
+
+        class CountingHTTPConnectionPool(HTTPConnectionPool):
+            ConnectionCls = TimedHTTPConnection
+
+            def _new_conn(self):
+                stats.connection_opened(self.host)
+                return super()._new_conn()
+
+        class CountingHTTPSConnectionPool(HTTPSConnectionPool):
+            ConnectionCls = TimedHTTPSConnection
+
+            def _new_conn(self):
+                stats.connection_opened(self.host)
+                return super()._new_conn()
+
+        self.poolmanager.pool_classes_by_scheme = {
+            'http': CountingHTTPConnectionPool,
+            'https': CountingHTTPSConnectionPool,
+        }
+
+
+def worker_count(config: Dict) -> int:
+    """Threads to start for article processing: the concurrency ceiling when limits are adaptive"""
+    if config.get('adaptive_concurrency', True):
+        return max(config.get('max_concurrency', 32), config.get('max_workers', 10))
+    return config.get('max_workers', 10)
+
+
+class DeadlineWatchdog:
+    """Aborts downloads that are still running when their deadline passes.
+
+    The socket timeout applies to each read, so a server dripping a few bytes
+    at a time can hold a worker indefinitely. One background thread keeps a
+    heap of watched responses and shuts down the socket of any that expires,
+    which wakes the worker blocked reading it.
+    """
+
+    def __init__(self):
+        self.heap: List[Tuple[float, int]] = []
+        self.active: Dict[int, requests.Response] = {}
+        self.counter = 0
+        self.aborted = 0
+        self.condition = threading.Condition()
+        self.thread = None
+
+    def watch(self, deadline: float, response: requests.Response) -> int:
+        """Watch a response until unwatch(); deadline is a time.monotonic() value"""
+        with self.condition:
+            if self.thread is None:
+                self.thread = threading.Thread(target=self._run, name='DeadlineWatchdog', daemon=True)
+                self.thread.start()
+            self.counter += 1
+            self.active[self.counter] = response
+            heapq.heappush(self.heap, (deadline, self.counter))
+            self.condition.notify()
+            return self.counter
+
+    def unwatch(self, token: int) -> bool:
+        """Stop watching; False if the watchdog already aborted the download"""
+        with self.condition:
+            return self.active.pop(token, None) is not None
+
+    def _run(self):
+        with self.condition:
+            while True:
+                while self.heap and self.heap[0][1] not in self.active:
+                    heapq.heappop(self.heap)
+                if not self.heap:
+                    self.condition.wait()
+                    continue
+                deadline, token = self.heap[0]
+                remaining = deadline - time.monotonic()
+                if remaining > 0:
+                    self.condition.wait(remaining)
+                    continue
+                heapq.heappop(self.heap)
+                self.abort(self.active.pop(token))
+
+    def abort(self, response: requests.Response):
+        self.aborted += 1
+        sock = getattr(getattr(response.raw, '_connection', None), 'sock', None)
+        try:
+            if sock is not None:
+                sock.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+
+
+class HttpTransport:
+    """Shared, pooled HTTP transport used by every component that talks to the network.
+
+    One requests.Session with keep-alive connection pools sized to the crawl
+    concurrency, adaptive concurrency limits and compressed transfer encodings.
+    Nothing is retried in here; callers reschedule RetryableFetchError. The
+    crawler, feed parsing, newspaper3k downloads and the alias service all go
+    through it so they share connections.
+    """
+
+    def __init__(self, config: Dict, host_count: int = 10):
+        self.config = config
+        self.stats = TransportStats()
+        self.session = requests.Session()
+        self.local = threading.local()
+        self.watchdog = DeadlineWatchdog()
+
+        self.controller = ConcurrencyController(
+            initial=config.get('max_workers', 10),
+            min_limit=config.get('min_concurrency', 1),
+            max_limit=config.get('max_concurrency', 32),
+            host_initial=config.get('per_host_initial_concurrency', 2),
+            host_max=config.get('per_host_max_concurrency', 4),
+            latency_tolerance=config.get('concurrency_latency_tolerance', 2.5),
+            enabled=config.get('adaptive_concurrency', True),
+            slow_host_seconds=config.get('slow_host_seconds', 10),
+        )
+
+        # No retries (and no backoff sleeps) inside the transport: failed article
+        # fetches raise RetryableFetchError and are rescheduled by a RetryQueue
+        retry_strategy = Retry(0, read=False)
+
+        # One pool per host (site hosts plus CDN/feed hosts), each able to hold a
+        # connection for every worker so none are discarded after use
+        self.dns_cache = DnsCache(config.get('dns_cache_ttl', 300)) if config.get('dns_cache', True) else None
+        adapter = PooledHTTPAdapter(
+            self.stats,
+            dns_cache=self.dns_cache,
+            pool_connections=max(host_count * 2, 10),
+            pool_maxsize=max(worker_count(config), 1),
+            max_retries=retry_strategy,
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+        self.session.headers.update({
+            'User-Agent': config.get('user_agent', 'NewsBot/1.0 (+https://example.com/bot)'),
+            'Accept-Encoding': 'gzip, deflate, br' if HAS_BROTLI else 'gzip, deflate',
+            'Connection': 'keep-alive',
+        })
+
+    @contextmanager
+    def deadline(self, seconds: Optional[float]):
+        """Bound every fetch this thread makes inside the block by one wall-clock deadline (None: no bound)"""
+        previous = getattr(self.local, 'deadline', None)
+        if seconds:
+            until = time.monotonic() + seconds
+            self.local.deadline = min(previous, until) if previous is not None else until
+        try:
+            yield
+        finally:
+            self.local.deadline = previous
+
+    def check_deadline(self, what: str):
+        """Raise DeadlineExceeded if this thread's deadline has passed"""
+        deadline = getattr(self.local, 'deadline', None)
+        if deadline is not None and time.monotonic() >= deadline:
+            raise DeadlineExceeded(f"Deadline exceeded {what}")
+
+    def _send(self, method: str, url: str, host: str, **kwargs) -> requests.Response:
+        """Send a request without taking a concurrency slot"""
+        kwargs.setdefault('timeout', self.config.get('timeout', 30))
+        self.stats.request_sent(host)
+        return self.session.request(method, url, **kwargs)
+
+    def _release(self, host: str, start: float, response: Optional[requests.Response], error: bool,
+                 timed_out: bool = False):
+        """Free a concurrency slot, reporting the request outcome"""
+        self.controller.release(
+            host, start,
+            status=response.status_code if response is not None else None,
+            error=error,
+            retry_after=response.headers.get('Retry-After') if response is not None else None,
+            timed_out=timed_out,
+        )
+
+    def request(self, method: str, url: str, **kwargs) -> requests.Response:
+        """Send a request through the shared session, holding a concurrency slot for its host"""
+        host = urlparse(url).hostname or ''
+        deadline = getattr(self.local, 'deadline', None)
+        start = self.controller.acquire(host, deadline)
+        response = None
+        error = timed_out = False
+        try:
+            if deadline is not None:
+                kwargs['timeout'] = min(kwargs.get('timeout', self.config.get('timeout', 30)), deadline - time.monotonic())
+            response = self._send(method, url, host, **kwargs)
+            return response
+        except (requests.Timeout, requests.ConnectionError) as e:
+            if deadline is not None and time.monotonic() >= deadline:
+                timed_out = True
+                raise DeadlineExceeded(f"Deadline exceeded requesting {url}", host_fault=True) from e
+            error = True
+            raise
+        finally:
+            self._release(host, start, response, error, timed_out)
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        return self.request('GET', url, **kwargs)
+
+    def head(self, url: str, **kwargs) -> requests.Response:
+        kwargs.setdefault('allow_redirects', False)
+        return self.request('HEAD', url, **kwargs)
+
+    def fetch(self, url: str, max_bytes: int = None, allowed_types: Tuple[str, ...] = PAGE_CONTENT_TYPES,
+              breaker: 'CircuitBreaker' = None, **kwargs) -> requests.Response:
+        """Streamed GET that aborts early on unwanted content.
+
+        The response is dropped as soon as its Content-Type shows it is not one of
+        allowed_types (PDFs, video, images...), and reading stops once max_bytes of
+        body have been received. The returned response has its (possibly truncated)
+        body loaded, so .content/.text work as usual; response.truncated tells
+        whether the cap was hit. With a circuit breaker, the host's circuit is
+        checked once a concurrency slot is held, and CircuitOpenError is raised
+        instead of sending when it is open. Inside a deadline() block the whole
+        fetch, including a slow body, is bounded by the deadline and raises
+        DeadlineExceeded when it runs out.
+        """
+        host = urlparse(url).hostname or ''
+        deadline = getattr(self.local, 'deadline', None)
+        start = self.controller.acquire(host, deadline)
+        response = None
+        error = timed_out = False
+        try:
+            wait_seconds = breaker.allow(host) if breaker else 0
+            if wait_seconds:
+                raise CircuitOpenError(f"Circuit open for {host}", retry_after=wait_seconds)
+            if deadline is not None:
+                kwargs['timeout'] = min(kwargs.get('timeout', self.config.get('timeout', 30)), deadline - time.monotonic())
+            response = self._send('GET', url, host, stream=True, **kwargs)
+            if response.status_code in RETRY_STATUSES:
+                response.close()
+                raise RetryableFetchError(f"HTTP {response.status_code} for {url}",
+                                          retry_after=parse_retry_after(response.headers.get('Retry-After')))
+            return self._read_body(url, response, max_bytes, allowed_types, deadline)
+        except DeadlineExceeded:
+            # Only raised by _read_body, once the request was sent
+            timed_out = True
+            raise
+        except (requests.Timeout, requests.ConnectionError) as e:
+            if deadline is not None and time.monotonic() >= deadline:
+                timed_out = True
+                raise DeadlineExceeded(f"Deadline exceeded fetching {url}", host_fault=True) from e
+            error = True
+            raise RetryableFetchError(f"{type(e).__name__} for {url}: {e}") from e
+        finally:
+            self._release(host, start, response, error, timed_out)
+
+    def _read_body(self, url: str, response: requests.Response, max_bytes: int,
+                   allowed_types: Tuple[str, ...], deadline: Optional[float] = None) -> requests.Response:
+        """Check the content type and read the body of a streamed response up to max_bytes (and the deadline)"""
+        content_type = response.headers.get('Content-Type', '').split(';')[0].strip().lower()
+        if content_type and allowed_types and not any(t in content_type for t in allowed_types):
+            response.close()
+            self.stats.download_skipped()
+            raise ResponseSkipped(f"Skipped {url}: content type '{content_type}'")
+
+        chunks = []
+        size = 0
+        truncated = False
+        token = self.watchdog.watch(deadline, response) if deadline is not None else None
+        out_of_time = False
+        try:
+            for chunk in response.iter_content(chunk_size=65536):
+                chunks.append(chunk)
+                size += len(chunk)
+                if max_bytes and size >= max_bytes:
+                    truncated = True
+                    break
+                if deadline is not None and time.monotonic() >= deadline:
+                    out_of_time = True
+                    break
+        except requests.RequestException as e:
+            if deadline is not None and time.monotonic() >= deadline:
+                raise DeadlineExceeded(f"Deadline exceeded downloading {url} ({size} bytes received)", host_fault=True) from e
+            raise
+        finally:
+            # A download the watchdog shut down may end without an error, with a partial body
+            if token is not None and not self.watchdog.unwatch(token):
+                out_of_time = True
+            response.close()
+        if out_of_time:
+            raise DeadlineExceeded(f"Deadline exceeded downloading {url} ({size} bytes received)", host_fault=True)
+
+        body = b''.join(chunks)
+        if truncated:
+            body = body[:max_bytes]
+        response._content = body
+        response._content_consumed = True
+        response.truncated = truncated
+        self.stats.download_finished(len(body), truncated)
+        return response
+
+    def prewarm(self, urls: List[str], max_workers: int = 32) -> Tuple[int, int]:
+        """Resolve hosts and open one pooled connection per origin, concurrently; returns (warmed, failed)"""
+        origins = list(dict.fromkeys(f"{urlparse(url).scheme}://{urlparse(url).netloc}" for url in urls if urlparse(url).netloc))
+
+        def warm(origin: str) -> bool:
+            try:
+                adapter = self.session.get_adapter(origin)
+                if hasattr(adapter, 'get_connection_with_tls_context'):
+                    # Same pool key (incl. TLS settings) that real requests will use
+                    request = requests.Request('GET', origin + '/').prepare()
+                    settings = self.session.merge_environment_settings(request.url, {}, None, None, None)
+                    pool = adapter.get_connection_with_tls_context(request, settings['verify'], settings['proxies'], settings['cert'])
+                else:
+                    pool = adapter.get_connection(origin)
+                conn = pool._get_conn()
+                try:
+                    if getattr(conn, 'sock', None) is None:
+                        conn.timeout = self.config.get('timeout', 30)
+                        conn.connect()
+                        self._drain_handshake(conn.sock)
+                except Exception:
+                    conn.close()
+                    raise
+                finally:
+                    pool._put_conn(conn)
+                return True
+            except Exception:
+                return False
+
+        if not origins:
+            return 0, 0
+        with ThreadPoolExecutor(max_workers=min(len(origins), max_workers)) as executor:
+            results = list(executor.map(warm, origins))
+        return sum(results), len(results) - sum(results)
+
+    @staticmethod
+    def _drain_handshake(sock, wait: float = 0.3):
+        """Let a fresh TLS socket process post-handshake messages (TLS 1.3 session tickets).
+
+        Otherwise the unread tickets make the idle connection look readable, and
+        urllib3 would discard it as dropped before its first request.
+        """
+        if not hasattr(sock, 'pending'):
+            return
+        timeout = sock.gettimeout()
+        try:
+            sock.settimeout(wait)
+            sock.recv(1)
+        except OSError:
+            pass
+        finally:
+            sock.settimeout(timeout)
+
+    def get_stats(self) -> Dict:
+        """Connection reuse, download and concurrency statistics"""
+        return dict(self.stats.summary(), concurrency=self.controller.summary())
+
+
+COMPANY_ALIAS_DATASET = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data', 'company_aliases.json')
+
+
+class CompanyAliasIndex:
+    """Bundled, versioned dataset of company names, tickers, former names, brands and domains.
+
+    Every term of every company is a key in one dict after normalizing
+    (lowercase, punctuation and corporate suffixes removed), so resolving a
+    watchlist entry takes a few dict lookups and no network access. When two
+    companies share a term, the first one in the file owns it. Tickers shorter
+    than MIN_TICKER_ALIAS characters, and a record's 'ambiguous' terms, can be
+    looked up but are not used as match aliases.
+    """
+
+    MIN_TICKER_ALIAS = 4
+    MIN_ALIAS = 3
+    SUFFIXES = {'inc', 'incorporated', 'corp', 'corporation', 'co', 'company', 'ltd', 'limited', 'llc',
+                'plc', 'p.l.c', 'group', 'holdings', 'holding', 'sa', 's.a', 'ag', 'nv', 'n.v', 'se', 'and'}
+
+    def __init__(self, path: str = COMPANY_ALIAS_DATASET):
+        self.path = path
+        self.version = None
+        self.companies: List[Dict] = []
+        self.index: Dict[str, int] = {}
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            self.version = data.get('version')
+            self.companies = data.get('companies', [])
+        except Exception as e:
+            print(f"Warning: Could not load company alias dataset {path}: {e}")
+        for position, company in enumerate(self.companies):
+            for term in chain([company['name']], company.get('tickers', []), company.get('former_names', []),
+                              company.get('brands', []), company.get('domains', [])):
+                self.index.setdefault(self.normalize(term), position)
+
+    @classmethod
+    def normalize(cls, name: str) -> str:
+        """Lookup key of a name: 'The Coca-Cola Company' -> 'coca cola', 'Amazon.com, Inc.' -> 'amazon.com'"""
+        words = [word.strip('.') for word in re.sub(r"[^\w.]+", ' ', name.lower().replace('&', ' and ')).split()]
+        words = [word for word in words if word]
+        if len(words) > 1 and words[0] == 'the':
+            words = words[1:]
+        while len(words) > 1 and words[-1] in cls.SUFFIXES:
+            words = words[:-1]
+        return ' '.join(words)
+
+    def lookup(self, company_entry: str) -> Optional[Dict]:
+        """The dataset record for a watchlist entry such as 'Apple', 'MSFT' or 'Alphabet (Google)', or None"""
+        entry = company_entry.split('#')[0].strip()
+        candidates = [entry]
+        if '(' in entry and ')' in entry:
+            candidates += [entry.split('(')[0], entry.split('(')[1].split(')')[0]]
+        for candidate in candidates:
+            position = self.index.get(self.normalize(candidate))
+            if position is not None:
+                return self.companies[position]
+        return None
+
+    def aliases(self, company: Dict) -> List[str]:
+        """Lowercase match aliases of a dataset record"""
+        ambiguous = {term.lower() for term in company.get('ambiguous', [])}
+        names = [company['name'], *company.get('former_names', [])]
+        terms = chain(names, (self.normalize(name) for name in names), company.get('brands', []), company.get('domains', []),
+                      (ticker for ticker in company.get('tickers', []) if len(ticker) >= self.MIN_TICKER_ALIAS))
+        aliases = (term.strip().lower() for term in terms)
+        return list(dict.fromkeys(alias for alias in aliases if len(alias) >= self.MIN_ALIAS and alias not in ambiguous))
+
+    def __len__(self) -> int:
+        return len(self.companies)
+
+
 class OnlineCompanyAliasService:
-    """Service to fetch company aliases and related information from online APIs"""
+    """Service to fetch company aliases and related information from online APIs.
+
+    Companies found in the bundled alias dataset are resolved from it without
+    any API call; only the others go to the online sources.
+    """
     
-    def __init__(self, cache_file: str = "output/company_aliases_cache.json", config: Dict = None):
+    def __init__(self, cache_file: str = "output/company_aliases_cache.json", config: Dict = None,
+                 transport: 'HttpTransport' = None, alias_index: CompanyAliasIndex = None):
         self.cache_file = cache_file
         self.cache = self.load_cache()
         self.config = config or {}
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'NewsBot/1.0 (+https://example.com/bot)'
-        })
+        self.transport = transport or HttpTransport(self.config)
+        self.session = self.transport.session
+        self.alias_index = alias_index or CompanyAliasIndex(self.config.get('company_alias_dataset') or COMPANY_ALIAS_DATASET)
     
     def load_cache(self) -> Dict:
         """Load cached company aliases"""
@@ -159,7 +1488,7 @@ class OnlineCompanyAliasService:
             # Alpha Vantage Symbol Search API
             url = f"https://www.alphavantage.co/query?function=SYMBOL_SEARCH&keywords={urlencode({'keywords': search_name})}&apikey={api_key}"
             
-            response = self.session.get(url, timeout=10)
+            response = self.transport.get(url, timeout=10)
             if response.status_code == 200:
                 data = response.json()
                 if 'bestMatches' in data:
@@ -183,7 +1512,7 @@ class OnlineCompanyAliasService:
             # Financial Modeling Prep Company Search (free tier)
             url = f"https://financialmodelingprep.com/api/v3/search?query={urlencode({'query': search_name})}&limit=5&apikey=demo"
             
-            response = self.session.get(url, timeout=10)
+            response = self.transport.get(url, timeout=10)
             if response.status_code == 200:
                 data = response.json()
                 if isinstance(data, list):
@@ -207,7 +1536,7 @@ class OnlineCompanyAliasService:
             # Clearbit Name to Domain API (free tier)
             url = f"https://company.clearbit.com/v1/domains/find?name={urlencode({'name': search_name})}"
             
-            response = self.session.get(url, timeout=10)
+            response = self.transport.get(url, timeout=10)
             if response.status_code == 200:
                 data = response.json()
                 if 'domain' in data:
@@ -233,7 +1562,7 @@ class OnlineCompanyAliasService:
             # Wikipedia API search
             search_url = f"https://en.wikipedia.org/api/rest_v1/page/summary/{urlencode({'title': search_name})}"
             
-            response = self.session.get(search_url, timeout=10)
+            response = self.transport.get(search_url, timeout=10)
             if response.status_code == 200:
                 data = response.json()
                 if 'title' in data:
@@ -298,140 +1627,1244 @@ class OnlineCompanyAliasService:
             aliases.add(f"{base_name}.com")
             aliases.add(f"{base_name}.org")
         
-        # Company-specific enhancements
-        if 'google' in company_lower or 'alphabet' in company_lower:
-            aliases.update(['google', 'alphabet', 'google.com', 'goog', 'googl'])
-        elif 'microsoft' in company_lower:
-            aliases.update(['microsoft', 'msft', 'ms', 'microsoft.com'])
-        elif 'apple' in company_lower:
-            aliases.update(['apple', 'aapl', 'apple.com'])
-        elif 'amazon' in company_lower:
-            aliases.update(['amazon', 'amzn', 'amazon.com'])
-        elif 'meta' in company_lower or 'facebook' in company_lower:
-            aliases.update(['meta', 'facebook', 'fb', 'facebook.com', 'meta.com'])
-        elif 'nvidia' in company_lower:
-            aliases.update(['nvidia', 'nvda', 'nvidia.com'])
-        elif 'tesla' in company_lower:
-            aliases.update(['tesla', 'tsla', 'tesla.com'])
-        elif 'netflix' in company_lower:
-            aliases.update(['netflix', 'nflx', 'netflix.com'])
-        elif 'samsung' in company_lower:
-            aliases.update(['samsung', 'samsung.com'])
-        elif 'ibm' in company_lower:
-            aliases.update(['ibm', 'international business machines', 'ibm.com'])
-        elif 'oracle' in company_lower:
-            aliases.update(['oracle', 'orcl', 'oracle.com'])
-        elif 'cisco' in company_lower:
-            aliases.update(['cisco', 'csco', 'cisco.com'])
-        elif 'amd' in company_lower:
-            aliases.update(['amd', 'advanced micro devices', 'amd.com'])
-        elif 'salesforce' in company_lower:
-            aliases.update(['salesforce', 'crm', 'salesforce.com'])
-        elif 'uber' in company_lower:
-            aliases.update(['uber', 'uber.com'])
-        elif 'spotify' in company_lower:
-            aliases.update(['spotify', 'spot', 'spotify.com'])
-        elif 'adobe' in company_lower:
-            aliases.update(['adobe', 'adbe', 'adobe.com'])
-        elif 'sony' in company_lower:
-            aliases.update(['sony', 'sony.com'])
-        elif 'qualcomm' in company_lower:
-            aliases.update(['qualcomm', 'qcom', 'qualcomm.com'])
+        # Names, tickers, brands and domains from the bundled dataset
+        company = self.alias_index.lookup(company_name)
+        if company:
+            aliases.update(self.alias_index.aliases(company))
         
         return list(aliases)
     
     def get_company_aliases(self, company_name: str, use_cache: bool = True) -> List[str]:
-        """Get company aliases from multiple online sources"""
+        """Get company aliases from the bundled dataset, or else from multiple online sources"""
         cache_key = self.get_cache_key(company_name)
+        known = self.alias_index.lookup(company_name) is not None
         
         # Check cache first
-        if use_cache and cache_key in self.cache:
+        if use_cache and not known and cache_key in self.cache:
             return self.cache[cache_key]
         
         aliases = set()
         
-        # Try online sources first
+        # Companies in the bundled dataset resolve offline; only the others go to the online APIs
         online_success = False
+        if not known:
+            try:
+                # Alpha Vantage (financial data)
+                alpha_aliases = self.fetch_alpha_vantage_aliases(company_name)
+                if alpha_aliases:
+                    aliases.update(alpha_aliases)
+                    online_success = True
+            
+                # Financial Modeling Prep
+                fmp_aliases = self.fetch_financial_modeling_aliases(company_name)
+                if fmp_aliases:
+                    aliases.update(fmp_aliases)
+                    online_success = True
+            
+                # Clearbit domain
+                clearbit_aliases = self.fetch_clearbit_domain(company_name)
+                if clearbit_aliases:
+                    aliases.update(clearbit_aliases)
+                    online_success = True
+            
+                # Wikipedia
+                wiki_aliases = self.fetch_wikipedia_aliases(company_name)
+                if wiki_aliases:
+                    aliases.update(wiki_aliases)
+                    online_success = True
+                
+            except Exception as e:
+                print(f"Online API error for {company_name}: {e}")
+        
+        # If online sources didn't provide good results, use enhanced local parsing
+        if known or not online_success or len(aliases) < 3:
+            enhanced_local = self.get_enhanced_local_aliases(company_name)
+            aliases.update(enhanced_local)
+        
+        # Add original company name
+        aliases.add(company_name.lower())
+        
+        # Clean and deduplicate
+        clean_aliases = []
+        for alias in aliases:
+            if alias and len(alias.strip()) > 1:
+                clean_alias = alias.strip().lower()
+                if clean_alias not in clean_aliases:
+                    clean_aliases.append(clean_alias)
+        
+        # Cache the results (dataset companies are resolved again each run, in well under a millisecond)
+        if not known:
+            self.cache[cache_key] = clean_aliases
+            self.save_cache()
+        
+        return clean_aliases
+
+# Optional imports
+try:
+    from newspaper import Article
+    HAS_NEWSPAPER = True
+except ImportError:
+    HAS_NEWSPAPER = False
+
+
+@dataclass
+class CrawlResult:
+    """Data class to store crawl results"""
+    url: str
+    title: str = ""
+    content: str = ""
+    metadata: Dict = field(default_factory=dict)
+    found_companies: Set[str] = field(default_factory=set)
+    found_keywords: Set[str] = field(default_factory=set)
+    article_date: Optional[str] = None
+    crawl_timestamp: str = field(default_factory=lambda: datetime.now().isoformat())
+    error: Optional[str] = None
+    final_url: Optional[str] = None
+    canonical_url: Optional[str] = None
+    watchlists: Dict[str, Tuple[Set[str], Set[str]]] = field(default_factory=dict)  # name -> (companies, keywords)
+    status_code: Optional[int] = None
+
+
+class Watchlist:
+    """A named set of companies (with their aliases) and keywords, with its own matching options and output targets"""
+
+    def __init__(self, name: str, company_aliases: Dict[str, List[str]], keywords: List[str], case_sensitive: bool = False,
+                 output_formats: List[str] = ('json', 'csv'), output_dir: str = 'output',
+                 results_db_path: str = 'output/news_results.db', companies_file: str = None, keywords_file: str = None):
+        self.name = name
+        self.company_aliases = company_aliases
+        self.keywords = keywords
+        self.case_sensitive = case_sensitive
+        self.output_formats = list(output_formats)
+        self.output_dir = output_dir
+        self.results_db_path = results_db_path
+        self.companies_file = companies_file
+        self.keywords_file = keywords_file
+
+
+class WatchlistMatcher:
+    """Matches an article against every watchlist in one pass.
+
+    Each distinct alias and keyword is searched for once, however many
+    watchlists contain it; hits are routed to the watchlists (and companies)
+    that own the term. As before, keywords only count for a watchlist when one
+    of its companies was found. Company aliases are matched case-insensitively
+    in title, content, URL and meta tags; keywords in title, content and URL,
+    with case only mattering for case_sensitive watchlists.
+    """
+
+    def __init__(self, watchlists: List[Watchlist]):
+        self.company_terms: Dict[str, List[Tuple[str, str]]] = defaultdict(list)
+        self.keyword_terms: Dict[Tuple[str, bool], List[Tuple[str, str]]] = defaultdict(list)
+        for watchlist in watchlists:
+            for company, aliases in watchlist.company_aliases.items():
+                for alias in set(alias.lower() for alias in aliases):
+                    self.company_terms[alias].append((watchlist.name, company))
+            for keyword in watchlist.keywords:
+                term = keyword if watchlist.case_sensitive else keyword.lower()
+                self.keyword_terms[(term, watchlist.case_sensitive)].append((watchlist.name, term))
+
+    def match(self, result: CrawlResult) -> Dict[str, Tuple[Set[str], Set[str]]]:
+        """Return {watchlist name: (companies, keywords)} for the watchlists with at least one company found"""
+        # Include URL in search text for better detection
+        text = f"{result.title} {result.content} {result.url or ''}"
+        search_text = text.lower()
+        meta_text = " ".join(str(v) for v in result.metadata.values()).lower()
+        
+        companies: Dict[str, Set[str]] = defaultdict(set)
+        for term, owners in self.company_terms.items():
+            if term in search_text or term in meta_text:
+                for name, company in owners:
+                    companies[name].add(company)
+        
+        keywords: Dict[str, Set[str]] = defaultdict(set)
+        for (term, case_sensitive), owners in self.keyword_terms.items():
+            owners = [(name, keyword) for name, keyword in owners if name in companies]
+            if owners and term in (text if case_sensitive else search_text):
+                for name, keyword in owners:
+                    keywords[name].add(keyword)
+        
+        return {name: (found, keywords.get(name, set())) for name, found in companies.items()}
+
+
+class StoredResult:
+    """Compact, read-only form of a matched CrawlResult kept until results are saved.
+
+    Only the exported fields are kept: metadata is dropped, company/keyword
+    names are interned tuples, and content is cut to the exported snippet
+    (or zlib-compressed when the full text is kept).
+    """
+
+    __slots__ = ('url', 'title', '_content', 'found_companies', 'found_keywords',
+                 'article_date', 'crawl_timestamp', 'error', 'watchlist')
+
+    def __init__(self, url: str, title: str = "", content=b"", found_companies=(), found_keywords=(),
+                 article_date: Optional[str] = None, crawl_timestamp: str = "", error: Optional[str] = None,
+                 watchlist: str = 'default'):
+        self.url = url
+        self.title = title
+        self._content = content
+        self.found_companies = tuple(sys.intern(c) for c in found_companies)
+        self.found_keywords = tuple(sys.intern(k) for k in found_keywords)
+        self.article_date = article_date
+        self.crawl_timestamp = crawl_timestamp
+        self.error = error
+        self.watchlist = sys.intern(watchlist)
+
+    @classmethod
+    def from_crawl_result(cls, result: CrawlResult, content_chars: int = 500, watchlist: str = 'default') -> 'StoredResult':
+        """Build a compact copy with one watchlist's matches; content_chars=0 keeps the full content compressed"""
+        companies, keywords = result.watchlists.get(watchlist, (result.found_companies, result.found_keywords))
+        if content_chars:
+            content = result.content[:content_chars] + '...' if len(result.content) > content_chars else result.content
+        else:
+            content = zlib.compress(result.content.encode('utf-8'))
+        return cls(result.url, result.title, content, sorted(companies), sorted(keywords),
+                   result.article_date, result.crawl_timestamp, result.error, watchlist)
+
+    @property
+    def content(self) -> str:
+        if isinstance(self._content, bytes):
+            return zlib.decompress(self._content).decode('utf-8') if self._content else ""
+        return self._content
+
+    def to_dict(self) -> Dict:
+        return {
+            'url': self.url,
+            'title': self.title,
+            'content': self.content,
+            'found_companies': list(self.found_companies),
+            'found_keywords': list(self.found_keywords),
+            'article_date': self.article_date,
+            'crawl_timestamp': self.crawl_timestamp,
+            'error': self.error,
+            'watchlist': self.watchlist
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'StoredResult':
+        return cls(data['url'], data['title'], data['content'], data['found_companies'], data['found_keywords'],
+                   data['article_date'], data['crawl_timestamp'], data['error'], data.get('watchlist', 'default'))
+
+
+class ResultStore:
+    """Append-only store of StoredResult objects, in memory or spilled to disk.
+
+    With spill_to_disk, every result is written as a JSON line to an anonymous
+    temporary file under output/ and only a counter stays in memory, so memory
+    use no longer grows with the number of matches.
+    """
+
+    def __init__(self, spill_to_disk: bool = False, spill_dir: str = 'output'):
+        self.lock = threading.Lock()
+        self.count = 0
+        self.items: List[StoredResult] = []
+        self.spill_file = None
+        if spill_to_disk:
+            os.makedirs(spill_dir, exist_ok=True)
+            self.spill_file = tempfile.TemporaryFile(mode='w+b', dir=spill_dir, prefix='results_spool_')
+
+    def append(self, result: StoredResult):
+        with self.lock:
+            if self.spill_file:
+                self.spill_file.seek(0, os.SEEK_END)
+                self.spill_file.write(json.dumps(result.to_dict(), ensure_ascii=False).encode('utf-8') + b'\n')
+            else:
+                self.items.append(result)
+            self.count += 1
+
+    def __len__(self):
+        return self.count
+
+    def __iter__(self):
+        if not self.spill_file:
+            with self.lock:
+                items = list(self.items)
+            yield from items
+            return
+
+        position = 0
+        while True:
+            with self.lock:
+                self.spill_file.flush()
+                self.spill_file.seek(position)
+                line = self.spill_file.readline()
+                position = self.spill_file.tell()
+            if not line:
+                break
+            yield StoredResult.from_dict(json.loads(line))
+
+    def select(self, watchlist: str) -> 'ResultStoreView':
+        """Results of one watchlist, read from the store again on every pass"""
+        return ResultStoreView(self, watchlist)
+
+    def close(self):
+        """Delete the spill file (if any)"""
+        if self.spill_file:
+            self.spill_file.close()
+            self.spill_file = None
+
+
+class ResultStoreView:
+    """Re-iterable filter over a ResultStore that never materializes the selected results"""
+
+    def __init__(self, store: ResultStore, watchlist: str):
+        self.store = store
+        self.watchlist = watchlist
+
+    def __iter__(self):
+        return (result for result in self.store if result.watchlist == self.watchlist)
+
+
+class UrlFingerprintSet:
+    """Compact, thread-safe set of seen URLs for very large crawls.
+
+    URLs are stored as 64-bit BLAKE2b fingerprints instead of strings. Each of
+    the lock stripes keeps a sorted array('Q') plus a small pending set that is
+    merged into the array once it grows past 1/8 of it, giving roughly 9-16
+    bytes per URL. With 64-bit fingerprints the chance of any false "seen" at
+    10M URLs is about 3 in a million.
+    """
+
+    def __init__(self, stripes: int = 16):
+        self.stripe_count = stripes
+        self.locks = [threading.Lock() for _ in range(stripes)]
+        self.sorted_parts = [array('Q') for _ in range(stripes)]
+        self.pending_parts: List[Set[int]] = [set() for _ in range(stripes)]
+
+    @staticmethod
+    def fingerprint(url: str) -> int:
+        return int.from_bytes(hashlib.blake2b(url.encode('utf-8'), digest_size=8).digest(), 'little')
+
+    def _contains(self, stripe: int, fp: int) -> bool:
+        if fp in self.pending_parts[stripe]:
+            return True
+        part = self.sorted_parts[stripe]
+        i = bisect.bisect_left(part, fp)
+        return i < len(part) and part[i] == fp
+
+    def add(self, url: str) -> bool:
+        """Add a URL; returns False if it was already present"""
+        fp = self.fingerprint(url)
+        stripe = fp % self.stripe_count
+        with self.locks[stripe]:
+            if self._contains(stripe, fp):
+                return False
+            pending = self.pending_parts[stripe]
+            pending.add(fp)
+            if len(pending) > max(1024, len(self.sorted_parts[stripe]) >> 3):
+                # Timsort merges the two sorted runs in linear time
+                self.sorted_parts[stripe] = array('Q', sorted(chain(self.sorted_parts[stripe], pending)))
+                pending.clear()
+            return True
+
+    def __contains__(self, url: str) -> bool:
+        fp = self.fingerprint(url)
+        stripe = fp % self.stripe_count
+        with self.locks[stripe]:
+            return self._contains(stripe, fp)
+
+    def __len__(self):
+        return sum(len(part) for part in self.sorted_parts) + sum(len(part) for part in self.pending_parts)
+
+    def memory_bytes(self) -> int:
+        """Approximate memory used by the stored fingerprints"""
+        return (sum(part.buffer_info()[1] * part.itemsize for part in self.sorted_parts)
+                + sum(sys.getsizeof(part) + len(part) * 32 for part in self.pending_parts))
+
+
+class UrlCanonicalizer:
+    """Normalizes article URLs for deduplication and remembers redirect targets.
+
+    canonicalize() maps the many spellings of one article (tracking parameters,
+    fragments, trailing slashes, http/https, AMP variants) to a single key.
+    Redirects (e.g. feed-proxy links) and rel=canonical targets seen after a
+    fetch are kept in a persistent map, so later runs fetch the real article
+    URL directly and recognise it as already seen.
+    """
+
+    TRACKING_PARAMS = {
+        'fbclid', 'gclid', 'dclid', 'msclkid', 'mc_cid', 'mc_eid', 'igshid', 'yclid', '_ga', '_gl',
+        'ref', 'ref_src', 'referrer', 'cmpid', 'ocid', 'icid', 'ncid', 'sr_share', 'smid', 'soc_src',
+        'soc_trk', 'taid', 'ito', 'guccounter', 'guce_referrer', 'guce_referrer_sig', 'amp', 'outputtype',
+    }
+    TRACKING_PREFIXES = ('utm_', 'pk_', 'mtm_', 'at_', 'ns_', 'hsa_', 'vero_')
+    MAX_REDIRECTS = 200000
+
+    def __init__(self, cache_file: str = "output/url_redirects_cache.json"):
+        self.cache_file = cache_file
+        self.lock = threading.Lock()
+        self.redirects: Dict[str, str] = self.load_cache()
+        self.dirty = False
+
+    def load_cache(self) -> Dict:
+        """Load the persistent redirect map"""
+        if os.path.exists(self.cache_file):
+            try:
+                with open(self.cache_file, 'r', encoding='utf-8') as f:
+                    return json.load(f)
+            except Exception:
+                return {}
+        return {}
+
+    def save_cache(self):
+        """Save the redirect map, keeping only the most recent entries"""
+        with self.lock:
+            if not self.dirty:
+                return
+            if len(self.redirects) > self.MAX_REDIRECTS:
+                self.redirects = dict(list(self.redirects.items())[-self.MAX_REDIRECTS:])
+            data = dict(self.redirects)
+            self.dirty = False
+        try:
+            os.makedirs(os.path.dirname(self.cache_file), exist_ok=True)
+            with open(self.cache_file, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False)
+        except Exception as e:
+            print(f"Warning: Could not save redirect cache: {e}")
+
+    def canonicalize(self, url: str) -> str:
+        """Return the deduplication key of a URL"""
+        try:
+            parsed = urlparse(url.strip())
+        except ValueError:
+            return url
+        host = (parsed.hostname or '').lower()
+        for prefix in ('www.', 'amp.', 'm.'):
+            if host.startswith(prefix):
+                host = host[len(prefix):]
+                break
+        if parsed.port and parsed.port not in (80, 443):
+            host = f"{host}:{parsed.port}"
+
+        path = re.sub(r'/{2,}', '/', parsed.path or '/')
+        path = re.sub(r'(/amp|\.amp|/amp\.html)/?$', '', path, flags=re.IGNORECASE) or '/'
+        if path.startswith('/amp/'):
+            path = path[4:]
+        if len(path) > 1:
+            path = path.rstrip('/')
+
+        query = sorted(
+            (key, value) for key, value in parse_qsl(parsed.query, keep_blank_values=True)
+            if key.lower() not in self.TRACKING_PARAMS and not key.lower().startswith(self.TRACKING_PREFIXES)
+        )
+        # Scheme is normalized to https: http/https variants are the same article
+        return urlunparse(('https', host, path, '', urlencode(query), ''))
+
+    def resolve(self, url: str) -> str:
+        """Return the known final URL for a URL (e.g. a feed-proxy link), or the URL itself"""
+        with self.lock:
+            return self.redirects.get(self.canonicalize(url), url)
+
+    def learn(self, url: str, final_url: str):
+        """Remember that url leads to final_url"""
+        key = self.canonicalize(url)
+        if not final_url or key == self.canonicalize(final_url):
+            return
+        with self.lock:
+            if self.redirects.get(key) != final_url:
+                self.redirects[key] = final_url
+                self.dirty = True
+
+
+class RobotsCache:
+    """Per-host robots.txt rules with a persistent, TTL'd cache.
+
+    robots.txt is fetched once per scheme+host through the shared transport and
+    kept in output/ until it expires. Per RFC 9309, a 4xx answer allows
+    everything, while a 5xx answer or network error disallows the host until a
+    short retry TTL passes. Crawl-delay is passed to the transport's per-host
+    pacing, and Sitemap: lines are exposed for sitemap discovery.
+    """
+
+    MAX_BYTES = 512000
+    ERROR_TTL = 900
+
+    def __init__(self, transport: 'HttpTransport', config: Dict, cache_file: str = "output/robots_cache.json"):
+        self.transport = transport
+        self.cache_file = cache_file
+        self.ttl = config.get('robots_cache_ttl_hours', 24) * 3600
+        self.max_crawl_delay = config.get('robots_max_crawl_delay', 30)
+        self.user_agent = config.get('user_agent', 'NewsBot').split('/')[0].strip() or '*'
+        self.lock = threading.Lock()
+        self.host_locks = defaultdict(threading.Lock)
+        self.entries = self.load_cache()
+        self.parsers: Dict[str, RobotFileParser] = {}
+        self.dirty = False
+
+    def load_cache(self) -> Dict:
+        """Load cached robots.txt bodies"""
+        if os.path.exists(self.cache_file):
+            try:
+                with open(self.cache_file, 'r', encoding='utf-8') as f:
+                    return json.load(f)
+            except Exception:
+                return {}
+        return {}
+
+    def save_cache(self):
+        """Save unexpired robots.txt bodies"""
+        now = time.time()
+        with self.lock:
+            if not self.dirty:
+                return
+            data = {origin: entry for origin, entry in self.entries.items() if entry['expires'] > now}
+            self.dirty = False
+        try:
+            os.makedirs(os.path.dirname(self.cache_file), exist_ok=True)
+            with open(self.cache_file, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False)
+        except Exception as e:
+            print(f"Warning: Could not save robots.txt cache: {e}")
+
+    def origin(self, url: str) -> str:
+        parsed = urlparse(url)
+        return f"{parsed.scheme or 'https'}://{parsed.netloc.lower()}"
+
+    def fetch(self, origin: str) -> Dict:
+        """Download robots.txt for an origin and turn the answer into a cache entry"""
+        now = time.time()
+        try:
+            response = self.transport.fetch(f"{origin}/robots.txt", max_bytes=self.MAX_BYTES, allowed_types=('text/',),
+                                            timeout=15)
+            if response.status_code >= 500:
+                return {'rules': 'disallow', 'body': '', 'expires': now + self.ERROR_TTL}
+            if response.status_code >= 400:
+                return {'rules': 'allow', 'body': '', 'expires': now + self.ttl}
+            return {'rules': 'parse', 'body': response.text, 'expires': now + self.ttl}
+        except ResponseSkipped:
+            # Not a text file (e.g. an HTML error page): treat as no robots.txt
+            return {'rules': 'allow', 'body': '', 'expires': now + self.ttl}
+        except Exception:
+            return {'rules': 'disallow', 'body': '', 'expires': now + self.ERROR_TTL}
+
+    def parser(self, url: str) -> Optional[RobotFileParser]:
+        """Rules for the URL's host (fetched if missing or expired); None means allow everything"""
+        origin = self.origin(url)
+        with self.host_locks[origin]:
+            with self.lock:
+                entry = self.entries.get(origin)
+                parser = self.parsers.get(origin)
+            if entry is None or entry['expires'] <= time.time():
+                entry = self.fetch(origin)
+                parser = None
+                with self.lock:
+                    self.entries[origin] = entry
+                    self.dirty = True
+            if parser is None:
+                parser = RobotFileParser(f"{origin}/robots.txt")
+                if entry['rules'] == 'disallow':
+                    parser.disallow_all = True
+                elif entry['rules'] == 'allow':
+                    parser.allow_all = True
+                else:
+                    parser.parse(entry['body'].splitlines())
+                with self.lock:
+                    self.parsers[origin] = parser
+                delay = parser.crawl_delay(self.user_agent) if entry['rules'] == 'parse' else None
+                if delay:
+                    self.transport.controller.set_crawl_delay(urlparse(origin).hostname or '',
+                                                              min(float(delay), self.max_crawl_delay))
+            return parser
+
+    def allowed(self, url: str) -> bool:
+        """Whether robots.txt lets this crawler fetch the URL"""
+        return self.parser(url).can_fetch(self.user_agent, url)
+
+    def sitemaps(self, url: str) -> List[str]:
+        """Sitemap URLs declared in the host's robots.txt (a copy; the cached parser's list is shared)"""
+        return list(self.parser(url).site_maps() or [])
+
+
+class FeedDiscoveryCache:
+    """Per-website record of discovered feed URLs, kept across runs.
+
+    A site whose entry is younger than revalidate_hours goes straight to its
+    known feeds (or, for a confirmed miss, to no feeds) without fetching the
+    homepage or probing common feed paths again. A miss is only confirmed when
+    the homepage loaded and every probed path returned 404/410.
+    """
+
+    def __init__(self, cache_file: str = "output/feed_discovery_cache.json", revalidate_hours: float = 168):
+        self.cache_file = cache_file
+        self.max_age = revalidate_hours * 3600
+        self.lock = threading.Lock()
+        self.entries = self.load_cache()
+        self.dirty = False
+
+    def load_cache(self) -> Dict:
+        """Load known feeds per website"""
+        if os.path.exists(self.cache_file):
+            try:
+                with open(self.cache_file, 'r', encoding='utf-8') as f:
+                    return json.load(f)
+            except Exception:
+                return {}
+        return {}
+
+    def save_cache(self):
+        """Save known feeds per website"""
+        with self.lock:
+            if not self.dirty:
+                return
+            data = dict(self.entries)
+            self.dirty = False
         try:
-            # Alpha Vantage (financial data)
-            alpha_aliases = self.fetch_alpha_vantage_aliases(company_name)
-            if alpha_aliases:
-                aliases.update(alpha_aliases)
-                online_success = True
-            
-            # Financial Modeling Prep
-            fmp_aliases = self.fetch_financial_modeling_aliases(company_name)
-            if fmp_aliases:
-                aliases.update(fmp_aliases)
-                online_success = True
-            
-            # Clearbit domain
-            clearbit_aliases = self.fetch_clearbit_domain(company_name)
-            if clearbit_aliases:
-                aliases.update(clearbit_aliases)
-                online_success = True
-            
-            # Wikipedia
-            wiki_aliases = self.fetch_wikipedia_aliases(company_name)
-            if wiki_aliases:
-                aliases.update(wiki_aliases)
-                online_success = True
-                
+            os.makedirs(os.path.dirname(self.cache_file), exist_ok=True)
+            with open(self.cache_file, 'w', encoding='utf-8') as f:
+                json.dump(data, f, indent=2)
         except Exception as e:
-            print(f"Online API error for {company_name}: {e}")
-        
-        # If online sources didn't provide good results, use enhanced local parsing
-        if not online_success or len(aliases) < 3:
-            enhanced_local = self.get_enhanced_local_aliases(company_name)
-            aliases.update(enhanced_local)
-        
-        # Add original company name
-        aliases.add(company_name.lower())
-        
-        # Clean and deduplicate
-        clean_aliases = []
-        for alias in aliases:
-            if alias and len(alias.strip()) > 1:
-                clean_alias = alias.strip().lower()
-                if clean_alias not in clean_aliases:
-                    clean_aliases.append(clean_alias)
-        
-        # Cache the results
-        self.cache[cache_key] = clean_aliases
-        self.save_cache()
-        
-        return clean_aliases
+            print(f"Warning: Could not save feed discovery cache: {e}")
 
-# Optional imports
-try:
-    from newspaper import Article
-    HAS_NEWSPAPER = True
-except ImportError:
-    HAS_NEWSPAPER = False
+    def get(self, website_url: str) -> Optional[List[str]]:
+        """Known feeds of a website (possibly empty), or None if it needs (re)discovery"""
+        with self.lock:
+            entry = self.entries.get(website_url)
+        if entry is None or time.time() - entry['checked'] > self.max_age:
+            return None
+        return list(entry['feeds'])
+
+    def store(self, website_url: str, feeds: List[str]):
+        with self.lock:
+            self.entries[website_url] = {'feeds': feeds, 'checked': time.time()}
+            self.dirty = True
+
+    def invalidate(self, website_url: str):
+        """Force rediscovery next time (e.g. a known feed stopped working)"""
+        with self.lock:
+            if self.entries.pop(website_url, None) is not None:
+                self.dirty = True
+
+
+class ExtractionProfileCache:
+    """Per-host record of the extractor (and CSS selector) that finds article content, kept across runs.
+
+    Only the stage after the cheap structured data pass, which always runs
+    first, is profiled. A host's winning method there is promoted (tried first
+    in that stage) once it has won promote_after pages in a row with content not
+    much shorter than usual for the host. After relearn_after misses in a row
+    (another method winning, or short content, say after a site redesign) the
+    profile is dropped and the host is learned again with the default order.
+    """
+
+    def __init__(self, cache_file: str = "output/extraction_profiles.json", relearn_after: int = 3, promote_after: int = 3):
+        self.cache_file = cache_file
+        self.relearn_after = relearn_after
+        self.promote_after = promote_after
+        self.lock = threading.Lock()
+        self.entries = self.load_cache()
+        self.dirty = False
+
+    def load_cache(self) -> Dict:
+        """Load extraction profiles per host"""
+        if os.path.exists(self.cache_file):
+            try:
+                with open(self.cache_file, 'r', encoding='utf-8') as f:
+                    return json.load(f)
+            except Exception:
+                return {}
+        return {}
+
+    def save_cache(self):
+        """Save extraction profiles per host"""
+        with self.lock:
+            if not self.dirty:
+                return
+            data = {host: dict(profile) for host, profile in self.entries.items()}
+            self.dirty = False
+        try:
+            os.makedirs(os.path.dirname(self.cache_file), exist_ok=True)
+            with open(self.cache_file, 'w', encoding='utf-8') as f:
+                json.dump(data, f, indent=2)
+        except Exception as e:
+            print(f"Warning: Could not save extraction profiles: {e}")
+
+    def get(self, host: str) -> Optional[Dict]:
+        with self.lock:
+            profile = self.entries.get(host)
+            return dict(profile) if profile else None
+
+    def promoted(self, profile: Optional[Dict]) -> bool:
+        """Whether a profile has won often enough to be tried before higher-quality methods"""
+        return bool(profile) and profile.get('streak', 0) >= self.promote_after
+
+    def record(self, host: str, method: str, selector: str = None, length: int = 0) -> str:
+        """Record which method extracted a page: 'learned', 'hit', 'miss' or 'relearned'"""
+        with self.lock:
+            self.dirty = True
+            profile = self.entries.get(host)
+            good = profile is None or length >= profile.get('avg_length', 0) / 2
+            if profile is None or (not self.promoted(profile) and (profile['method'], profile.get('selector')) != (method, selector)):
+                # Not promoted yet: nothing was skipped, so just follow the latest winner
+                self.entries[host] = {'method': method, 'selector': selector, 'hits': 1, 'streak': 1, 'strikes': 0,
+                                      'avg_length': length, 'updated': time.time()}
+                return 'learned'
+            if profile['method'] == method and profile.get('selector') == selector and good:
+                profile['hits'] += 1
+                profile['streak'] = profile.get('streak', 0) + 1
+                profile['strikes'] = 0
+                profile['avg_length'] = int(profile.get('avg_length', length) * 0.8 + length * 0.2)
+                return 'hit'
+            if not self.promoted(profile):
+                profile['streak'] = 0
+                return 'miss'
+            profile['strikes'] += 1
+            if profile['strikes'] < self.relearn_after:
+                return 'miss'
+            del self.entries[host]
+            return 'relearned'
+
+    def __len__(self) -> int:
+        with self.lock:
+            return len(self.entries)
 
 
 @dataclass
-class CrawlResult:
-    """Data class to store crawl results"""
-    url: str
+class FeedEntry:
+    """One item of an RSS/Atom feed"""
+    link: str
     title: str = ""
+    summary: str = ""
     content: str = ""
-    metadata: Dict = field(default_factory=dict)
-    found_companies: Set[str] = field(default_factory=set)
-    found_keywords: Set[str] = field(default_factory=set)
-    article_date: Optional[str] = None
-    crawl_timestamp: str = field(default_factory=lambda: datetime.now().isoformat())
-    error: Optional[str] = None
+    published: Optional[str] = None
+    timestamp: Optional[float] = None
+
+
+class StreamingFeedParser:
+    """Incremental reader for RSS 2.0, RSS 1.0 (RDF) and Atom feeds.
+
+    The body is fed to an expat pull parser in chunks. Each item is turned into
+    a FeedEntry as soon as its end tag arrives and then dropped from the tree,
+    and parsing stops once `limit` entries have been read, so the rest of a
+    large feed is never parsed. There is no HTML sanitizing or date guessing as
+    in feedparser; a body that is not a well-formed feed raises ValueError (or
+    ElementTree.ParseError) so the caller can fall back to feedparser.
+    """
+
+    CHUNK_SIZE = 65536
+    ROOT_TAGS = ('rss', 'feed', 'RDF')
+    ITEM_TAGS = ('item', 'entry')
+    # Publish date elements, most preferred first (updated/modified only when nothing better exists)
+    DATE_TAGS = ('pubDate', 'published', 'date', 'issued', 'created', 'updated', 'modified')
+
+    @staticmethod
+    def local_name(tag: str) -> str:
+        return tag.rsplit('}', 1)[-1]
+
+    @classmethod
+    def parse(cls, content: bytes, limit: int = None) -> List[FeedEntry]:
+        """Read up to limit entries (all if None) that have a link"""
+        parser = ElementTree.XMLPullParser(events=('start', 'end'))
+        entries = []
+        stack = []
+        for offset in range(0, len(content), cls.CHUNK_SIZE):
+            parser.feed(content[offset:offset + cls.CHUNK_SIZE])
+            for event, elem in parser.read_events():
+                if event == 'start':
+                    if not stack and cls.local_name(elem.tag) not in cls.ROOT_TAGS:
+                        raise ValueError(f"not an RSS/Atom feed (root element <{cls.local_name(elem.tag)}>)")
+                    stack.append(elem)
+                    continue
+                stack.pop()
+                if cls.local_name(elem.tag) not in cls.ITEM_TAGS:
+                    continue
+                entry = cls.read_entry(elem)
+                if stack:
+                    stack[-1].remove(elem)
+                if entry:
+                    entries.append(entry)
+                    if limit is not None and len(entries) >= limit:
+                        return entries
+        parser.close()
+        return entries
+
+    @classmethod
+    def read_entry(cls, item: ElementTree.Element) -> Optional[FeedEntry]:
+        """Build a FeedEntry from an <item>/<entry> element (None if it has no link)"""
+        link = guid = None
+        fields = {}
+        dates = {}
+        for child in item:
+            name = cls.local_name(child.tag)
+            if name == 'link':
+                href = child.get('href')
+                if href is None:
+                    link = link or (child.text or '').strip() or None
+                elif child.get('rel', 'alternate') == 'alternate' and not link:
+                    link = href.strip()
+            elif name == 'guid' and child.get('isPermaLink', 'true') != 'false':
+                guid = (child.text or '').strip()
+            elif name in cls.DATE_TAGS:
+                dates.setdefault(name, (child.text or '').strip())
+            elif name in ('title', 'description', 'summary', 'encoded', 'content'):
+                fields.setdefault(name, ''.join(child.itertext()).strip())
+        if not link and guid and guid.startswith(('http://', 'https://')):
+            link = guid
+        # RSS 1.0 items carry their URL in rdf:about
+        link = link or item.get('{http://www.w3.org/1999/02/22-rdf-syntax-ns#}about')
+        if not link:
+            return None
+        published = next((dates[name] for name in cls.DATE_TAGS if dates.get(name)), None)
+        return FeedEntry(
+            link=link,
+            title=fields.get('title', ''),
+            summary=fields.get('description') or fields.get('summary', ''),
+            content=fields.get('encoded') or fields.get('content', ''),
+            published=published,
+            timestamp=UrlFrontier.parse_timestamp(published),
+        )
+
+
+class PageArchive:
+    """Append-only, compressed archive of fetched pages and feeds.
+
+    Records are WARC/1.0 response records, each compressed on its own (one gzip
+    member or zstd frame), written to segment files under directory. Every
+    segment has a JSON-lines index of (url, kind, status, offset, length), so
+    any record can be read back without decompressing the rest. Segment names
+    include the process id, so several crawler processes can share a directory.
+    """
+
+    HEADERS_KEPT = ('Content-Type', 'Date', 'Last-Modified', 'ETag')
+
+    def __init__(self, directory: str = "output/archive", compression: str = "zstd", segment_mb: int = 256):
+        self.directory = directory
+        self.compression = 'zstd' if compression == 'zstd' and HAS_ZSTANDARD else 'gzip'
+        self.segment_bytes = segment_mb * 1024 * 1024
+        self.lock = threading.Lock()
+        self.segment = None
+        self.index = None
+        self.segment_count = 0
+        self.records = 0
+        self.bytes_written = 0
+
+    def _open_segment(self):
+        self.close()
+        os.makedirs(self.directory, exist_ok=True)
+        self.segment_count += 1
+        extension = 'warc.zst' if self.compression == 'zstd' else 'warc.gz'
+        name = f"pages-{datetime.now().strftime('%Y%m%d%H%M%S')}-{os.getpid()}-{self.segment_count:05d}"
+        self.segment = open(os.path.join(self.directory, f"{name}.{extension}"), 'ab')
+        self.index = open(os.path.join(self.directory, f"{name}.idx"), 'a', encoding='utf-8')
+
+    def _compress(self, data: bytes) -> bytes:
+        if self.compression == 'zstd':
+            return zstandard.ZstdCompressor(level=10).compress(data)
+        return gzip.compress(data, compresslevel=6)
+
+    def append(self, response: requests.Response, kind: str = 'page', requested_url: str = None):
+        """Archive one response body (kind is 'page' or 'feed')"""
+        status_line = f"HTTP/1.1 {response.status_code} {response.reason or ''}".strip()
+        headers = [f"{name}: {response.headers[name]}" for name in self.HEADERS_KEPT if response.headers.get(name)]
+        http_block = ('\r\n'.join([status_line] + headers) + '\r\n\r\n').encode('utf-8') + response.content
+        fetched = datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
+        warc_headers = [
+            'WARC/1.0',
+            'WARC-Type: response',
+            f"WARC-Record-ID: <urn:uuid:{uuid.uuid4()}>",
+            f"WARC-Date: {fetched}",
+            f"WARC-Target-URI: {response.url}",
+            f"WARC-Crawl-Kind: {kind}",
+        ]
+        if requested_url and requested_url != response.url:
+            warc_headers.append(f"WARC-Crawl-Requested-URI: {requested_url}")
+        warc_headers += ['Content-Type: application/http; msgtype=response', f"Content-Length: {len(http_block)}"]
+        record = self._compress(('\r\n'.join(warc_headers) + '\r\n\r\n').encode('utf-8') + http_block + b'\r\n\r\n')
+
+        with self.lock:
+            if self.segment is None or self.segment.tell() + len(record) > self.segment_bytes:
+                self._open_segment()
+            offset = self.segment.tell()
+            self.segment.write(record)
+            self.segment.flush()
+            self.index.write(json.dumps({'url': requested_url or response.url, 'kind': kind, 'status': response.status_code,
+                                         'fetched': fetched, 'offset': offset, 'length': len(record)}) + '\n')
+            self.index.flush()
+            self.records += 1
+            self.bytes_written += len(record)
+
+    def close(self):
+        for handle in (self.segment, self.index):
+            if handle is not None:
+                handle.close()
+        self.segment = self.index = None
+
+    def segments(self) -> List[str]:
+        return sorted(glob.glob(os.path.join(self.directory, 'pages-*.warc.gz')) +
+                      glob.glob(os.path.join(self.directory, 'pages-*.warc.zst')))
+
+    @staticmethod
+    def read_index(segment: str) -> List[Dict]:
+        entries = []
+        with open(segment.rsplit('.warc', 1)[0] + '.idx', 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    entries.append(json.loads(line))
+                except ValueError:
+                    continue  # partly written last line of an interrupted run
+        return entries
+
+    @staticmethod
+    def read_records(segment: str, entries: List[Dict]):
+        """Yield (index entry, requests.Response rebuilt from the archived record) for the given entries"""
+        decompressor = zstandard.ZstdDecompressor() if segment.endswith('.zst') else None
+        with open(segment, 'rb') as f:
+            for entry in entries:
+                f.seek(entry['offset'])
+                data = f.read(entry['length'])
+                try:
+                    record = decompressor.decompress(data) if decompressor else gzip.decompress(data)
+                    _, http_block = record.split(b'\r\n\r\n', 1)
+                    http_head, body = http_block.split(b'\r\n\r\n', 1)
+                except Exception:
+                    continue
+                lines = http_head.decode('utf-8', 'replace').split('\r\n')
+                response = requests.Response()
+                response.status_code = int(lines[0].split()[1])
+                response.headers = requests.structures.CaseInsensitiveDict(
+                    line.split(': ', 1) for line in lines[1:] if ': ' in line)
+                response._content = body[:-4] if body.endswith(b'\r\n\r\n') else body
+                response._content_consumed = True
+                response.url = re.search(rb'WARC-Target-URI: ([^\r\n]+)', record).group(1).decode('utf-8')
+                response.truncated = False
+                yield entry, response
+
+
+class CircuitBreaker:
+    """Per-host circuit breaker for article fetches.
+
+    While a host's circuit is closed, the outcome of each fetch is kept in a
+    sliding window. Once at least min_requests outcomes are known and the
+    failure rate reaches failure_rate, the circuit opens and the host's URLs are
+    refused for cooldown seconds. After that a single probe is let through
+    (half-open): success closes the circuit, failure opens it again with the
+    cooldown doubled, up to max_cooldown.
+    """
+
+    CLOSED, OPEN, HALF_OPEN = 'closed', 'open', 'half-open'
+    PROBE_WAIT = 10.0  # seconds a refused URL waits while the probe is in flight
+    PROBE_TIMEOUT = 120.0  # a probe that never reported back is replaced after this long
+
+    def __init__(self, failure_rate: float = 0.5, min_requests: int = 5, window: int = 20,
+                 cooldown: float = 60.0, max_cooldown: float = 900.0):
+        self.failure_rate = failure_rate
+        self.min_requests = min_requests
+        self.window = window
+        self.cooldown = cooldown
+        self.max_cooldown = max_cooldown
+        self.lock = threading.Lock()
+        self.hosts: Dict[str, Dict] = {}
+
+    def _host(self, host: str) -> Dict:
+        state = self.hosts.get(host)
+        if state is None:
+            state = self.hosts[host] = {
+                'state': self.CLOSED, 'outcomes': deque(maxlen=self.window), 'opened_at': 0.0,
+                'cooldown': self.cooldown, 'trips': 0, 'refused': 0, 'last_failure': None, 'probe_started': 0.0
+            }
+        return state
+
+    def retry_in(self, host: str) -> float:
+        """Seconds until host's circuit lets a request through (0 if it may now); does not claim the probe"""
+        with self.lock:
+            state = self.hosts.get(host)
+            if state is None or state['state'] == self.CLOSED:
+                return 0.0
+            now = time.time()
+            if state['state'] == self.OPEN:
+                return max(state['opened_at'] + state['cooldown'] - now, 0.0)
+            return 0.0 if now - state['probe_started'] > self.PROBE_TIMEOUT else self.PROBE_WAIT
+
+    def allow(self, host: str) -> float:
+        """0 if a request to host may go ahead now (possibly as the probe), else the seconds to wait"""
+        with self.lock:
+            state = self._host(host)
+            if state['state'] == self.CLOSED:
+                return 0.0
+            now = time.time()
+            if state['state'] == self.OPEN:
+                remaining = state['opened_at'] + state['cooldown'] - now
+                if remaining > 0:
+                    state['refused'] += 1
+                    return remaining
+            elif now - state['probe_started'] <= self.PROBE_TIMEOUT:
+                state['refused'] += 1
+                return self.PROBE_WAIT
+            # This caller is the probe
+            state['state'] = self.HALF_OPEN
+            state['probe_started'] = now
+            return 0.0
+
+    def record(self, host: str, failure: Optional[str] = None) -> Optional[str]:
+        """Record a fetch outcome (failure is its reason, None for success).
+
+        Returns 'opened', 'reopened' or 'closed' when the host's circuit changed state.
+        """
+        with self.lock:
+            state = self._host(host)
+            if failure:
+                state['last_failure'] = failure
+            if state['state'] == self.HALF_OPEN:
+                if failure:
+                    state['state'] = self.OPEN
+                    state['opened_at'] = time.time()
+                    state['cooldown'] = min(state['cooldown'] * 2, self.max_cooldown)
+                    return 'reopened'
+                state['state'] = self.CLOSED
+                state['outcomes'].clear()
+                state['cooldown'] = self.cooldown
+                return 'closed'
+            if state['state'] == self.OPEN:
+                return None  # a fetch that was already running when the circuit opened
+            state['outcomes'].append(bool(failure))
+            failures = sum(state['outcomes'])
+            if len(state['outcomes']) >= self.min_requests and failures / len(state['outcomes']) >= self.failure_rate:
+                state['state'] = self.OPEN
+                state['opened_at'] = time.time()
+                state['trips'] += 1
+                return 'opened'
+            return None
+
+    def tripped(self) -> Dict[str, Dict]:
+        """Hosts whose circuit opened at least once, with their state, refusals and last failure"""
+        with self.lock:
+            return {host: {'state': state['state'], 'trips': state['trips'], 'refused': state['refused'],
+                           'last_failure': state['last_failure']}
+                    for host, state in self.hosts.items() if state['trips']}
+
+
+class UrlFrontier:
+    """Priority queue of discovered article URLs, newest first.
+
+    URLs carry a publish timestamp (RSS published/updated, sitemap lastmod or
+    news:publication_date, or a date found in the URL itself). A date without a
+    time counts as the end of that day, so same-day articles survive a cutoff
+    taken later that day. URLs older than the cutoff are dropped before
+    download; undated URLs keep their discovery order after all dated ones.
+    """
+
+    URL_DATE_PATTERNS = [
+        re.compile(r'/(20\d{2})/(\d{1,2})/(\d{1,2})(?:/|$)'),
+        re.compile(r'/(20\d{2})-(\d{2})-(\d{2})(?:[/\-_]|$)'),
+        re.compile(r'(?:/|-|_)(20\d{2})(\d{2})(\d{2})(?:[/\-_.]|$)'),
+    ]
+    DATE_ONLY_PATTERN = re.compile(r'^\d{4}-?\d{2}-?\d{2}$')
+    DAY_SECONDS = 86400
+
+    def __init__(self, cutoff: Optional[float] = None):
+        self.cutoff = cutoff
+        self.heap = []
+        self.counter = 0
+        self.dropped = 0
+
+    @staticmethod
+    def parse_timestamp(value) -> Optional[float]:
+        """Parse an ISO 8601 / RFC 822 date string or struct_time into a UTC epoch timestamp
+
+        A bare date (2025-09-04) is returned as the end of that day.
+        """
+        if not value:
+            return None
+        if isinstance(value, time.struct_time):
+            return float(calendar.timegm(value))
+        text = str(value).strip()
+        try:
+            parsed = datetime.fromisoformat(text.replace('Z', '+00:00'))
+        except ValueError:
+            try:
+                parsed = parsedate_to_datetime(text)
+            except (TypeError, ValueError, IndexError):
+                return None
+        if parsed.tzinfo is None:
+            parsed = parsed.replace(tzinfo=timezone.utc)
+        if UrlFrontier.DATE_ONLY_PATTERN.match(text):
+            return parsed.timestamp() + UrlFrontier.DAY_SECONDS
+        return parsed.timestamp()
+
+    @classmethod
+    def timestamp_from_url(cls, url: str) -> Optional[float]:
+        """Find a publish date in common URL layouts (/2025/09/04/, /2025-09-04, -20250904-)
+
+        URLs carry no time of day, so the end of that day is returned.
+        """
+        path = urlparse(url).path
+        for pattern in cls.URL_DATE_PATTERNS:
+            match = pattern.search(path)
+            if match:
+                try:
+                    year, month, day = (int(part) for part in match.groups())
+                    return datetime(year, month, day, tzinfo=timezone.utc).timestamp() + cls.DAY_SECONDS
+                except ValueError:
+                    continue
+        return None
+
+    def push(self, url: str, timestamp: Optional[float] = None) -> bool:
+        """Add a URL; returns False if it was dropped as too old"""
+        if timestamp is None:
+            timestamp = self.timestamp_from_url(url)
+        if timestamp is not None and self.cutoff is not None and timestamp < self.cutoff:
+            self.dropped += 1
+            return False
+        # Dated URLs first (newest first), then undated ones in discovery order
+        priority = (0, -timestamp) if timestamp is not None else (1, 0)
+        heapq.heappush(self.heap, (priority, self.counter, url))
+        self.counter += 1
+        return True
+
+    def pop(self) -> str:
+        return heapq.heappop(self.heap)[2]
+
+    def drain(self, limit: int = None) -> List[str]:
+        """Pop up to limit URLs in priority order"""
+        urls = []
+        while self.heap and (limit is None or len(urls) < limit):
+            urls.append(self.pop())
+        return urls
+
+    def __len__(self):
+        return len(self.heap)
+
+
+class PollScheduler:
+    """Per-source polling schedule for daemon mode.
+
+    Each feed, sitemap or homepage has its own interval, derived from a moving
+    average of how many new article URLs it yields per hour: a source is polled
+    about when target_new_items new articles are expected, clamped between
+    min_interval and max_interval. Sources that keep yielding nothing back off.
+    Schedules and HTTP validators (ETag/Last-Modified) survive restarts.
+    """
+
+    SMOOTHING = 0.3
+    BACKOFF = 1.5
+
+    def __init__(self, cache_file: str = "output/poll_schedule.json", min_interval: float = 60,
+                 max_interval: float = 21600, initial_interval: float = 600, target_new_items: float = 1):
+        self.cache_file = cache_file
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.initial_interval = initial_interval
+        self.target_new_items = target_new_items
+        self.lock = threading.Lock()
+        self.sources = self.load_cache()
+
+    def load_cache(self) -> Dict:
+        """Load saved schedules"""
+        if os.path.exists(self.cache_file):
+            try:
+                with open(self.cache_file, 'r', encoding='utf-8') as f:
+                    return json.load(f)
+            except Exception:
+                return {}
+        return {}
+
+    def save_cache(self):
+        """Save schedules so a restarted daemon keeps what it learned"""
+        with self.lock:
+            data = {key: dict(source) for key, source in self.sources.items()}
+        try:
+            os.makedirs(os.path.dirname(self.cache_file), exist_ok=True)
+            with open(self.cache_file, 'w', encoding='utf-8') as f:
+                json.dump(data, f, indent=2)
+        except Exception as e:
+            print(f"Warning: Could not save poll schedule: {e}")
+
+    def register(self, kind: str, url: str, website: str) -> bool:
+        """Add a source (kind is 'feed', 'sitemap' or 'homepage'); returns False if already known"""
+        key = f"{kind}:{url}"
+        with self.lock:
+            if key in self.sources:
+                self.sources[key]['website'] = website
+                return False
+            self.sources[key] = {
+                'kind': kind,
+                'url': url,
+                'website': website,
+                'interval': self.initial_interval,
+                'next_poll': 0,
+                'last_poll': None,
+                'rate': None,
+                'polls': 0,
+                'new_items': 0,
+            }
+            return True
+
+    def retain(self, websites: List[str]):
+        """Forget sources of websites that are no longer watched"""
+        watched = set(websites)
+        with self.lock:
+            for key in [key for key, source in self.sources.items() if source['website'] not in watched]:
+                del self.sources[key]
+
+    def due(self, now: float = None) -> List[Dict]:
+        """Sources whose next poll time has passed, most overdue first"""
+        now = now or time.time()
+        with self.lock:
+            due = [dict(source, key=key) for key, source in self.sources.items() if source['next_poll'] <= now]
+        return sorted(due, key=lambda source: source['next_poll'])
+
+    def next_due(self) -> Optional[float]:
+        """Earliest next poll time of any source"""
+        with self.lock:
+            return min((source['next_poll'] for source in self.sources.values()), default=None)
+
+    def record_poll(self, key: str, new_items: int, validators: Dict = None, now: float = None) -> float:
+        """Update a source's rate estimate after a poll and schedule the next one; returns the new interval"""
+        now = now or time.time()
+        with self.lock:
+            source = self.sources.get(key)
+            if source is None:
+                return self.initial_interval
+            if validators is not None:
+                source['validators'] = validators
+            elapsed = now - source['last_poll'] if source['last_poll'] else None
+            source['last_poll'] = now
+            source['polls'] += 1
+            source['new_items'] += new_items
+
+            if elapsed:
+                observed = new_items * 3600 / elapsed
+                source['rate'] = observed if source['rate'] is None else \
+                    self.SMOOTHING * observed + (1 - self.SMOOTHING) * source['rate']
+
+            if source['rate']:
+                interval = self.target_new_items * 3600 / source['rate']
+                if not new_items:
+                    # Quiet poll: don't come back sooner than last time
+                    interval = max(interval, source['interval'])
+            elif elapsed:
+                interval = source['interval'] * self.BACKOFF
+            else:
+                interval = source['interval']
+            source['interval'] = min(max(interval, self.min_interval), self.max_interval)
+            source['next_poll'] = now + source['interval']
+            return source['interval']
+
+    def __len__(self):
+        return len(self.sources)
 
 
 class NewsWebsiteCrawler:
     """Advanced news website crawler with multiple parsing strategies"""
     
-    def __init__(self, config_file: str = None):
+    def __init__(self, config_file: str = None, config_overrides: Dict = None):
+        self.config_file = config_file
         self.config = self.load_config(config_file)
+        if config_overrides:
+            self.config.update({k: v for k, v in config_overrides.items() if v is not None})
+        
+        # Optional CPU/memory profiling of the whole run
+        self.profiler = None
+        if self.config.get('profile'):
+            self.profiler = CrawlProfiler(
+                mode=self.config['profile'] if isinstance(self.config['profile'], str) else 'cprofile',
+                top_n=self.config.get('profile_top_n', 30),
+                sample_interval=self.config.get('profile_sample_interval', 0.01)
+            )
+            self.profiler.start('init')
+        
         self.symbols = UnicodeSafeFormatter()  # Initialize Unicode-safe formatter
         self.setup_logging()
-        self.session = self.create_session()
         
         # Log which symbol mode is being used
         mode = "Unicode emojis" if self.symbols.use_unicode else "Text alternatives"
@@ -439,59 +2872,59 @@ class NewsWebsiteCrawler:
         
         # Load data files
         self.websites = self.load_text_file('input/websites.txt')
-        self.companies_raw = self.load_text_file('input/companies.txt')
-        self.keywords = self.load_text_file('input/keywords.txt')
-        
-        # Initialize online company alias service
-        self.online_alias_service = OnlineCompanyAliasService(config=self.config)
         
-        # Parse companies to extract aliases and variations
-        self.companies = []
-        self.company_aliases = {}  # Maps original company name to list of aliases
+        # Shared HTTP transport for all network access, plus extraction and matching state
+        self.init_article_processing(self.create_transport())
+        self.session = self.transport.session
         
-        # Check if we should use online services
-        use_online = self.config.get('use_online_company_aliases', True)
+        # Initialize online company alias service
+        self.online_alias_service = OnlineCompanyAliasService(config=self.config, transport=self.transport)
         
-        if use_online:
-            self.log_and_flush('info', f"Using online services to fetch company aliases...")
-            for company_entry in self.companies_raw:
-                try:
-                    # Try online service first
-                    online_aliases = self.online_alias_service.get_company_aliases(company_entry)
-                    if len(online_aliases) > 1:  # If we got more than just the original name
-                        self.company_aliases[company_entry] = online_aliases
-                        self.companies.extend(online_aliases)
-                        self.log_and_flush('info', f"Online aliases for {company_entry}: {len(online_aliases)} terms")
-                    else:
-                        # Fallback to enhanced local parsing
-                        local_aliases = self.online_alias_service.get_enhanced_local_aliases(company_entry)
-                        self.company_aliases[company_entry] = local_aliases
-                        self.companies.extend(local_aliases)
-                        self.log_and_flush('info', f"Enhanced local aliases for {company_entry}: {len(local_aliases)} terms")
-                except Exception as e:
-                    # Fallback to enhanced local parsing on error
-                    local_aliases = self.online_alias_service.get_enhanced_local_aliases(company_entry)
-                    self.company_aliases[company_entry] = local_aliases
-                    self.companies.extend(local_aliases)
-                    self.log_and_flush('info', f"Fallback enhanced local aliases for {company_entry}: {len(local_aliases)} terms")
-        else:
-            # Use only enhanced local parsing
-            self.log_and_flush('info', f"Using enhanced local parsing for company aliases...")
-            for company_entry in self.companies_raw:
-                aliases = self.online_alias_service.get_enhanced_local_aliases(company_entry)
-                self.company_aliases[company_entry] = aliases
-                self.companies.extend(aliases)
+        # Watchlists: companies (with aliases) and keywords to match, and where their matches go
+        self.set_watchlists(self.load_watchlists())
         
-        # Remove duplicates while preserving order
-        seen = set()
-        self.companies = [x for x in self.companies if not (x in seen or seen.add(x))]
+        # Results storage
+        self.results = ResultStore(spill_to_disk=self.config.get('spill_results_to_disk', False))
+        self.processed_urls = UrlFingerprintSet()
+        self.retry_queue = RetryQueue(self.config['retry_backoff_base'], self.config['retry_backoff_max'])
+        self.breaker = CircuitBreaker(
+            failure_rate=self.config['circuit_breaker_failure_rate'],
+            min_requests=self.config['circuit_breaker_min_requests'],
+            window=self.config['circuit_breaker_window'],
+            cooldown=self.config['circuit_breaker_cooldown'],
+            max_cooldown=self.config['circuit_breaker_max_cooldown']
+        ) if self.config['circuit_breaker'] else None
+        self.canonicalizer = UrlCanonicalizer()
+        self.robots = RobotsCache(self.transport, self.config) if self.config['respect_robots_txt'] else None
+        self.feed_cache = FeedDiscoveryCache(revalidate_hours=self.config['feed_discovery_revalidate_hours'])
+        self.url_timestamps: Dict[str, float] = {}
+        self.crawl_state_file = 'output/crawl_state.json'
+        self.crawl_state = self.load_crawl_state()
+        # Fixed for this process: saving crawl state (e.g. by the daemon) must not move the live cutoff
+        self.last_run_start = self.crawl_state.get('last_successful_run_start')
+        self.daemon_stop = threading.Event()
+        self.reload_stop = threading.Event()
+        self.reload_thread = None
+        self.watchlist_pending_versions = {}
         
-        self.log_and_flush('info', f"Parsed {len(self.companies_raw)} company entries into {len(self.companies)} search terms")
         
-        # Results storage
-        self.results: List[CrawlResult] = []
-        self.processed_urls: Set[str] = set()
+        self.logger.info(f"Initialized crawler with {len(self.websites)} websites, "
+                        f"{len(self.companies)} companies, {len(self.keywords)} keywords")
+
+    def init_article_processing(self, transport: HttpTransport):
+        """Set up the state extract_article_content() and analyze_content() rely on.
+
+        Called by __init__ and by for_archive_worker(), so archive workers get
+        exactly the same attributes (matcher aside, which set_watchlists() or
+        the worker installs).
+        """
+        self.transport = transport
         self.lock = threading.Lock()
+        self.extraction_profiles = ExtractionProfileCache(
+            relearn_after=self.config['extraction_profile_relearn_after'],
+            promote_after=self.config['extraction_profile_promote_after']) if self.config['extraction_profiles'] else None
+        self.archive = PageArchive(self.config['archive_dir'], self.config['archive_compression'],
+                                   self.config['archive_segment_mb']) if self.config['archive_pages'] else None
         
         # Statistics
         self.stats = {
@@ -500,16 +2933,38 @@ class NewsWebsiteCrawler:
             'articles_with_keywords': 0,
             'articles_with_both': 0,
             'errors': 0,
+            'duplicates_skipped': 0,
+            'stale_urls_skipped': 0,
+            'retries_scheduled': 0,
+            'retries_exhausted': 0,
+            'breaker_deferred': 0,
+            'breaker_skipped': 0,
+            'robots_blocked': 0,
+            'structured_data_extractions': 0,
+            'deadline_exceeded': 0,
+            'discovery_deadline_exceeded': 0,
+            'feeds_streamed': 0,
+            'feeds_feedparser': 0,
+            'profile_first_try': 0,
+            'profiles_relearned': 0,
+            'watchlist_reloads': 0,
             'start_time': time.time()
         }
-        
-        self.logger.info(f"Initialized crawler with {len(self.websites)} websites, "
-                        f"{len(self.companies)} companies, {len(self.keywords)} keywords")
+        self.article_times = array('d')
 
     def setup_logging(self):
-        """Setup comprehensive logging with real-time output"""
+        """Setup a non-blocking logging pipeline.
+
+        Loggers only put records on a queue; a QueueListener thread hands them
+        to batching file/console handlers, so worker threads never wait on I/O.
+        """
         # Set log level from config
         log_level = getattr(logging, self.config.get('log_level', 'INFO').upper())
+        batch_size = self.config.get('log_batch_size', 100)
+        flush_interval = self.config.get('log_flush_interval', 0.5)
+        
+        # Stop a pipeline left over from a previous crawler instance
+        stop_log_listener()
         
         # Clear any existing handlers
         logging.getLogger().handlers.clear()
@@ -518,41 +2973,62 @@ class NewsWebsiteCrawler:
         detailed_formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
         simple_formatter = logging.Formatter('%(levelname)s: %(message)s')
         
-        # File handler (all messages) - force immediate flush
-        file_handler = logging.FileHandler('output/news_crawler.log')
+        os.makedirs('output', exist_ok=True)
+        
+        # File handler (all messages)
+        file_handler = BatchingFileHandler('output/news_crawler.log', batch_size, flush_interval)
         file_handler.setLevel(logging.DEBUG)
         file_handler.setFormatter(detailed_formatter)
+        handlers = [file_handler]
+        
+        # Optional JSON-lines log for machine consumption
+        if self.config.get('log_json', False):
+            json_handler = BatchingFileHandler('output/news_crawler.jsonl', batch_size, flush_interval)
+            json_handler.setLevel(logging.DEBUG)
+            json_handler.setFormatter(JsonLinesFormatter())
+            handlers.append(json_handler)
         
-        # Console handler (respects config level) - use custom flushing handler
-        console_handler = FlushingHandler()
+        # Console handler (respects config level)
+        console_handler = BatchingStreamHandler(None, batch_size, flush_interval)
         console_handler.setLevel(log_level)
+        # Only the console is rate limited; the log files keep every DEBUG record
+        console_handler.addFilter(DebugRateLimitFilter(self.config.get('log_debug_rate_limit', 50)))
         
         # Use simple format for DEBUG URL messages, detailed for others
         if log_level == logging.DEBUG:
             console_handler.setFormatter(simple_formatter)
         else:
             console_handler.setFormatter(detailed_formatter)
+        handlers.append(console_handler)
+        
+        # Records are enqueued by the calling thread and written by the listener thread
+        log_queue = queue.SimpleQueue()
+        queue_handler = RecordQueueHandler(log_queue)
+        self.log_listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+        self.log_listener.start()
+        _active_log_listeners.append(self.log_listener)
         
         # Configure root logger
         logging.basicConfig(
             level=logging.DEBUG,
-            handlers=[file_handler, console_handler],
+            handlers=[queue_handler],
             force=True  # Force reconfiguration
         )
         
         self.logger = logging.getLogger(__name__)
-        
-        # Force immediate flushing for real-time logging
-        import sys
-        sys.stdout.flush()
-        sys.stderr.flush()
     
     def log_and_flush(self, level: str, message: str):
-        """Log message and immediately flush to ensure real-time output"""
+        """Log a message; the background pipeline takes care of flushing"""
         getattr(self.logger, level)(message)
-        import sys
-        sys.stdout.flush()
-        sys.stderr.flush()
+    
+    def flush_logs(self):
+        """Wait until every queued log record has been written out"""
+        if self.log_listener._thread is None:
+            return
+        self.log_listener.stop()
+        for handler in self.log_listener.handlers:
+            handler.flush()
+        self.log_listener.start()
     
     def log_periodic_summary(self, processed_count: int, total_count: int):
         """Log a periodic summary of the crawling progress"""
@@ -589,7 +3065,69 @@ class NewsWebsiteCrawler:
             'log_urls': False,
             'log_url_details': False,
             'use_online_company_aliases': True,
-            'alphavantage_api_key': 'demo'
+            'company_alias_dataset': None,
+            'watchlist_reload_interval': 5,
+            'alphavantage_api_key': 'demo',
+            'max_page_bytes': 2000000,
+            'max_feed_bytes': 10000000,
+            'max_article_age_hours': None,
+            'skip_articles_before_last_run': False,
+            'result_content_chars': 500,
+            'spill_results_to_disk': False,
+            'log_json': False,
+            'log_batch_size': 100,
+            'log_flush_interval': 0.5,
+            'log_debug_rate_limit': 50,
+            'profile': False,
+            'profile_top_n': 30,
+            'profile_sample_interval': 0.01,
+            'distributed_lease_seconds': 300,
+            'distributed_max_attempts': 3,
+            'distributed_poll_interval': 2,
+            'daemon_min_poll_interval': 60,
+            'daemon_max_poll_interval': 21600,
+            'daemon_initial_poll_interval': 600,
+            'daemon_target_new_items': 1,
+            'daemon_rediscover_hours': 24,
+            'daemon_save_interval': 900,
+            'daemon_status_interval': 300,
+            'adaptive_concurrency': True,
+            'min_concurrency': 1,
+            'max_concurrency': 32,
+            'per_host_initial_concurrency': 2,
+            'per_host_max_concurrency': 4,
+            'concurrency_latency_tolerance': 2.5,
+            'retry_backoff_base': 2,
+            'retry_backoff_max': 300,
+            'respect_robots_txt': True,
+            'robots_cache_ttl_hours': 24,
+            'robots_max_crawl_delay': 30,
+            'dns_cache': True,
+            'dns_cache_ttl': 300,
+            'prewarm_connections': False,
+            'feed_discovery_revalidate_hours': 168,
+            'extraction_profiles': True,
+            'extraction_profile_relearn_after': 3,
+            'extraction_profile_promote_after': 3,
+            'structured_data_fast_path': True,
+            'results_db_path': 'output/news_results.db',
+            'watchlists': None,
+            'circuit_breaker': True,
+            'circuit_breaker_failure_rate': 0.5,
+            'circuit_breaker_min_requests': 5,
+            'circuit_breaker_window': 20,
+            'circuit_breaker_cooldown': 60,
+            'circuit_breaker_max_cooldown': 900,
+            'circuit_breaker_defer': True,
+            'article_deadline': 90,
+            'discovery_deadline': 300,
+            'slow_host_seconds': 10,
+            'streaming_feed_parser': True,
+            'archive_pages': False,
+            'archive_dir': 'output/archive',
+            'archive_compression': 'zstd',
+            'archive_segment_mb': 256,
+            'archive_reprocess_workers': None
         }
         
         # If no config file specified, try to load config.json from current directory
@@ -610,229 +3148,382 @@ class NewsWebsiteCrawler:
         
         return default_config
 
-    def create_session(self) -> requests.Session:
-        """Create configured requests session with retry strategy"""
-        session = requests.Session()
-        
-        # Retry strategy
-        retry_strategy = Retry(
-            total=self.config['max_retries'],
-            backoff_factor=1,
-            status_forcelist=[429, 500, 502, 503, 504],
-        )
-        
-        adapter = HTTPAdapter(max_retries=retry_strategy)
-        session.mount("http://", adapter)
-        session.mount("https://", adapter)
-        
-        session.headers.update({
-            'User-Agent': self.config['user_agent']
-        })
-        
-        return session
+    def create_transport(self) -> HttpTransport:
+        """Create the shared pooled HTTP transport, sized for the configured concurrency"""
+        hosts = {urlparse(website).hostname for website in self.websites}
+        return HttpTransport(self.config, host_count=len(hosts))
 
     def load_text_file(self, filename: str) -> List[str]:
         """Load and clean text file contents"""
         if not os.path.exists(filename):
-            self.logger.warning(f"File {filename} not found, creating empty list")
-            return []
-        
-        try:
-            with open(filename, 'r', encoding='utf-8') as f:
-                items = [line.strip() for line in f if line.strip() and not line.startswith('#')]
-            self.logger.info(f"Loaded {len(items)} items from {filename}")
-            return items
-        except Exception as e:
-            self.logger.error(f"Error loading {filename}: {e}")
-            return []
-    
-    def parse_company_aliases(self, company_entry: str) -> List[str]:
-        """Parse a company entry to extract main name and aliases"""
-        aliases = []
-        
-        # Remove any trailing comments
-        company_entry = company_entry.split('#')[0].strip()
-        
-        # Check for parenthetical aliases like "Alphabet (Google)"
-        if '(' in company_entry and ')' in company_entry:
-            # Extract main name and parenthetical content
-            main_name = company_entry.split('(')[0].strip()
-            parenthetical = company_entry.split('(')[1].split(')')[0].strip()
-            
-            # Add main name
-            aliases.append(main_name)
-            
-            # Add parenthetical content
-            aliases.append(parenthetical)
-            
-            # If parenthetical contains multiple words, add individual words
-            if ' ' in parenthetical:
-                aliases.extend(parenthetical.split())
-        else:
-            # No parenthetical, just add the main name
-            aliases.append(company_entry)
-        
-        # Add common variations and aliases for well-known companies
-        company_lower = company_entry.lower()
-        
-        # Google/Alphabet variations
-        if 'google' in company_lower or 'alphabet' in company_lower:
-            aliases.extend(['Google', 'Alphabet', 'Google.com', 'Google Inc', 'Alphabet Inc'])
-        
-        # Facebook/Meta variations
-        if 'facebook' in company_lower or 'meta' in company_lower:
-            aliases.extend(['Facebook', 'Meta', 'Facebook Inc', 'Meta Inc', 'FB'])
-        
-        # Microsoft variations
-        if 'microsoft' in company_lower:
-            aliases.extend(['Microsoft', 'Microsoft Corp', 'MSFT', 'MS'])
-        
-        # Apple variations
-        if 'apple' in company_lower:
-            aliases.extend(['Apple', 'Apple Inc', 'AAPL'])
-        
-        # Amazon variations
-        if 'amazon' in company_lower:
-            aliases.extend(['Amazon', 'Amazon.com', 'Amazon Inc', 'AMZN'])
-        
-        # NVIDIA variations
-        if 'nvidia' in company_lower:
-            aliases.extend(['NVIDIA', 'Nvidia', 'NVDA'])
-        
-        # Tesla variations
-        if 'tesla' in company_lower:
-            aliases.extend(['Tesla', 'Tesla Inc', 'TSLA'])
-        
-        # Netflix variations
-        if 'netflix' in company_lower:
-            aliases.extend(['Netflix', 'Netflix Inc', 'NFLX'])
-        
-        # Samsung variations
-        if 'samsung' in company_lower:
-            aliases.extend(['Samsung', 'Samsung Electronics', 'Samsung Inc'])
-        
-        # IBM variations
-        if 'ibm' in company_lower:
-            aliases.extend(['IBM', 'International Business Machines'])
-        
-        # Oracle variations
-        if 'oracle' in company_lower:
-            aliases.extend(['Oracle', 'Oracle Corp', 'Oracle Inc'])
-        
-        # Cisco variations
-        if 'cisco' in company_lower:
-            aliases.extend(['Cisco', 'Cisco Systems', 'CSCO'])
-        
-        # AMD variations
-        if 'amd' in company_lower:
-            aliases.extend(['AMD', 'Advanced Micro Devices'])
+            self.logger.warning(f"File {filename} not found, creating empty list")
+            return []
         
-        # Salesforce variations
-        if 'salesforce' in company_lower:
-            aliases.extend(['Salesforce', 'Salesforce.com', 'CRM'])
+        try:
+            with open(filename, 'r', encoding='utf-8') as f:
+                items = [line.strip() for line in f if line.strip() and not line.startswith('#')]
+            self.logger.info(f"Loaded {len(items)} items from {filename}")
+            return items
+        except Exception as e:
+            self.logger.error(f"Error loading {filename}: {e}")
+            return []
+    
+    def build_company_aliases(self, companies_raw: List[str]) -> Dict[str, List[str]]:
+        """Map each company entry to its search terms (bundled dataset first, then online aliases when enabled, else local parsing)"""
+        company_aliases = {}
+        alias_index = self.online_alias_service.alias_index
+        started = time.perf_counter()
         
-        # Uber variations
-        if 'uber' in company_lower:
-            aliases.extend(['Uber', 'Uber Technologies', 'UBER'])
+        # Check if we should use online services
+        use_online = self.config.get('use_online_company_aliases', True)
         
-        # Spotify variations
-        if 'spotify' in company_lower:
-            aliases.extend(['Spotify', 'Spotify Technology', 'SPOT'])
+        if use_online:
+            self.log_and_flush('info', f"Using online services to fetch company aliases...")
+            for company_entry in companies_raw:
+                try:
+                    # Bundled dataset first, online service for the rest
+                    online_aliases = self.online_alias_service.get_company_aliases(company_entry)
+                    if len(online_aliases) > 1:  # If we got more than just the original name
+                        company_aliases[company_entry] = online_aliases
+                        source = "Offline" if alias_index.lookup(company_entry) else "Online"
+                        self.log_and_flush('info', f"{source} aliases for {company_entry}: {len(online_aliases)} terms")
+                    else:
+                        # Fallback to enhanced local parsing
+                        local_aliases = self.online_alias_service.get_enhanced_local_aliases(company_entry)
+                        company_aliases[company_entry] = local_aliases
+                        self.log_and_flush('info', f"Enhanced local aliases for {company_entry}: {len(local_aliases)} terms")
+                except Exception as e:
+                    # Fallback to enhanced local parsing on error
+                    local_aliases = self.online_alias_service.get_enhanced_local_aliases(company_entry)
+                    company_aliases[company_entry] = local_aliases
+                    self.log_and_flush('info', f"Fallback enhanced local aliases for {company_entry}: {len(local_aliases)} terms")
+        else:
+            # Use only enhanced local parsing
+            self.log_and_flush('info', f"Using enhanced local parsing for company aliases...")
+            for company_entry in companies_raw:
+                company_aliases[company_entry] = self.online_alias_service.get_enhanced_local_aliases(company_entry)
         
-        # Adobe variations
-        if 'adobe' in company_lower:
-            aliases.extend(['Adobe', 'Adobe Inc', 'ADBE'])
+        known = sum(1 for company_entry in companies_raw if alias_index.lookup(company_entry))
+        self.log_and_flush('info', f"{self.symbols.get('building')} {known}/{len(companies_raw)} companies found in the alias dataset "
+                                   f"(version {alias_index.version}, {len(alias_index)} companies); aliases resolved in "
+                                   f"{(time.perf_counter() - started) * 1000:.0f} ms")
+        return company_aliases
+
+    def load_watchlists(self) -> List['Watchlist']:
+        """Watchlists from the 'watchlists' config, or a single 'default' one from input/companies.txt and input/keywords.txt"""
+        watchlists = []
+        for name, spec in (self.config.get('watchlists') or {'default': {}}).items():
+            output_dir = spec.get('output_dir', 'output' if name == 'default' else os.path.join('output', name))
+            companies_file = spec.get('companies_file', 'input/companies.txt')
+            keywords_file = spec.get('keywords_file', 'input/keywords.txt')
+            companies_raw = self.load_text_file(companies_file)
+            watchlists.append(Watchlist(
+                name=name,
+                company_aliases=self.build_company_aliases(companies_raw),
+                keywords=self.load_text_file(keywords_file),
+                case_sensitive=spec.get('case_sensitive', self.config['case_sensitive']),
+                output_formats=spec.get('output_formats', self.config['output_formats']),
+                output_dir=output_dir,
+                results_db_path=spec.get('results_db_path', self.config['results_db_path'] if name == 'default'
+                                         else os.path.join(output_dir, 'news_results.db')),
+                companies_file=companies_file,
+                keywords_file=keywords_file
+            ))
+        self.watchlist_file_versions = self.file_versions(watchlists)
+        return watchlists
+
+    def set_watchlists(self, watchlists: List['Watchlist']):
+        """Install watchlists and build the combined matcher over all of them.
+
+        Workers read self.matcher once per article, so replacing it here swaps
+        the new watchlists in between articles, without pausing the crawl.
+        """
+        matcher = WatchlistMatcher(watchlists)
         
-        # Sony variations
-        if 'sony' in company_lower:
-            aliases.extend(['Sony', 'Sony Corp', 'Sony Group'])
+        # Union over all watchlists, for logging and alias reporting
+        self.companies_raw = list(dict.fromkeys(c for w in watchlists for c in w.company_aliases))
+        self.company_aliases = {c: a for w in watchlists for c, a in w.company_aliases.items()}
+        self.companies = list(dict.fromkeys(a for aliases in self.company_aliases.values() for a in aliases))
+        self.keywords = list(dict.fromkeys(k for w in watchlists for k in w.keywords))
+        self.watchlists = watchlists
+        self.matcher = matcher
         
-        # Qualcomm variations
-        if 'qualcomm' in company_lower:
-            aliases.extend(['Qualcomm', 'Qualcomm Inc', 'QCOM'])
+        names = f" in {len(watchlists)} watchlists ({', '.join(w.name for w in watchlists)})" if len(watchlists) > 1 else ""
+        self.log_and_flush('info', f"Parsed {len(self.companies_raw)} company entries into {len(self.companies)} search terms{names}")
+
+    @staticmethod
+    def file_versions(watchlists: List['Watchlist']) -> Dict[str, Optional[Tuple[int, int]]]:
+        """(mtime, size) of every watchlist input file, None for missing files"""
+        versions = {}
+        for watchlist in watchlists:
+            for path in (watchlist.companies_file, watchlist.keywords_file):
+                if path:
+                    try:
+                        stat = os.stat(path)
+                        versions[path] = (stat.st_mtime_ns, stat.st_size)
+                    except OSError:
+                        versions[path] = None
+        return versions
+
+    @staticmethod
+    def read_watchlist_file(filename: str) -> Optional[List[str]]:
+        """Read a watchlist file for a reload; None if it cannot be read right now"""
+        try:
+            with open(filename, 'r', encoding='utf-8') as f:
+                return [line.strip() for line in f if line.strip() and not line.startswith('#')]
+        except (OSError, UnicodeDecodeError):
+            return None
+
+    def reload_watchlists(self) -> bool:
+        """Re-read watchlist files that changed since they were loaded and swap in the updated watchlists.
+
+        A changed file is reloaded once its mtime and size have stayed the same
+        for one check interval, so a half-written save is never applied. Missing
+        or unreadable files are skipped and the loaded watchlist is kept.
+        Companies already known keep their aliases; only added entries go
+        through alias resolution, and removed ones are dropped.
+        """
+        versions = self.file_versions(self.watchlists)
+        pending, self.watchlist_pending_versions = self.watchlist_pending_versions, versions
+        changed = {path for path, version in versions.items()
+                   if version is not None and version != self.watchlist_file_versions.get(path) and version == pending.get(path)}
+        if not changed:
+            return False
         
-        # Remove duplicates and empty strings, convert to lowercase for case-insensitive matching
-        aliases = list(set([alias.strip().lower() for alias in aliases if alias.strip()]))
+        watchlists = []
+        reloaded = False
+        for watchlist in self.watchlists:
+            if watchlist.companies_file not in changed and watchlist.keywords_file not in changed:
+                watchlists.append(watchlist)
+                continue
+            old_aliases = watchlist.company_aliases
+            companies_raw = self.read_watchlist_file(watchlist.companies_file) if watchlist.companies_file in changed else list(old_aliases)
+            keywords = self.read_watchlist_file(watchlist.keywords_file) if watchlist.keywords_file in changed else watchlist.keywords
+            if companies_raw is None or keywords is None:
+                self.log_and_flush('warning', f"{self.symbols.get('warning')} Could not read the files of watchlist '{watchlist.name}', keeping the loaded version")
+                watchlists.append(watchlist)
+                continue
+            for path in (watchlist.companies_file, watchlist.keywords_file):
+                if path in changed:
+                    self.watchlist_file_versions[path] = versions[path]
+            added = [company for company in companies_raw if company not in old_aliases]
+            removed = [company for company in old_aliases if company not in companies_raw]
+            new_aliases = self.build_company_aliases(added) if added else {}
+            company_aliases = {company: old_aliases[company] if company in old_aliases else new_aliases[company] for company in dict.fromkeys(companies_raw)}
+            
+            updated = Watchlist(watchlist.name, company_aliases, keywords, watchlist.case_sensitive, watchlist.output_formats,
+                                watchlist.output_dir, watchlist.results_db_path, watchlist.companies_file, watchlist.keywords_file)
+            watchlists.append(updated)
+            reloaded = True
+            keywords_added = len(set(keywords) - set(watchlist.keywords))
+            keywords_removed = len(set(watchlist.keywords) - set(keywords))
+            self.log_and_flush('info', f"{self.symbols.get('folder')} Reloaded watchlist '{watchlist.name}': "
+                                       f"+{len(added)}/-{len(removed)} companies, +{keywords_added}/-{keywords_removed} keywords")
         
-        return aliases
+        if not reloaded:
+            return False
+        self.set_watchlists(watchlists)
+        with self.lock:
+            self.stats['watchlist_reloads'] += 1
+        return True
+
+    def start_watchlist_reloader(self):
+        """Watch the watchlist files in a background thread and apply edits while the crawler runs"""
+        interval = self.config.get('watchlist_reload_interval')
+        if not interval:
+            return
+        self.reload_stop.clear()
+
+        def watch():
+            while not self.reload_stop.wait(interval):
+                try:
+                    self.reload_watchlists()
+                except Exception as e:
+                    self.log_and_flush('error', f"{self.symbols.get('error')} Could not reload watchlists: {e}")
+
+        self.reload_thread = threading.Thread(target=watch, name='WatchlistReloader', daemon=True)
+        self.reload_thread.start()
 
+    def stop_watchlist_reloader(self):
+        self.reload_stop.set()
+        if self.reload_thread:
+            self.reload_thread.join()
+            self.reload_thread = None
+    
     def find_rss_feeds(self, website_url: str) -> List[str]:
-        """Find RSS feeds for a website"""
+        """Find RSS feeds for a website (from the feed discovery cache while it is fresh)"""
+        cached = self.feed_cache.get(website_url)
+        if cached is not None:
+            return cached
+        
         feeds = []
         try:
-            response = self.session.get(website_url, timeout=self.config['timeout'])
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            # Look for RSS feed links
-            for link in soup.find_all('link', type=re.compile('rss|atom')):
-                if link.get('href'):
-                    feed_url = urljoin(website_url, link['href'])
-                    feeds.append(feed_url)
+            response = self.transport.fetch(website_url, max_bytes=self.config['max_page_bytes'])
+            if response.ok:
+                soup = BeautifulSoup(response.content, 'html.parser')
+                
+                # Look for RSS feed links
+                for link in soup.find_all('link', type=re.compile('rss|atom')):
+                    if link.get('href'):
+                        feed_url = urljoin(website_url, link['href'])
+                        feeds.append(feed_url)
             
-            # Common RSS paths
+            # Common RSS paths, probed concurrently
             common_paths = ['/rss', '/feed', '/rss.xml', '/feed.xml', '/atom.xml']
-            for path in common_paths:
+            
+            def probe(path: str) -> Tuple[Optional[str], bool]:
+                """(feed URL or None, whether a miss is definite: 404/410)"""
                 potential_feed = urljoin(website_url, path)
                 try:
-                    feed_response = self.session.head(potential_feed, timeout=10)
+                    feed_response = self.transport.head(potential_feed, timeout=10)
+                    if feed_response.status_code == 405:
+                        # Server rejects HEAD: ask with a GET, without reading the body
+                        feed_response = self.transport.get(potential_feed, timeout=10, stream=True, allow_redirects=False)
+                        feed_response.close()
                     if feed_response.status_code == 200:
-                        feeds.append(potential_feed)
-                except:
-                    pass
+                        return potential_feed, False
+                    return None, feed_response.status_code in (404, 410)
+                except Exception:
+                    # Timeouts, resets and deadlines say nothing about the feed
+                    return None, False
+            
+            with ThreadPoolExecutor(max_workers=len(common_paths)) as executor:
+                probes = list(executor.map(probe, common_paths))
+            feeds.extend(feed for feed, _ in probes if feed)
+            
+            # Remember the result until it is due for revalidation. "No feeds" is only
+            # cached when it is certain; anything temporary is rediscovered next time.
+            feeds = list(dict.fromkeys(feeds))
+            if response.ok and (feeds or all(definite for _, definite in probes)):
+                self.feed_cache.store(website_url, feeds)
                     
         except Exception as e:
             self.logger.error(f"Error finding RSS feeds for {website_url}: {e}")
         
-        return list(set(feeds))  # Remove duplicates
+        return list(dict.fromkeys(feeds))  # Remove duplicates
 
-    def parse_rss_feed(self, feed_url: str) -> List[str]:
-        """Parse RSS feed and extract article URLs"""
+    def parse_rss_feed(self, feed_url: str, validators: Dict = None) -> List[str]:
+        """Parse RSS feed and extract article URLs.
+
+        If a validators dict is given, the request is conditional on its ETag /
+        Last-Modified values, which are then updated in place; an unchanged feed
+        (304) yields no URLs.
+        """
         article_urls = []
         try:
-            feed = feedparser.parse(feed_url)
-            for entry in feed.entries[:self.config['max_articles_per_site']]:
-                if hasattr(entry, 'link'):
-                    article_urls.append(entry.link)
-                    
-                    # Log individual URLs if enabled
-                    if self.config.get('log_urls', False):
-                        self.logger.debug(f"RSS URL: {entry.link}")
-                    
-                    # Log detailed URL info if enabled
-                    if self.config.get('log_url_details', False):
-                        title = getattr(entry, 'title', 'No title')
-                        published = getattr(entry, 'published', 'No date')
-                        # Clean Unicode characters that might cause encoding issues
-                        title = self.symbols.clean_unicode_for_logging(title)
-                        published = self.symbols.clean_unicode_for_logging(published)
-                        self.logger.debug(f"RSS URL: {entry.link} | Title: {title} | Date: {published}")
+            headers = {}
+            if validators:
+                if validators.get('etag'):
+                    headers['If-None-Match'] = validators['etag']
+                if validators.get('last_modified'):
+                    headers['If-Modified-Since'] = validators['last_modified']
+            response = self.transport.fetch(feed_url, max_bytes=self.config['max_feed_bytes'], allowed_types=FEED_CONTENT_TYPES,
+                                            headers=headers)
+            if response.status_code == 304:
+                return article_urls
+            if self.archive and response.ok:
+                self.archive.append(response, 'feed', feed_url)
+            if validators is not None:
+                validators.clear()
+                if response.headers.get('ETag'):
+                    validators['etag'] = response.headers['ETag']
+                if response.headers.get('Last-Modified'):
+                    validators['last_modified'] = response.headers['Last-Modified']
+            for entry in self.read_feed_entries(response):
+                article_urls.append(entry.link)
+                self.record_url_timestamp(entry.link, entry.timestamp)
+                
+                # Log individual URLs if enabled
+                if self.config.get('log_urls', False):
+                    self.logger.debug(f"RSS URL: {entry.link}")
+                
+                # Log detailed URL info if enabled
+                if self.config.get('log_url_details', False):
+                    # Clean Unicode characters that might cause encoding issues
+                    title = self.symbols.clean_unicode_for_logging(entry.title or 'No title')
+                    published = self.symbols.clean_unicode_for_logging(entry.published or 'No date')
+                    self.logger.debug(f"RSS URL: {entry.link} | Title: {title} | Date: {published}")
                         
         except Exception as e:
             self.logger.error(f"Error parsing RSS feed {feed_url}: {e}")
         
         return article_urls
 
+    def read_feed_entries(self, response: requests.Response) -> List[FeedEntry]:
+        """Read the first max_articles_per_site entries of a fetched feed.
+
+        The streaming parser handles well-formed feeds; anything it rejects
+        (HTML entities in XML, broken markup, non-feed pages) goes to feedparser.
+        """
+        limit = self.config['max_articles_per_site']
+        if self.config.get('streaming_feed_parser', True):
+            try:
+                entries = StreamingFeedParser.parse(response.content, limit)
+                with self.lock:
+                    self.stats['feeds_streamed'] += 1
+                for entry in entries:
+                    entry.link = urljoin(response.url, entry.link)
+                return entries
+            except (ElementTree.ParseError, ValueError) as e:
+                self.logger.debug(f"Streaming parser could not read feed {response.url} ({e}), using feedparser")
+        
+        feed = feedparser.parse(response.content, response_headers=dict(response.headers))
+        with self.lock:
+            self.stats['feeds_feedparser'] += 1
+        entries = []
+        for entry in feed.entries[:limit]:
+            if hasattr(entry, 'link'):
+                entries.append(FeedEntry(
+                    link=entry.link,
+                    title=entry.get('title', ''),
+                    summary=entry.get('summary', ''),
+                    content=entry.content[0].get('value', '') if entry.get('content') else '',
+                    published=entry.get('published') or entry.get('updated'),
+                    timestamp=UrlFrontier.parse_timestamp(entry.get('published_parsed') or entry.get('updated_parsed')),
+                ))
+        return entries
+
     def find_sitemap_urls(self, website_url: str) -> List[str]:
         """Find and parse sitemap URLs"""
         article_urls = []
-        sitemap_urls = [
-            urljoin(website_url, '/sitemap.xml'),
-            urljoin(website_url, '/sitemap_index.xml'),
-            urljoin(website_url, '/news-sitemap.xml')
-        ]
+        # Sitemaps declared in robots.txt replace guessing common paths
+        sitemap_urls = self.robots.sitemaps(website_url) if self.robots else []
+        if not sitemap_urls:
+            sitemap_urls = [
+                urljoin(website_url, '/sitemap.xml'),
+                urljoin(website_url, '/sitemap_index.xml'),
+                urljoin(website_url, '/news-sitemap.xml')
+            ]
+        followed_indexes = 0
         
         for sitemap_url in sitemap_urls:
             try:
-                response = self.session.get(sitemap_url, timeout=self.config['timeout'])
+                response = self.transport.fetch(sitemap_url, max_bytes=self.config['max_feed_bytes'], allowed_types=FEED_CONTENT_TYPES)
                 if response.status_code == 200:
                     soup = BeautifulSoup(response.content, 'xml')
                     
+                    # Sitemap index: queue its newest child sitemaps (news sitemaps first)
+                    if soup.find('sitemapindex') is not None:
+                        if followed_indexes < 3:
+                            followed_indexes += 1
+                            children = [(sitemap.find('loc').text.strip(),
+                                         UrlFrontier.parse_timestamp(sitemap.find('lastmod').text) if sitemap.find('lastmod') else None)
+                                        for sitemap in soup.find_all('sitemap') if sitemap.find('loc')]
+                            children.sort(key=lambda child: ('news' not in child[0].lower(), -(child[1] or 0)))
+                            sitemap_urls.extend(url for url, _ in children[:5] if url not in sitemap_urls)
+                        continue
+                    
                     # Parse sitemap URLs
                     for loc in soup.find_all('loc'):
                         url = loc.text.strip()
                         if any(keyword in url.lower() for keyword in ['news', 'article', 'post']):
                             article_urls.append(url)
                             
+                            # Publication date for the freshness frontier
+                            date_tag = loc.parent.find('publication_date') or loc.parent.find('lastmod')
+                            if date_tag:
+                                self.record_url_timestamp(url, UrlFrontier.parse_timestamp(date_tag.text))
+                            
                             # Log individual URLs if enabled
                             if self.config.get('log_urls', False):
                                 self.logger.debug(f"Sitemap URL: {url}")
@@ -844,19 +3535,20 @@ class NewsWebsiteCrawler:
                                 clean_sitemap_url = self.symbols.clean_unicode_for_logging(sitemap_url)
                                 self.logger.debug(f"Sitemap URL: {clean_url} | From: {clean_sitemap_url}")
                 
-                if len(article_urls) >= self.config['max_articles_per_site']:
+                # Sitemaps are often oldest-first, so read more than needed and keep the newest
+                if len(article_urls) >= self.config['max_articles_per_site'] * 10:
                     break
                     
             except Exception as e:
                 self.logger.debug(f"Sitemap not found or error: {sitemap_url} - {e}")
         
-        return article_urls[:self.config['max_articles_per_site']]
+        return self.prioritize_urls(article_urls)[:self.config['max_articles_per_site']]
 
     def crawl_website_links(self, website_url: str) -> List[str]:
         """Crawl website homepage for article links"""
         article_urls = []
         try:
-            response = self.session.get(website_url, timeout=self.config['timeout'])
+            response = self.transport.fetch(website_url, max_bytes=self.config['max_page_bytes'])
             soup = BeautifulSoup(response.content, 'html.parser')
             
             # Look for article links
@@ -909,124 +3601,301 @@ class NewsWebsiteCrawler:
         url_lower = url.lower()
         return any(re.search(indicator, url_lower) for indicator in article_indicators)
 
-    def extract_article_content(self, url: str) -> CrawlResult:
-        """Extract article content using multiple methods"""
+    EXTRACTION_METHODS = ('structured', 'newspaper', 'soup')
+    CONTENT_SELECTORS = ['article', '.article-content', '.post-content',
+                         '.entry-content', '.content', 'main', '.main-content']
+    DATE_META_NAMES = ['article:published_time', 'datePublished', 'pubdate', 'date', 'dc.date']
+
+    def extract_article_content(self, url: str, response: requests.Response = None) -> CrawlResult:
+        """Extract article content using multiple methods (from an already fetched or archived response if given).
+
+        The cheap structured data pass always runs first; then the method the
+        host's extraction profile has promoted, so known sites skip the
+        attempts that lose on them.
+        """
         result = CrawlResult(url=url)
         
         try:
-            # Method 1: newspaper3k (if available)
-            if HAS_NEWSPAPER:
-                try:
-                    article = Article(url)
-                    article.download()
-                    article.parse()
-                    
-                    result.title = article.title or ""
-                    result.content = article.text or ""
-                    result.article_date = str(article.publish_date) if article.publish_date else None
-                    result.metadata = {
-                        'authors': article.authors,
-                        'keywords': article.keywords,
-                        'summary': article.summary,
-                        'meta_keywords': article.meta_keywords
-                    }
-                    
-                    # If newspaper extraction successful, return
-                    if result.title and len(result.content) > self.config['content_min_length']:
-                        return result
-                        
-                except Exception as e:
-                    self.logger.debug(f"Newspaper extraction failed for {url}: {e}")
-            
-            # Method 2: BeautifulSoup fallback
-            response = self.session.get(url, timeout=self.config['timeout'])
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            # Extract title
-            title_elem = soup.find('title') or soup.find('h1')
-            result.title = title_elem.get_text(strip=True) if title_elem else ""
-            
-            # Extract content
-            content_selectors = [
-                'article', '.article-content', '.post-content', 
-                '.entry-content', '.content', 'main', '.main-content'
-            ]
+            # Download once through the shared transport; all extractors use this page
+            if response is None:
+                response = self.transport.fetch(url, max_bytes=self.config['max_page_bytes'], breaker=self.breaker)
+                if self.archive and response.ok:
+                    self.archive.append(response, 'page', url)
+            result.status_code = response.status_code
+            result.final_url = response.url
+            result.canonical_url = self.find_canonical_link(response.text, response.url)
             
-            content_text = ""
-            for selector in content_selectors:
-                elem = soup.select_one(selector)
-                if elem:
-                    content_text = elem.get_text(separator=' ', strip=True)
-                    if len(content_text) > self.config['content_min_length']:
-                        break
+            host = urlparse(response.url).hostname or ''
+            profile = self.extraction_profiles.get(host) if self.extraction_profiles is not None else None
+            promoted = self.extraction_profiles is not None and self.extraction_profiles.promoted(profile)
+            fallback = None
+            for method in self.extraction_order(profile if promoted else None):
+                self.transport.check_deadline(f"extracting {url}")
+                extracted = self.run_extractor(method, url, response, profile)
+                if extracted is None:
+                    continue
+                if extracted['title'] and len(extracted['content']) > self.config['content_min_length']:
+                    self.apply_extraction(result, extracted)
+                    self.record_extraction(host, method, extracted, first_try=promoted and method == profile['method'])
+                    return result
+                if method == 'soup':
+                    fallback = extracted
             
-            result.content = content_text
-            
-            # Extract metadata
-            meta_tags = soup.find_all('meta')
-            metadata = {}
-            for tag in meta_tags:
-                name = tag.get('name') or tag.get('property') or tag.get('itemprop')
-                content = tag.get('content')
-                if name and content:
-                    metadata[name] = content
-            
-            result.metadata = metadata
+            # Nothing produced a full article: keep what the BeautifulSoup pass found
+            if fallback:
+                self.apply_extraction(result, fallback)
                 
+        except ResponseSkipped as e:
+            result.error = str(e)
+            self.logger.debug(str(e))
+        except (RetryableFetchError, CircuitOpenError, DeadlineExceeded):
+            raise
         except Exception as e:
             result.error = str(e)
             self.logger.error(f"Error extracting content from {url}: {e}")
         
         return result
 
-    def analyze_content(self, result: CrawlResult) -> CrawlResult:
-        """Analyze content for companies and keywords with improved detection"""
-        # Include URL in search text for better detection
-        url_text = result.url.lower() if result.url else ""
-        search_text = f"{result.title} {result.content} {url_text}".lower()
-        meta_text = " ".join(str(v) for v in result.metadata.values()).lower()
+    def extraction_order(self, profile: Optional[Dict]) -> List[str]:
+        """Extraction methods to try: structured data first, then the host's promoted winner"""
+        methods = [method for method in self.EXTRACTION_METHODS
+                   if self.config.get('structured_data_fast_path', True) or method != 'structured']
+        if profile and profile['method'] in methods and profile['method'] != 'structured':
+            methods.remove(profile['method'])
+            methods.insert(1 if methods and methods[0] == 'structured' else 0, profile['method'])
+        return methods
+
+    def run_extractor(self, method: str, url: str, response: requests.Response, profile: Optional[Dict]) -> Optional[Dict]:
+        """Run one extraction method: a dict of title/content/date/metadata (and selector), or None if it can't run"""
+        if method == 'structured':
+            # Structured data (JSON-LD / OpenGraph) found by a regex pre-scan, no DOM parse
+            return self.extract_structured_data(response.text) if response.ok else None
         
-        if not self.config['case_sensitive']:
-            keywords = [k.lower() for k in self.keywords]
-        else:
-            keywords = self.keywords
+        if method == 'newspaper':
+            if not (HAS_NEWSPAPER and response.ok):
+                return None
+            try:
+                article = Article(url)
+                article.download(input_html=response.text)
+                article.parse()
+                return {
+                    'title': article.title or "",
+                    'content': article.text or "",
+                    'date': str(article.publish_date) if article.publish_date else None,
+                    'metadata': {
+                        'authors': article.authors,
+                        'keywords': article.keywords,
+                        'summary': article.summary,
+                        'meta_keywords': article.meta_keywords
+                    },
+                }
+            except Exception as e:
+                self.logger.debug(f"Newspaper extraction failed for {url}: {e}")
+                return None
         
-        # Find companies using improved alias detection
-        found_company_aliases = set()
+        # BeautifulSoup fallback
+        soup = BeautifulSoup(response.content, 'html.parser')
         
-        for company_alias in self.companies:
-            company_alias_lower = company_alias.lower()
-            if company_alias_lower in search_text or company_alias_lower in meta_text:
-                found_company_aliases.add(company_alias)
+        # Extract title
+        title_elem = soup.find('title') or soup.find('h1')
+        title = title_elem.get_text(strip=True) if title_elem else ""
         
-        # Map found aliases back to original company names
-        for original_company, aliases in self.company_aliases.items():
-            # Check if any alias of this company was found
-            if any(alias in found_company_aliases for alias in aliases):
-                result.found_companies.add(original_company)
+        # Extract content, starting with the selector that worked on this host before
+        selectors = list(self.CONTENT_SELECTORS)
+        if profile and profile['method'] == 'soup' and profile.get('selector'):
+            selectors.insert(0, profile['selector'])
+        content_text = ""
+        winner = None
+        for selector in dict.fromkeys(selectors):
+            elem = soup.select_one(selector)
+            if elem:
+                content_text = elem.get_text(separator=' ', strip=True)
+                if len(content_text) > self.config['content_min_length']:
+                    winner = selector
+                    break
         
-        # If companies found, check for keywords
-        if result.found_companies:
-            for keyword in keywords:
-                keyword_lower = keyword.lower() if not self.config['case_sensitive'] else keyword
-                if keyword_lower in search_text:
-                    result.found_keywords.add(keyword)
+        # Extract metadata
+        metadata = {}
+        for tag in soup.find_all('meta'):
+            name = tag.get('name') or tag.get('property') or tag.get('itemprop')
+            content = tag.get('content')
+            if name and content:
+                metadata[name] = content
+        date = next((metadata[name] for name in self.DATE_META_NAMES if metadata.get(name)), None)
         
-        return result
+        return {'title': title, 'content': content_text, 'date': date, 'metadata': metadata, 'selector': winner}
 
-    def process_article(self, url: str) -> Optional[CrawlResult]:
-        """Process a single article URL"""
+    @staticmethod
+    def apply_extraction(result: CrawlResult, extracted: Dict):
+        result.title = extracted['title']
+        result.content = extracted['content']
+        result.article_date = extracted['date']
+        result.metadata = extracted['metadata']
+
+    def record_extraction(self, host: str, method: str, extracted: Dict, first_try: bool):
+        """Count a successful extraction and update the host's extraction profile"""
         with self.lock:
-            if url in self.processed_urls:
+            if method == 'structured':
+                self.stats['structured_data_extractions'] += 1
+            if first_try:
+                self.stats['profile_first_try'] += 1
+        # Structured data always runs first, so its wins say nothing about the profiled stage
+        if self.extraction_profiles is None or method == 'structured':
+            return
+        change = self.extraction_profiles.record(host, method, extracted.get('selector'), len(extracted['content']))
+        if change == 'relearned':
+            with self.lock:
+                self.stats['profiles_relearned'] += 1
+            self.logger.info(f"Extraction profile for {host} dropped after repeated misses, relearning")
+
+    def find_canonical_link(self, html: str, base_url: str) -> Optional[str]:
+        """Find the page's <link rel="canonical"> target (ignoring canonicals that point at a homepage)"""
+        for tag in re.findall(r'<link\b[^>]*>', html[:200000], re.IGNORECASE):
+            if not re.search(r'rel\s*=\s*["\']?canonical\b', tag, re.IGNORECASE):
+                continue
+            href = re.search(r'href\s*=\s*["\']([^"\']+)["\']', tag, re.IGNORECASE)
+            if href:
+                canonical = urljoin(base_url, href.group(1).strip())
+                if urlparse(canonical).path.strip('/'):
+                    return canonical
+            break
+        return None
+
+    ARTICLE_TYPES = {'newsarticle', 'article', 'reportagenewsarticle', 'analysisnewsarticle', 'blogposting',
+                     'opinionnewsarticle', 'reviewnewsarticle', 'backgroundnewsarticle', 'liveblogposting', 'report'}
+
+    def extract_structured_data(self, html: str) -> Dict:
+        """Read title, body, date and meta tags from JSON-LD and OpenGraph markup without building a DOM.
+
+        Returns title/content/date (empty when the page has no usable structured
+        data) and a metadata dict shaped like the BeautifulSoup fallback's, so
+        company and keyword matching sees the same meta values either way.
+        """
+        metadata = {}
+        for tag in re.findall(r'<meta\b[^>]*>', html[:300000], re.IGNORECASE):
+            attrs = {name.lower(): unescape(next(v for v in values if v))
+                     for name, *values in re.findall(r'([\w:-]+)\s*=\s*(?:"([^"]*)"|\'([^\']*)\'|([^\s>]+))', tag)
+                     if any(values)}
+            name = attrs.get('name') or attrs.get('property') or attrs.get('itemprop')
+            if name and attrs.get('content'):
+                metadata[name] = attrs['content']
+
+        article = None
+        for block in re.findall(r'<script[^>]+type\s*=\s*["\']?application/ld\+json["\']?[^>]*>(.*?)</script>',
+                                html, re.IGNORECASE | re.DOTALL):
+            try:
+                data = json.loads(block.strip())
+            except ValueError:
+                continue
+            candidates = data if isinstance(data, list) else [data]
+            while candidates and article is None:
+                item = candidates.pop(0)
+                if not isinstance(item, dict):
+                    continue
+                candidates.extend(item.get('@graph', []) if isinstance(item.get('@graph'), list) else [])
+                types = item.get('@type', [])
+                types = types if isinstance(types, list) else [types]
+                if any(str(t).lower() in self.ARTICLE_TYPES for t in types) and (item.get('headline') or item.get('articleBody')):
+                    article = item
+            if article is not None:
+                break
+
+        article = article or {}
+        title = article.get('headline') or metadata.get('og:title') or ''
+        content = article.get('articleBody') or ''
+        if isinstance(content, list):
+            content = ' '.join(str(part) for part in content)
+        date = article.get('datePublished') or metadata.get('article:published_time')
+
+        keywords = article.get('keywords')
+        if keywords:
+            metadata.setdefault('keywords', ', '.join(str(k) for k in keywords) if isinstance(keywords, list) else str(keywords))
+        if article.get('description'):
+            metadata.setdefault('description', str(article['description']))
+        authors = article.get('author')
+        authors = authors if isinstance(authors, list) else [authors] if authors else []
+        author_names = [author.get('name') if isinstance(author, dict) else author for author in authors]
+        if any(author_names):
+            metadata.setdefault('author', ', '.join(str(name) for name in author_names if name))
+
+        return {
+            'title': unescape(str(title)).strip(),
+            'content': re.sub(r'\s+', ' ', unescape(re.sub(r'<[^>]+>', ' ', str(content)))).strip(),
+            'date': str(date) if date else None,
+            'metadata': metadata,
+        }
+
+    def stored_content_chars(self) -> int:
+        """Content chars kept per match; 0 (full text) when a results database indexes it"""
+        if any('sqlite' in watchlist.output_formats for watchlist in self.watchlists):
+            return 0
+        return self.config.get('result_content_chars', 500)
+
+    def analyze_content(self, result: CrawlResult) -> CrawlResult:
+        """Match the article against all watchlists in one pass; found_* hold the union over watchlists"""
+        result.watchlists = self.matcher.match(result)
+        for companies, keywords in result.watchlists.values():
+            result.found_companies.update(companies)
+            result.found_keywords.update(keywords)
+        return result
+
+    def process_article(self, url: str, attempt: int = 0) -> Optional[CrawlResult]:
+        """Process a single article URL (attempt > 0 for a retry from the retry queue)"""
+        if attempt == 0:
+            # Go straight to a known redirect target and dedup on the canonical form
+            url = self.canonicalizer.resolve(url)
+            if not self.processed_urls.add(self.canonicalizer.canonicalize(url)):
                 return None
-            self.processed_urls.add(url)
-            self.stats['total_urls_processed'] += 1
+            with self.lock:
+                self.stats['total_urls_processed'] += 1
+        
+        host = urlparse(url).hostname or ''
+        wait_seconds = self.breaker.retry_in(host) if self.breaker else 0
+        if wait_seconds:
+            self.defer_for_breaker(url, attempt, wait_seconds)
+            return None
         
         try:
             time.sleep(self.config['request_delay'])
             
-            result = self.extract_article_content(url)
-            result = self.analyze_content(result)
+            # Download, parse and match share one wall-clock deadline
+            started = time.monotonic()
+            try:
+                with self.transport.deadline(self.config.get('article_deadline')):
+                    result = self.extract_article_content(url)
+                    self.transport.check_deadline(f"matching {url}")
+                    if not self.is_duplicate_article(url, result):
+                        result = self.analyze_content(result)
+                        duplicate = False
+                    else:
+                        duplicate = True
+            except RetryableFetchError as e:
+                self.record_host_outcome(host, str(e))
+                self.schedule_retry(url, attempt, e)
+                return None
+            except CircuitOpenError as e:
+                self.defer_for_breaker(url, attempt, e.retry_after)
+                return None
+            except DeadlineExceeded as e:
+                # Time lost queueing for a slot or parsing is not the host's fault
+                if e.host_fault:
+                    self.record_host_outcome(host, str(e))
+                with self.lock:
+                    self.stats['deadline_exceeded'] += 1
+                    self.stats['errors'] += 1
+                    self.article_times.append(time.monotonic() - started)
+                self.log_and_flush('warning', f"{self.symbols.get('clock')} Gave up on {url} after "
+                                              f"{self.config['article_deadline']}s: {e}")
+                return None
+            with self.lock:
+                self.article_times.append(time.monotonic() - started)
+            self.record_host_outcome(host, self.fetch_failure(result))
+            if duplicate:
+                with self.lock:
+                    self.stats['duplicates_skipped'] += 1
+                if self.config.get('log_urls', False):
+                    self.logger.debug(f"Duplicate article skipped: {url} -> {result.canonical_url or result.final_url}")
+                return None
             
             # Update statistics
             with self.lock:
@@ -1045,8 +3914,12 @@ class NewsWebsiteCrawler:
                 
             # Only store results with companies found
             if result.found_companies:
+                stored = [StoredResult.from_crawl_result(result, self.stored_content_chars(), watchlist)
+                          for watchlist in result.watchlists]
+                # Under the lock, so the daemon can't swap the store out between these appends
                 with self.lock:
-                    self.results.append(result)
+                    for item in stored:
+                        self.results.append(item)
                 
                 # Create descriptive match message
                 companies_str = ', '.join(result.found_companies)
@@ -1072,6 +3945,8 @@ class NewsWebsiteCrawler:
                 self.log_and_flush('info', f"{self.symbols.get('target')} MATCH FOUND: '{title_short}'")
                 self.log_and_flush('info', f"   {self.symbols.get('bullet')} Companies mentioned: {', '.join(found_aliases_info)}")
                 self.log_and_flush('info', f"   {self.symbols.get('bullet')} Keywords found: {keywords_str}")
+                if len(self.watchlists) > 1:
+                    self.log_and_flush('info', f"   {self.symbols.get('bullet')} Watchlists: {', '.join(result.watchlists)}")
                 self.log_and_flush('info', f"   {self.symbols.get('bullet')} URL: {url}")
                                
                 # Log detailed match info if enabled
@@ -1088,13 +3963,187 @@ class NewsWebsiteCrawler:
                 self.stats['errors'] += 1
             return None
 
+    BLOCKING_STATUSES = (401, 402, 403, 451)
+
+    def fetch_failure(self, result: CrawlResult) -> Optional[str]:
+        """Why an article fetch counts as a failure for its host's circuit breaker (None if it doesn't)"""
+        if result.status_code in self.BLOCKING_STATUSES or (result.status_code or 0) >= 500:
+            return f"HTTP {result.status_code}"
+        if result.error:
+            # Skipped downloads (PDFs, video...) are not the host's fault
+            return None if result.status_code is None and result.error.startswith('Skipped ') else result.error
+        if not result.title and len(result.content) <= self.config['content_min_length']:
+            return "no article content (paywall or block page?)"
+        return None
+
+    def record_host_outcome(self, host: str, failure: Optional[str]):
+        """Feed a fetch outcome to the circuit breaker and log state changes"""
+        if not self.breaker:
+            return
+        change = self.breaker.record(host, failure)
+        if change == 'opened':
+            self.log_and_flush('warning', f"{self.symbols.get('warning')} Circuit opened for {host}: too many failures "
+                                          f"(last: {failure}); its URLs are "
+                                          f"{'deferred' if self.config['circuit_breaker_defer'] else 'skipped'} for now")
+        elif change == 'reopened':
+            self.log_and_flush('info', f"{self.symbols.get('warning')} Circuit for {host} stays open: probe failed ({failure})")
+        elif change == 'closed':
+            self.log_and_flush('info', f"{self.symbols.get('checkmark')} Circuit closed for {host}: probe succeeded")
+
+    def defer_for_breaker(self, url: str, attempt: int, delay: float):
+        """Put a URL of a host with an open circuit back on the retry queue, or skip it"""
+        if not self.config['circuit_breaker_defer'] or attempt >= self.config['max_retries']:
+            with self.lock:
+                self.stats['breaker_skipped'] += 1
+            self.logger.debug(f"Circuit open, skipping {url}")
+            return
+        # Exactly until the circuit's cooldown ends (CircuitOpenError.retry_after), not a fetch backoff
+        self.retry_queue.defer(url, attempt + 1, delay)
+        with self.lock:
+            self.stats['breaker_deferred'] += 1
+        self.logger.debug(f"Circuit open, deferring {url} by {delay:.0f}s")
+
+    def schedule_retry(self, url: str, attempt: int, error: RetryableFetchError):
+        """Put a failed fetch on the retry queue, or count it as an error once max_retries is used up"""
+        if attempt >= self.config['max_retries']:
+            with self.lock:
+                self.stats['retries_exhausted'] += 1
+                self.stats['errors'] += 1
+            self.logger.error(f"Giving up on {url} after {attempt + 1} attempts: {error}")
+            return
+        delay = self.retry_queue.schedule(url, attempt + 1, error.retry_after)
+        with self.lock:
+            self.stats['retries_scheduled'] += 1
+        self.logger.debug(f"Retrying {url} in {delay:.1f}s (attempt {attempt + 2}): {error}")
+
+    def is_duplicate_article(self, url: str, result: CrawlResult) -> bool:
+        """Record where a fetched URL really led; True if that article was already processed"""
+        key = self.canonicalizer.canonicalize(url)
+        target_keys = set()
+        # rel=canonical wins over the redirect target as the URL to remember
+        for target in (result.final_url, result.canonical_url):
+            if target and self.canonicalizer.canonicalize(target) != key:
+                self.canonicalizer.learn(url, target)
+                target_keys.add(self.canonicalizer.canonicalize(target))
+        
+        duplicate = False
+        for target_key in target_keys:
+            if not self.processed_urls.add(target_key):
+                duplicate = True
+        return duplicate
+
+    def filter_allowed_urls(self, urls: List[str]) -> List[str]:
+        """Drop URLs that robots.txt disallows, before they are queued for fetching"""
+        if not self.robots:
+            return urls
+        allowed = [url for url in urls if self.robots.allowed(url)]
+        if len(allowed) < len(urls):
+            with self.lock:
+                self.stats['robots_blocked'] += len(urls) - len(allowed)
+            self.logger.debug(f"Skipped {len(urls) - len(allowed)} URLs disallowed by robots.txt")
+        return allowed
+
+    def dedupe_urls(self, urls: List[str]) -> List[str]:
+        """Resolve known redirects and drop URLs that canonicalize to one already listed"""
+        seen = set()
+        unique = []
+        for url in urls:
+            resolved = self.canonicalizer.resolve(url)
+            if resolved != url:
+                self.record_url_timestamp(resolved, self.url_timestamps.get(self.canonicalizer.canonicalize(url)))
+                url = resolved
+            key = self.canonicalizer.canonicalize(url)
+            if key not in seen:
+                seen.add(key)
+                unique.append(url)
+        return unique
+
+    def record_url_timestamp(self, url: str, timestamp: Optional[float]):
+        """Remember when a discovered URL was published (newest date wins)"""
+        if timestamp is None:
+            return
+        key = self.canonicalizer.canonicalize(url)
+        with self.lock:
+            if timestamp > self.url_timestamps.get(key, float('-inf')):
+                self.url_timestamps[key] = timestamp
+
+    def freshness_cutoff(self) -> Optional[float]:
+        """Oldest publish time still worth fetching, from max_article_age_hours and the last run"""
+        cutoffs = []
+        if self.config.get('max_article_age_hours'):
+            cutoffs.append(time.time() - self.config['max_article_age_hours'] * 3600)
+        if self.config.get('skip_articles_before_last_run') and self.last_run_start:
+            cutoffs.append(self.last_run_start)
+        return max(cutoffs) if cutoffs else None
+
+    def prioritize_urls(self, urls: List[str]) -> List[str]:
+        """Order URLs newest first and drop those older than the freshness cutoff"""
+        frontier = UrlFrontier(self.freshness_cutoff())
+        for url in urls:
+            frontier.push(url, self.url_timestamps.get(self.canonicalizer.canonicalize(url)))
+        if frontier.dropped:
+            with self.lock:
+                self.stats['stale_urls_skipped'] += frontier.dropped
+            self.logger.debug(f"Skipped {frontier.dropped} URLs older than the freshness cutoff")
+        return frontier.drain()
+
+    def load_crawl_state(self) -> Dict:
+        """Load state kept between runs (e.g. when the last successful run started)"""
+        if os.path.exists(self.crawl_state_file):
+            try:
+                with open(self.crawl_state_file, 'r', encoding='utf-8') as f:
+                    return json.load(f)
+            except Exception:
+                return {}
+        return {}
+
+    def save_caches(self):
+        """Save the redirect, robots.txt, feed discovery and extraction profile caches"""
+        self.canonicalizer.save_cache()
+        if self.robots:
+            self.robots.save_cache()
+        self.feed_cache.save_cache()
+        if self.extraction_profiles is not None:
+            self.extraction_profiles.save_cache()
+
+    def save_crawl_state(self):
+        """Save state kept between runs"""
+        try:
+            os.makedirs(os.path.dirname(self.crawl_state_file), exist_ok=True)
+            with open(self.crawl_state_file, 'w', encoding='utf-8') as f:
+                json.dump(self.crawl_state, f, indent=2)
+        except Exception as e:
+            self.logger.warning(f"Could not save crawl state: {e}")
+
     def crawl_website(self, website_url: str) -> List[str]:
-        """Crawl a single website using multiple methods"""
+        """Crawl a single website using multiple methods, within the discovery deadline"""
         self.log_and_flush('info', f"{self.symbols.get('magnifying_glass')} Starting to crawl website: {website_url}")
         all_article_urls = []
         method_results = {}
         
+        with self.transport.deadline(self.config.get('discovery_deadline')):
+            self.discover_article_urls(website_url, all_article_urls, method_results)
+        
+        # Remove duplicates and URLs robots.txt disallows, then limit
+        unique_urls = self.prioritize_urls(self.filter_allowed_urls(self.dedupe_urls(all_article_urls)))[:self.config['max_articles_per_site']]
+        
+        # Create summary message
+        method_summary = ", ".join([f"{method}: {count}" for method, count in method_results.items()])
+        self.log_and_flush('info', f"{self.symbols.get('checkmark')} Completed crawling {website_url} - Found {len(unique_urls)} unique article URLs ({method_summary})")
+        
+        return unique_urls
+
+    def discover_article_urls(self, website_url: str, all_article_urls: List[str], method_results: Dict):
+        """Run each search method on a website, collecting article URLs (stops when the discovery deadline passes)"""
         for method in self.config['search_methods']:
+            try:
+                self.transport.check_deadline(f"discovering URLs on {website_url}")
+            except DeadlineExceeded:
+                with self.lock:
+                    self.stats['discovery_deadline_exceeded'] += 1
+                self.log_and_flush('warning', f"{self.symbols.get('clock')} Discovery deadline of {self.config['discovery_deadline']}s "
+                                              f"reached for {website_url}; skipping {method} and later methods")
+                return
             try:
                 if method == 'rss':
                     self.log_and_flush('info', f"{self.symbols.get('satellite')} Searching for RSS feeds on {website_url}")
@@ -1103,6 +4152,9 @@ class NewsWebsiteCrawler:
                         self.log_and_flush('info', f"{self.symbols.get('satellite')} Found {len(feeds)} RSS feed(s) for {website_url}")
                         for feed in feeds:
                             urls = self.parse_rss_feed(feed)
+                            if not urls:
+                                # A known feed that yields nothing may have moved: rediscover next run
+                                self.feed_cache.invalidate(website_url)
                             all_article_urls.extend(urls)
                             method_results['rss'] = method_results.get('rss', 0) + len(urls)
                             self.log_and_flush('info', f"{self.symbols.get('satellite')} RSS feed '{feed}' contained {len(urls)} article URLs")
@@ -1120,6 +4172,9 @@ class NewsWebsiteCrawler:
                         self.log_and_flush('info', f"{self.symbols.get('map')} No sitemap URLs found for {website_url}")
                 
                 elif method == 'crawl':
+                    if self.robots and not self.robots.allowed(website_url):
+                        self.log_and_flush('info', f"{self.symbols.get('spider')} Homepage of {website_url} is disallowed by robots.txt")
+                        continue
                     self.log_and_flush('info', f"{self.symbols.get('spider')} Crawling homepage links for {website_url}")
                     urls = self.crawl_website_links(website_url)
                     all_article_urls.extend(urls)
@@ -1131,18 +4186,108 @@ class NewsWebsiteCrawler:
                     
             except Exception as e:
                 self.log_and_flush('error', f"{self.symbols.get('error')} Error in {method} method for {website_url}: {e}")
+
+    ARCHIVE_CHUNK_PAGES = 500
+
+    def reprocess_archive(self):
+        """Offline backfill: re-run extraction and matching over every archived page, without network access.
+
+        Pages are split into chunks of archive index entries and processed by a
+        pool of worker processes, each holding this crawler's current matcher.
+        When a URL was archived more than once, the newest copy's match is kept.
+        """
+        archive = PageArchive(self.config['archive_dir'])
+        chunks = []
+        for segment in archive.segments():
+            pages = [entry for entry in PageArchive.read_index(segment) if entry['kind'] == 'page']
+            chunks += [(segment, pages[i:i + self.ARCHIVE_CHUNK_PAGES]) for i in range(0, len(pages), self.ARCHIVE_CHUNK_PAGES)]
+        total = sum(len(entries) for _, entries in chunks)
+        if not total:
+            self.log_and_flush('warning', f"{self.symbols.get('warning')} No archived pages found in {self.config['archive_dir']}")
+            return
         
-        # Remove duplicates and limit
-        unique_urls = list(set(all_article_urls))[:self.config['max_articles_per_site']]
-        
-        # Create summary message
-        method_summary = ", ".join([f"{method}: {count}" for method, count in method_results.items()])
-        self.log_and_flush('info', f"{self.symbols.get('checkmark')} Completed crawling {website_url} - Found {len(unique_urls)} unique article URLs ({method_summary})")
+        workers = min(self.config.get('archive_reprocess_workers') or os.cpu_count() or 1, len(chunks))
+        self.log_and_flush('info', f"{self.symbols.get('rocket')} Reprocessing {total} archived pages from "
+                                   f"{len(archive.segments())} segments with {workers} worker processes...")
+        latest: Dict[Tuple[str, str], Dict] = {}
+        done = 0
+        # spawn, not fork: the parent has logging and transport threads running
+        with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('spawn'),
+                                 initializer=_init_archive_worker,
+                                 initargs=(dict(self.config, result_content_chars=self.stored_content_chars()), self.matcher)) as executor:
+            futures = [executor.submit(_reprocess_archive_chunk, segment, entries) for segment, entries in chunks]
+            for future in as_completed(futures):
+                try:
+                    counts, matches = future.result()
+                except Exception as e:
+                    self.log_and_flush('error', f"{self.symbols.get('error')} Archive chunk failed: {e}")
+                    continue
+                for key, value in counts.items():
+                    self.stats[key] += value
+                for match in matches:
+                    key = (match['watchlist'], self.canonicalizer.canonicalize(match['url']))
+                    if key not in latest or match['crawl_timestamp'] > latest[key]['crawl_timestamp']:
+                        latest[key] = match
+                done += counts['total_urls_processed']
+                self.log_and_flush('info', f"{self.symbols.get('chart')} Reprocessed {done}/{total} archived pages, "
+                                           f"{len(latest)} matching articles so far")
         
-        return unique_urls
+        for match in latest.values():
+            self.results.append(StoredResult.from_dict(match))
+        self.save_results()
+        self.print_final_stats()
+        self.flush_logs()
+
+    @classmethod
+    def for_archive_worker(cls, config: Dict, matcher: WatchlistMatcher) -> 'NewsWebsiteCrawler':
+        """Crawler with only what extraction and matching need, for archive worker processes.
+
+        There is no logging pipeline, cache or crawl state, and no watchlist
+        loading or alias resolution: the parent's matcher is used as is.
+        """
+        crawler = cls.__new__(cls)
+        # Reading the archive must not write to it
+        crawler.config = dict(config, archive_pages=False)
+        crawler.symbols = UnicodeSafeFormatter()
+        crawler.logger = logging.getLogger(__name__)
+        crawler.init_article_processing(HttpTransport(config, host_count=1))
+        crawler.matcher = matcher
+        return crawler
+
+    def reprocess_archived_pages(self, segment: str, entries: List[Dict]) -> Tuple[Dict, List[Dict]]:
+        """Extract and match archived pages; returns (stats increments, matching results as dicts)"""
+        counts = {'total_urls_processed': 0, 'articles_with_companies': 0, 'articles_with_keywords': 0,
+                  'articles_with_both': 0, 'errors': 0}
+        matches = []
+        for entry, response in PageArchive.read_records(segment, entries):
+            result = self.extract_article_content(entry['url'], response)
+            result.crawl_timestamp = entry['fetched']
+            result = self.analyze_content(result)
+            counts['total_urls_processed'] += 1
+            counts['articles_with_companies'] += bool(result.found_companies)
+            counts['articles_with_keywords'] += bool(result.found_keywords)
+            counts['articles_with_both'] += bool(result.found_companies and result.found_keywords)
+            counts['errors'] += bool(result.error)
+            for watchlist in result.watchlists:
+                matches.append(StoredResult.from_crawl_result(result, self.config.get('result_content_chars', 500), watchlist).to_dict())
+        return counts, matches
 
     def run(self):
         """Main crawling execution"""
+        self.start_watchlist_reloader()
+        try:
+            self._run_phases()
+        finally:
+            self.stop_watchlist_reloader()
+            if self.profiler:
+                for report in self.profiler.finish():
+                    self.log_and_flush('info', f"{self.symbols.get('chart')} Profile report saved to: {report}")
+            self.flush_logs()
+
+    def _run_phases(self):
+        """Run URL discovery, article analysis and result saving"""
+        if self.profiler:
+            self.profiler.phase('discovery')
         self.log_and_flush('info', f"{self.symbols.get('rocket')} Starting news crawling process...")
         self.log_and_flush('info', f"{self.symbols.get('chart')} Configuration: {len(self.websites)} websites, {len(self.companies)} companies, {len(self.keywords)} keywords")
         
@@ -1150,6 +4295,7 @@ class NewsWebsiteCrawler:
         all_urls = []
         website_results = {}
         
+        self.prewarm_connections()
         self.log_and_flush('info', f"{self.symbols.get('magnifying_glass')} Phase 1: Discovering article URLs from {len(self.websites)} websites...")
         
         for i, website in enumerate(self.websites, 1):
@@ -1173,27 +4319,226 @@ class NewsWebsiteCrawler:
         
         if total_urls_found == 0:
             self.log_and_flush('warning', f"{self.symbols.get('warning')} No article URLs found! Check your website list and network connection.")
+            self.save_caches()
             return
         
+        # Newest articles across all sites are fetched first
+        all_urls = self.prioritize_urls(all_urls)
+        self.url_timestamps.clear()
+        
         self.log_and_flush('info', f"{self.symbols.get('magnifying_glass')} Phase 2: Analyzing {total_urls_found} articles for company and keyword matches...")
+        if self.profiler:
+            self.profiler.phase('analysis')
+        process_article = self.profiler.wrap(self.process_article) if self.profiler else self.process_article
         
-        # Process articles in parallel
-        with ThreadPoolExecutor(max_workers=self.config['max_workers']) as executor:
-            future_to_url = {executor.submit(self.process_article, url): url for url in all_urls}
+        # Process articles in parallel; failed fetches come back from the retry queue
+        # once their backoff has passed, while workers carry on with other URLs
+        with ThreadPoolExecutor(max_workers=worker_count(self.config)) as executor:
+            future_to_url = {executor.submit(process_article, url): url for url in all_urls}
+            pending = set(future_to_url)
+            finished = reported = 0
             
-            for i, future in enumerate(as_completed(future_to_url), 1):
-                try:
-                    future.result()
-                    if i % 10 == 0:  # Progress update every 10 articles
-                        self.print_progress(i, len(all_urls))
+            while pending or len(self.retry_queue):
+                for url, attempt in self.retry_queue.pop_due():
+                    future = executor.submit(process_article, url, attempt)
+                    future_to_url[future] = url
+                    pending.add(future)
+                next_retry = self.retry_queue.next_due()
+                timeout = max(next_retry - time.time(), 0) if next_retry is not None else None
+                if not pending:
+                    time.sleep(timeout or 0)
+                    continue
+                done, pending = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+                
+                for future in done:
+                    url = future_to_url.pop(future)
+                    try:
+                        future.result()
+                    except Exception as e:
+                        self.log_and_flush('error', f"{self.symbols.get('error')} Exception processing {url}: {e}")
+                    # Attempts that ended in a scheduled retry don't count as processed yet
+                    finished += 1
+                    completed = finished - self.stats['retries_scheduled'] - self.stats['breaker_deferred']
+                    if completed == reported:
+                        continue
+                    reported = completed
+                    if completed % 10 == 0:  # Progress update every 10 articles
+                        self.print_progress(completed, len(all_urls))
                     # Periodic summary every 25 articles
-                    self.log_periodic_summary(i, len(all_urls))
-                except Exception as e:
-                    url = future_to_url[future]
-                    self.log_and_flush('error', f"{self.symbols.get('error')} Exception processing {url}: {e}")
+                    self.log_periodic_summary(completed, len(all_urls))
         
         self.print_final_stats()
+        self.save_caches()
+        if self.profiler:
+            self.profiler.phase('save')
         self.save_results()
+        
+        self.crawl_state['last_successful_run_start'] = self.stats['start_time']
+        self.save_crawl_state()
+
+    def run_daemon(self):
+        """Run continuously: poll every source on its own adaptive schedule and process new articles as they appear"""
+        self.start_watchlist_reloader()
+        try:
+            self._run_daemon_loop()
+        finally:
+            self.stop_watchlist_reloader()
+            if self.profiler:
+                for report in self.profiler.finish():
+                    self.log_and_flush('info', f"{self.symbols.get('chart')} Profile report saved to: {report}")
+            self.flush_logs()
+
+    def stop_daemon(self, *args):
+        """Ask the daemon loop to finish (also used as a SIGTERM handler)"""
+        self.daemon_stop.set()
+
+    def _run_daemon_loop(self):
+        """Schedule polls, hand new URLs to the article workers and save matches periodically"""
+        self.poll_scheduler = PollScheduler(
+            min_interval=self.config['daemon_min_poll_interval'],
+            max_interval=self.config['daemon_max_poll_interval'],
+            initial_interval=self.config['daemon_initial_poll_interval'],
+            target_new_items=self.config['daemon_target_new_items'],
+        )
+        self.daemon_queued = UrlFingerprintSet()
+        self.stats.update({'polls': 0, 'new_urls_discovered': 0})
+        if threading.current_thread() is threading.main_thread():
+            signal.signal(signal.SIGTERM, self.stop_daemon)
+
+        self.log_and_flush('info', f"{self.symbols.get('rocket')} Starting daemon mode: {len(self.websites)} websites, {len(self.companies)} companies, {len(self.keywords)} keywords")
+        self.prewarm_connections()
+        self.refresh_poll_sources()
+        last_refresh = last_save = last_status = time.time()
+        in_flight = set()
+
+        poll_pool = ThreadPoolExecutor(max_workers=self.config['max_workers'], thread_name_prefix='Poll')
+        self.article_pool = ThreadPoolExecutor(max_workers=worker_count(self.config), thread_name_prefix='Article')
+        try:
+            while not self.daemon_stop.is_set():
+                now = time.time()
+                if now - last_refresh >= self.config['daemon_rediscover_hours'] * 3600:
+                    self.refresh_poll_sources()
+                    last_refresh = now
+
+                for source in self.poll_scheduler.due(now):
+                    with self.lock:
+                        if source['key'] in in_flight:
+                            continue
+                        in_flight.add(source['key'])
+                    future = poll_pool.submit(self.poll_source, source)
+                    future.add_done_callback(lambda f, key=source['key']: in_flight.discard(key))
+
+                for url, attempt in self.retry_queue.pop_due(now):
+                    self.article_pool.submit(self.process_article, url, attempt)
+
+                if now - last_save >= self.config['daemon_save_interval']:
+                    self.save_daemon_state()
+                    last_save = now
+                if now - last_status >= self.config['daemon_status_interval']:
+                    self.log_daemon_status()
+                    last_status = now
+
+                next_due = min((due for due in (self.poll_scheduler.next_due(), self.retry_queue.next_due()) if due is not None),
+                               default=None)
+                delay = next_due - time.time() if next_due is not None else 30
+                self.daemon_stop.wait(min(max(delay, 1), 30))
+        except KeyboardInterrupt:
+            self.log_and_flush('info', f"{self.symbols.get('warning')} Daemon interrupted by user")
+        finally:
+            self.daemon_stop.set()
+            self.log_and_flush('info', f"{self.symbols.get('clock')} Stopping daemon: finishing in-flight polls and articles...")
+            poll_pool.shutdown(wait=True)
+            self.article_pool.shutdown(wait=True)
+            self.log_daemon_status()
+            self.save_daemon_state()
+
+    def prewarm_connections(self):
+        """Resolve every website's host and open its pooled connection concurrently (if enabled)"""
+        if not self.config.get('prewarm_connections'):
+            return
+        started = time.time()
+        warmed, failed = self.transport.prewarm(self.websites)
+        self.log_and_flush('info', f"{self.symbols.get('globe')} Pre-warmed connections to {warmed} hosts in {time.time() - started:.1f}s"
+                                   + (f" ({failed} failed)" if failed else ""))
+
+    def refresh_poll_sources(self):
+        """(Re)discover the feeds, sitemaps and homepages to poll for every website"""
+        self.poll_scheduler.retain(self.websites)
+        added = 0
+        for website in self.websites:
+            try:
+                added += self.discover_poll_sources(website)
+            except Exception as e:
+                self.log_and_flush('error', f"{self.symbols.get('error')} Failed to discover sources for {website}: {e}")
+        self.log_and_flush('info', f"{self.symbols.get('satellite')} Polling {len(self.poll_scheduler)} sources ({added} new)")
+        self.poll_scheduler.save_cache()
+
+    def discover_poll_sources(self, website_url: str) -> int:
+        """Register a website's feeds, sitemaps and homepage with the poll scheduler; returns how many are new"""
+        added = 0
+        methods = self.config['search_methods']
+        if 'rss' in methods:
+            for feed in self.find_rss_feeds(website_url):
+                added += self.poll_scheduler.register('feed', feed, website_url)
+        if 'sitemap' in methods:
+            added += self.poll_scheduler.register('sitemap', website_url, website_url)
+        if 'crawl' in methods and (not self.robots or self.robots.allowed(website_url)):
+            added += self.poll_scheduler.register('homepage', website_url, website_url)
+        return added
+
+    def poll_source(self, source: Dict):
+        """Poll one source, queue its unseen article URLs for processing and reschedule it"""
+        validators = None
+        try:
+            with self.transport.deadline(self.config.get('discovery_deadline')):
+                if source['kind'] == 'feed':
+                    validators = dict(source.get('validators') or {})
+                    urls = self.parse_rss_feed(source['url'], validators)
+                elif source['kind'] == 'sitemap':
+                    urls = self.find_sitemap_urls(source['url'])
+                else:
+                    urls = self.crawl_website_links(source['url'])
+
+            urls = self.prioritize_urls(self.dedupe_urls(urls))
+            new_urls = [url for url in urls if self.daemon_queued.add(self.canonicalizer.canonicalize(url))]
+            new_urls = self.filter_allowed_urls(new_urls)
+            with self.lock:
+                for url in urls:
+                    self.url_timestamps.pop(self.canonicalizer.canonicalize(url), None)
+                self.stats['polls'] += 1
+                self.stats['new_urls_discovered'] += len(new_urls)
+
+            for url in new_urls:
+                self.article_pool.submit(self.process_article, url)
+        except Exception as e:
+            self.log_and_flush('error', f"{self.symbols.get('error')} Error polling {source['kind']} {source['url']}: {e}")
+            new_urls = []
+
+        interval = self.poll_scheduler.record_poll(source['key'], len(new_urls), validators)
+        if new_urls:
+            self.log_and_flush('info', f"{self.symbols.get('newspaper')} {len(new_urls)} new article(s) from {source['kind']} {source['url']} "
+                                       f"(next poll in {interval / 60:.0f} min)")
+
+    def save_daemon_state(self):
+        """Save matches found since the last save, plus caches and schedules"""
+        with self.lock:
+            results, self.results = self.results, ResultStore(spill_to_disk=self.config.get('spill_results_to_disk', False))
+        if results:
+            self.save_results(results)
+        results.close()
+        self.save_caches()
+        self.poll_scheduler.save_cache()
+        # The daemon's start time: everything since then has been (or is being) seen by this daemon
+        self.crawl_state['last_successful_run_start'] = self.stats['start_time']
+        self.save_crawl_state()
+
+    def log_daemon_status(self):
+        """Log a one-line daemon status summary"""
+        uptime = (time.time() - self.stats['start_time']) / 3600
+        self.log_and_flush('info', f"{self.symbols.get('chart')} Daemon status: up {uptime:.1f}h, {len(self.poll_scheduler)} sources, "
+                                   f"{self.stats['polls']} polls, {self.stats['new_urls_discovered']} new URLs, "
+                                   f"{self.stats['total_urls_processed']} articles processed, "
+                                   f"{self.stats['articles_with_companies']} matches")
 
     def print_progress(self, processed: int, total: int):
         """Print crawling progress with enhanced statistics"""
@@ -1203,14 +4548,12 @@ class NewsWebsiteCrawler:
         remaining = total - processed
         eta = remaining / rate if rate > 0 else 0
         
-        self.log_and_flush('info', f"{self.symbols.get('chart')} Progress Update:")
-        self.log_and_flush('info', f"   {self.symbols.get('bullet')} Articles processed: {processed}/{total} ({percent:.1f}%)")
-        self.log_and_flush('info', f"   {self.symbols.get('bullet')} Processing rate: {rate:.1f} articles/sec")
-        self.log_and_flush('info', f"   {self.symbols.get('bullet')} Estimated time remaining: {eta/60:.1f} minutes")
-        self.log_and_flush('info', f"   {self.symbols.get('bullet')} Articles with company matches: {self.stats['articles_with_companies']}")
-        self.log_and_flush('info', f"   {self.symbols.get('bullet')} Articles with keyword matches: {self.stats['articles_with_keywords']}")
-        self.log_and_flush('info', f"   {self.symbols.get('bullet')} Articles with both matches: {self.stats['articles_with_both']}")
-        self.log_and_flush('info', f"   {self.symbols.get('bullet')} Total matching articles found: {len(self.results)}")
+        self.log_and_flush('info', f"{self.symbols.get('chart')} Progress: {processed}/{total} ({percent:.1f}%) | "
+                                   f"{rate:.1f} articles/sec | ETA {eta/60:.1f} min | "
+                                   f"companies: {self.stats['articles_with_companies']}, "
+                                   f"keywords: {self.stats['articles_with_keywords']}, "
+                                   f"both: {self.stats['articles_with_both']} | "
+                                   f"matches saved: {len(self.results)}")
 
     def print_final_stats(self):
         """Print final crawling statistics with enhanced formatting"""
@@ -1235,6 +4578,69 @@ class NewsWebsiteCrawler:
         self.log_and_flush('info', f"{self.symbols.get('key')} Articles containing keywords: {self.stats['articles_with_keywords']}")
         self.log_and_flush('info', f"{self.symbols.get('target')} Articles with both companies and keywords: {self.stats['articles_with_both']}")
         self.log_and_flush('info', f"{self.symbols.get('error')} Processing errors: {self.stats['errors']}")
+        self.log_and_flush('info', f"{self.symbols.get('newspaper')} Duplicate articles skipped after redirect/canonical resolution: {self.stats['duplicates_skipped']}")
+        self.log_and_flush('info', f"{self.symbols.get('clock')} Stale URLs skipped by the freshness cutoff: {self.stats['stale_urls_skipped']}")
+        
+        # Connection reuse
+        transport_stats = self.transport.get_stats()
+        self.log_and_flush('info', f"{self.symbols.get('globe')} HTTP requests: {transport_stats['requests']} "
+                                   f"({transport_stats['connections_opened']} connections opened, "
+                                   f"{transport_stats['reuse_rate'] * 100:.1f}% keep-alive reuse)")
+        self.log_and_flush('info', f"{self.symbols.get('disk')} Downloaded {transport_stats['bytes_downloaded'] / 1048576:.1f} MB "
+                                   f"({transport_stats['skipped_content_type']} non-article responses aborted, "
+                                   f"{transport_stats['truncated']} bodies cut at the size cap)")
+        handshakes = transport_stats['handshakes']
+        if handshakes:
+            count = sum(timing['connections'] for timing in handshakes.values())
+            average = lambda key: sum(timing[key] * timing['connections'] for timing in handshakes.values()) / count
+            dns_cache = self.transport.dns_cache
+            dns_info = f", DNS cache hits {dns_cache.hits}/{dns_cache.hits + dns_cache.misses}" if dns_cache else ""
+            self.log_and_flush('info', f"{self.symbols.get('clock')} Handshakes: {count} connections, average DNS {average('dns_ms'):.0f} ms, "
+                                       f"connect {average('connect_ms'):.0f} ms, TLS {average('tls_ms'):.0f} ms{dns_info}")
+            slowest = sorted(handshakes.items(), key=lambda item: -(item[1]['connect_ms'] + item[1]['tls_ms']))[:5]
+            self.log_and_flush('info', f"   {self.symbols.get('bullet')} Slowest handshakes: " + ", ".join(
+                f"{host} ({timing['connect_ms']:.0f} ms connect, {timing['tls_ms']:.0f} ms TLS)" for host, timing in slowest))
+        if self.stats['feeds_streamed'] or self.stats['feeds_feedparser']:
+            self.log_and_flush('info', f"{self.symbols.get('satellite')} Feeds parsed: {self.stats['feeds_streamed']} streamed, "
+                                       f"{self.stats['feeds_feedparser']} with feedparser")
+        if self.stats['structured_data_extractions']:
+            self.log_and_flush('info', f"{self.symbols.get('newspaper')} Articles extracted from JSON-LD/OpenGraph: {self.stats['structured_data_extractions']}")
+        if self.extraction_profiles is not None and len(self.extraction_profiles):
+            self.log_and_flush('info', f"{self.symbols.get('newspaper')} Extraction profiles: {len(self.extraction_profiles)} hosts, "
+                                       f"{self.stats['profile_first_try']} articles extracted by the host's learned method first, "
+                                       f"{self.stats['profiles_relearned']} profiles relearned")
+        if self.archive and self.archive.records:
+            self.log_and_flush('info', f"{self.symbols.get('disk')} Archived {self.archive.records} pages and feeds "
+                                       f"({self.archive.bytes_written / 1048576:.1f} MB, {self.archive.compression}) to {self.archive.directory}")
+        if self.stats['robots_blocked']:
+            self.log_and_flush('info', f"{self.symbols.get('warning')} URLs disallowed by robots.txt: {self.stats['robots_blocked']}")
+        if self.stats['retries_scheduled'] or self.stats['retries_exhausted']:
+            average_delay = self.retry_queue.total_delay / self.retry_queue.scheduled if self.retry_queue.scheduled else 0
+            self.log_and_flush('info', f"{self.symbols.get('clock')} Retries: {self.stats['retries_scheduled']} scheduled "
+                                       f"(average delay {average_delay:.1f}s), {self.stats['retries_exhausted']} URLs gave up after {self.config['max_retries']} retries")
+        tripped = self.breaker.tripped() if self.breaker else {}
+        if tripped:
+            self.log_and_flush('info', f"{self.symbols.get('warning')} Circuit breaker tripped for {len(tripped)} hosts "
+                                       f"({self.stats['breaker_deferred']} deferrals, {self.stats['breaker_skipped']} URLs skipped):")
+            for host, state in sorted(tripped.items(), key=lambda item: -item[1]['refused']):
+                self.log_and_flush('info', f"   {self.symbols.get('bullet')} {host}: {state['state']}, opened {state['trips']}x, "
+                                           f"{state['refused']} requests refused, last failure: {state['last_failure']}")
+        if self.article_times:
+            self.log_and_flush('info', f"{self.symbols.get('clock')} Article time: p50 {percentile(self.article_times, 50):.1f}s, "
+                                       f"p95 {percentile(self.article_times, 95):.1f}s, p99 {percentile(self.article_times, 99):.1f}s, "
+                                       f"max {max(self.article_times):.1f}s ({self.stats['deadline_exceeded']} hit the "
+                                       f"{self.config['article_deadline']}s deadline, {self.transport.watchdog.aborted} downloads aborted)")
+        if self.stats['discovery_deadline_exceeded']:
+            self.log_and_flush('info', f"{self.symbols.get('clock')} Websites cut short by the discovery deadline: {self.stats['discovery_deadline_exceeded']}")
+        concurrency = transport_stats['concurrency']
+        if concurrency['enabled']:
+            self.log_and_flush('info', f"{self.symbols.get('chart')} Concurrency: limit {concurrency['global_limit']} "
+                                       f"(peak {concurrency['peak_global_limit']}), {concurrency['throttled']} throttled responses, "
+                                       f"{concurrency['host_decreases']} host limit cuts, {concurrency['retry_after_pauses']} Retry-After pauses")
+            slowest = sorted(concurrency['host_p95'].items(), key=lambda item: -item[1])[:5]
+            if slowest:
+                self.log_and_flush('info', f"   {self.symbols.get('bullet')} Slowest hosts (p95): " + ", ".join(
+                    f"{host} {p95:.1f}s{' [1 slot]' if host in concurrency['slow_hosts'] else ''}" for host, p95 in slowest))
         
         # Success rates
         if self.stats['total_urls_processed'] > 0:
@@ -1250,22 +4656,49 @@ class NewsWebsiteCrawler:
             self.log_and_flush('info', f"   {self.symbols.get('bullet')} Error rate: {error_rate:.1f}%")
         
         self.log_and_flush('info', f"{self.symbols.get('disk')} Total matching articles saved: {len(self.results)}")
+        if len(self.watchlists) > 1:
+            per_watchlist = Counter(result.watchlist for result in self.results)
+            for watchlist in self.watchlists:
+                self.log_and_flush('info', f"   {self.symbols.get('bullet')} {watchlist.name}: {per_watchlist.get(watchlist.name, 0)}")
+        if self.stats['watchlist_reloads']:
+            self.log_and_flush('info', f"{self.symbols.get('folder')} Watchlist files reloaded during the run: {self.stats['watchlist_reloads']}x")
         self.log_and_flush('info', self.symbols.get('equals') * 80)
 
-    def save_results(self):
-        """Save results in multiple formats with enhanced logging"""
-        if not self.results:
+    def save_results(self, results: ResultStore = None):
+        """Save results in multiple formats with enhanced logging, routed to each watchlist's output targets"""
+        if results is None:
+            results = self.results
+        if not results:
             self.log_and_flush('warning', f"{self.symbols.get('warning')} No results to save - no matching articles were found.")
             return
             
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        self.log_and_flush('info', f"{self.symbols.get('disk')} Saving {len(self.results)} matching articles to output files...")
+        counts = Counter(result.watchlist for result in results)
+        for name, count in counts.items():
+            watchlist = next((w for w in self.watchlists if w.name == name), None)
+            if watchlist is None:
+                # Results of a watchlist that is no longer configured (e.g. merged from older workers)
+                output_dir = os.path.join('output', name)
+                watchlist = Watchlist(name, {}, [], output_formats=self.config['output_formats'], output_dir=output_dir,
+                                      results_db_path=os.path.join(output_dir, 'news_results.db'))
+            # Each output format streams the store again, so spilled results are never loaded whole
+            selected = results.select(name) if len(counts) > 1 else results
+            self.save_watchlist_results(watchlist, selected, count, timestamp)
         
-        if 'json' in self.config['output_formats']:
-            json_file = f"output/news_results_{timestamp}.json"
+        self.log_and_flush('info', f"{self.symbols.get('folder')} All results have been saved successfully!")
+
+    def save_watchlist_results(self, watchlist: Watchlist, results, count: int, timestamp: str):
+        """Write one watchlist's results to its output formats"""
+        name = f" for watchlist '{watchlist.name}'" if len(self.watchlists) > 1 or watchlist.name != 'default' else ""
+        self.log_and_flush('info', f"{self.symbols.get('disk')} Saving {count} matching articles{name} to output files...")
+        os.makedirs(watchlist.output_dir, exist_ok=True)
+        
+        if 'json' in watchlist.output_formats:
+            json_file = os.path.join(watchlist.output_dir, f"news_results_{timestamp}.json")
             with open(json_file, 'w', encoding='utf-8') as f:
-                json_data = []
-                for result in self.results:
+                # Written one result at a time so a spilled store is never loaded whole
+                f.write('[')
+                for i, result in enumerate(results):
                     data = {
                         'url': result.url,
                         'title': result.title,
@@ -1276,19 +4709,19 @@ class NewsWebsiteCrawler:
                         'crawl_timestamp': result.crawl_timestamp,
                         'error': result.error
                     }
-                    json_data.append(data)
-                
-                json.dump(json_data, f, indent=2, ensure_ascii=False)
+                    f.write(',\n  ' if i else '\n  ')
+                    f.write(json.dumps(data, indent=2, ensure_ascii=False).replace('\n', '\n  '))
+                f.write('\n]')
             
             self.log_and_flush('info', f"{self.symbols.get('checkmark')} JSON results saved to: {json_file}")
         
-        if 'csv' in self.config['output_formats']:
-            csv_file = f"output/news_results_{timestamp}.csv"
+        if 'csv' in watchlist.output_formats:
+            csv_file = os.path.join(watchlist.output_dir, f"news_results_{timestamp}.csv")
             with open(csv_file, 'w', newline='', encoding='utf-8') as f:
                 writer = csv.writer(f)
                 writer.writerow(['URL', 'Title', 'Companies', 'Keywords', 'Date', 'Timestamp', 'Error'])
                 
-                for result in self.results:
+                for result in results:
                     writer.writerow([
                         result.url,
                         result.title,
@@ -1301,11 +4734,43 @@ class NewsWebsiteCrawler:
             
             self.log_and_flush('info', f"{self.symbols.get('checkmark')} CSV results saved to: {csv_file}")
         
-        self.log_and_flush('info', f"{self.symbols.get('folder')} All results have been saved successfully!")
+        if 'sqlite' in watchlist.output_formats:
+            db_path = watchlist.results_db_path
+            try:
+                db = ResultsDatabase(db_path)
+                written = db.upsert(results, self.canonicalizer.canonicalize)
+                db.close()
+                self.log_and_flush('info', f"{self.symbols.get('checkmark')} {written} results upserted into: {db_path}")
+            except Exception as e:
+                self.log_and_flush('error', f"{self.symbols.get('error')} Could not write results database {db_path}: {e}")
+
 
+_archive_crawler: Optional[NewsWebsiteCrawler] = None
 
-def main():
+
+def _init_archive_worker(config: Dict, matcher: WatchlistMatcher):
+    """Build an offline extraction and matching crawler in an archive worker process"""
+    global _archive_crawler
+    logging.getLogger(__name__).setLevel(logging.WARNING)
+    _archive_crawler = NewsWebsiteCrawler.for_archive_worker(config, matcher)
+
+
+def _reprocess_archive_chunk(segment: str, entries: List[Dict]) -> Tuple[Dict, List[Dict]]:
+    return _archive_crawler.reprocess_archived_pages(segment, entries)
+
+
+def main(argv: List[str] = None):
     """Main entry point"""
+    parser = argparse.ArgumentParser(description="Advanced News Website Crawler")
+    parser.add_argument('--config', default=None, help="Path to the JSON config file (default: config.json)")
+    parser.add_argument('--profile', nargs='?', const='cprofile', choices=['cprofile', 'sampling'], default=None,
+                        help="Profile the run (default profiler: cprofile); reports are written to output/")
+    parser.add_argument('--daemon', action='store_true',
+                        help="Keep running and poll each feed/sitemap on an adaptive schedule instead of doing one pass")
+    parser.add_argument('--reprocess-archive', action='store_true',
+                        help="Re-run extraction and matching over the page archive (archive_dir) instead of crawling")
+    args = parser.parse_args(argv)
+    
     print("Advanced News Website Crawler")
     print("=" * 40)
     
@@ -1319,7 +4784,17 @@ def main():
         input("Press Enter to continue or Ctrl+C to exit...")
     
     try:
-        crawler = NewsWebsiteCrawler()
+        # Reprocessing is offline: aliases come from the bundled dataset and local parsing only
+        crawler = NewsWebsiteCrawler(args.config, config_overrides={
+            'profile': args.profile, 'use_online_company_aliases': False if args.reprocess_archive else None})
+        if args.reprocess_archive:
+            crawler.reprocess_archive()
+            print(f"\nArchive reprocessing completed! Found {len(crawler.results)} matching articles.")
+            return
+        if args.daemon:
+            crawler.run_daemon()
+            print(f"\nDaemon stopped after processing {crawler.stats['total_urls_processed']} articles.")
+            return
         crawler.run()
         
         print(f"\nCrawling completed! Found {len(crawler.results)} matching articles.")
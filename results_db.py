@@ -0,0 +1,305 @@
+#!/usr/bin/env python3
+"""
+SQLite results store for the news crawler
+Matches from every run are upserted into one database, keyed by canonical URL,
+with normalized articles/companies/keywords tables, company and keyword match
+tables, and an FTS5 index over title and content, so questions such as "all
+articles mentioning X with keyword Y this month" are indexed queries instead of
+scans over dozens of news_results_*.json files.
+
+Usage:
+    python results_db.py query --company "Acme Corp" --keyword merger --since 2025-09-01
+    python results_db.py query --text "supply contract" --json
+    python results_db.py import output/news_results_*.json
+    python results_db.py stats
+"""
+
+import os
+import re
+import sys
+import json
+import glob
+import sqlite3
+import argparse
+import threading
+from datetime import datetime
+from typing import Callable, Dict, Iterable, List, Optional
+
+
+SCHEMA = """
+    CREATE TABLE IF NOT EXISTS articles (
+        id INTEGER PRIMARY KEY,
+        canonical_url TEXT NOT NULL UNIQUE,
+        url TEXT NOT NULL,
+        title TEXT NOT NULL DEFAULT '',
+        content TEXT NOT NULL DEFAULT '',
+        article_date TEXT,
+        published TEXT NOT NULL,
+        first_seen TEXT NOT NULL,
+        last_seen TEXT NOT NULL,
+        error TEXT
+    );
+    CREATE INDEX IF NOT EXISTS articles_published ON articles (published);
+    CREATE TABLE IF NOT EXISTS companies (id INTEGER PRIMARY KEY, name TEXT NOT NULL UNIQUE COLLATE NOCASE);
+    CREATE TABLE IF NOT EXISTS keywords (id INTEGER PRIMARY KEY, name TEXT NOT NULL UNIQUE COLLATE NOCASE);
+    CREATE TABLE IF NOT EXISTS company_matches (
+        company_id INTEGER NOT NULL REFERENCES companies (id),
+        article_id INTEGER NOT NULL REFERENCES articles (id) ON DELETE CASCADE,
+        PRIMARY KEY (company_id, article_id)
+    ) WITHOUT ROWID;
+    CREATE TABLE IF NOT EXISTS keyword_matches (
+        keyword_id INTEGER NOT NULL REFERENCES keywords (id),
+        article_id INTEGER NOT NULL REFERENCES articles (id) ON DELETE CASCADE,
+        PRIMARY KEY (keyword_id, article_id)
+    ) WITHOUT ROWID;
+"""
+
+FTS_SCHEMA = """
+    CREATE VIRTUAL TABLE IF NOT EXISTS articles_fts USING fts5 (
+        title, content, content='articles', content_rowid='id', tokenize='unicode61 remove_diacritics 2'
+    );
+    CREATE TRIGGER IF NOT EXISTS articles_fts_insert AFTER INSERT ON articles BEGIN
+        INSERT INTO articles_fts (rowid, title, content) VALUES (new.id, new.title, new.content);
+    END;
+    CREATE TRIGGER IF NOT EXISTS articles_fts_delete AFTER DELETE ON articles BEGIN
+        INSERT INTO articles_fts (articles_fts, rowid, title, content) VALUES ('delete', old.id, old.title, old.content);
+    END;
+    CREATE TRIGGER IF NOT EXISTS articles_fts_update AFTER UPDATE OF title, content ON articles BEGIN
+        INSERT INTO articles_fts (articles_fts, rowid, title, content) VALUES ('delete', old.id, old.title, old.content);
+        INSERT INTO articles_fts (rowid, title, content) VALUES (new.id, new.title, new.content);
+    END;
+"""
+
+
+def published_day(article_date: Optional[str], crawl_timestamp: str) -> str:
+    """YYYY-MM-DD used for date filters: the article date when it starts with one, else the crawl date"""
+    for value in (article_date, crawl_timestamp):
+        match = re.match(r'\s*(\d{4}-\d{2}-\d{2})', value or '')
+        if match:
+            return match.group(1)
+    return datetime.now().strftime('%Y-%m-%d')
+
+
+class ResultsDatabase:
+    """Matched articles from all runs in one SQLite database (WAL mode, one connection per thread)"""
+
+    def __init__(self, path: str = "output/news_results.db"):
+        self.path = path
+        self.local = threading.local()
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        conn = self.connection()
+        conn.executescript(SCHEMA)
+        try:
+            conn.executescript(FTS_SCHEMA)
+            self.has_fts = True
+        except sqlite3.OperationalError:
+            # SQLite built without FTS5: text search falls back to LIKE scans
+            self.has_fts = False
+
+    def connection(self) -> sqlite3.Connection:
+        """Per-thread connection (sqlite3 connections cannot be shared between threads)"""
+        conn = getattr(self.local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=60, isolation_level=None)
+            conn.row_factory = sqlite3.Row
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            conn.execute('PRAGMA foreign_keys=ON')
+            self.local.conn = conn
+        return conn
+
+    def close(self):
+        conn = getattr(self.local, 'conn', None)
+        if conn is not None:
+            conn.close()
+            self.local.conn = None
+
+    def _term_id(self, conn: sqlite3.Connection, table: str, name: str, cache: Dict) -> int:
+        key = (table, name.lower())
+        if key not in cache:
+            conn.execute(f'INSERT OR IGNORE INTO {table} (name) VALUES (?)', (name,))
+            cache[key] = conn.execute(f'SELECT id FROM {table} WHERE name = ?', (name,)).fetchone()[0]
+        return cache[key]
+
+    def upsert(self, results: Iterable, canonicalize: Callable[[str], str] = None) -> int:
+        """Insert or update results (StoredResult/CrawlResult objects or their dicts); returns the number written.
+
+        An article seen again keeps its first_seen time; title, content and date
+        are replaced only by non-empty values, the longer content wins, and the
+        company and keyword matches of all runs are kept.
+        """
+        conn = self.connection()
+        term_ids = {}
+        written = 0
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            for result in results:
+                data = result if isinstance(result, dict) else {
+                    'url': result.url, 'title': result.title, 'content': result.content,
+                    'found_companies': result.found_companies, 'found_keywords': result.found_keywords,
+                    'article_date': result.article_date, 'crawl_timestamp': result.crawl_timestamp, 'error': result.error
+                }
+                crawl_timestamp = data.get('crawl_timestamp') or datetime.now().isoformat()
+                canonical_url = canonicalize(data['url']) if canonicalize else data['url']
+                article_id = conn.execute("""
+                    INSERT INTO articles (canonical_url, url, title, content, article_date, published, first_seen, last_seen, error)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    ON CONFLICT (canonical_url) DO UPDATE SET
+                        url = excluded.url,
+                        title = CASE WHEN excluded.title != '' THEN excluded.title ELSE articles.title END,
+                        content = CASE WHEN length(excluded.content) >= length(articles.content)
+                                       THEN excluded.content ELSE articles.content END,
+                        article_date = COALESCE(excluded.article_date, articles.article_date),
+                        published = CASE WHEN excluded.article_date IS NOT NULL
+                                         THEN excluded.published ELSE articles.published END,
+                        first_seen = min(articles.first_seen, excluded.first_seen),
+                        last_seen = max(articles.last_seen, excluded.last_seen),
+                        error = excluded.error
+                    RETURNING id
+                """, (canonical_url, data['url'], data.get('title') or '', data.get('content') or '',
+                      data.get('article_date'), published_day(data.get('article_date'), crawl_timestamp),
+                      crawl_timestamp, crawl_timestamp, data.get('error'))).fetchone()[0]
+                conn.executemany('INSERT OR IGNORE INTO company_matches (company_id, article_id) VALUES (?, ?)',
+                                 [(self._term_id(conn, 'companies', name, term_ids), article_id)
+                                  for name in data.get('found_companies') or ()])
+                conn.executemany('INSERT OR IGNORE INTO keyword_matches (keyword_id, article_id) VALUES (?, ?)',
+                                 [(self._term_id(conn, 'keywords', name, term_ids), article_id)
+                                  for name in data.get('found_keywords') or ()])
+                written += 1
+            conn.execute('COMMIT')
+        except Exception:
+            conn.execute('ROLLBACK')
+            raise
+        return written
+
+    def query(self, text: str = None, companies: List[str] = (), keywords: List[str] = (),
+              since: str = None, until: str = None, limit: int = 50) -> List[Dict]:
+        """Articles matching every given company and keyword, published in [since, until], newest first.
+
+        text is an FTS5 query over title and content ("supply contract",
+        acme AND merger, merg*); with text, results are ordered by relevance.
+        """
+        clauses, params = [], []
+        for name in companies:
+            clauses.append('a.id IN (SELECT m.article_id FROM company_matches m JOIN companies c ON c.id = m.company_id'
+                           ' WHERE c.name = ?)')
+            params.append(name)
+        for name in keywords:
+            clauses.append('a.id IN (SELECT m.article_id FROM keyword_matches m JOIN keywords k ON k.id = m.keyword_id'
+                           ' WHERE k.name = ?)')
+            params.append(name)
+        if since:
+            clauses.append('a.published >= ?')
+            params.append(since[:10])
+        if until:
+            clauses.append('a.published <= ?')
+            params.append(until[:10])
+
+        source, order = 'articles a', 'a.published DESC, a.last_seen DESC'
+        if text and self.has_fts:
+            source = 'articles_fts f JOIN articles a ON a.id = f.rowid'
+            clauses.insert(0, 'articles_fts MATCH ?')
+            params.insert(0, text)
+            order = 'f.rank'
+        elif text:
+            clauses.append('(a.title LIKE ? OR a.content LIKE ?)')
+            params.extend([f'%{text}%', f'%{text}%'])
+
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ''
+        rows = self.connection().execute(f"""
+            SELECT a.*,
+                   (SELECT group_concat(c.name, '; ') FROM company_matches m JOIN companies c ON c.id = m.company_id
+                    WHERE m.article_id = a.id) AS found_companies,
+                   (SELECT group_concat(k.name, '; ') FROM keyword_matches m JOIN keywords k ON k.id = m.keyword_id
+                    WHERE m.article_id = a.id) AS found_keywords
+            FROM {source} {where} ORDER BY {order} LIMIT ?
+        """, params + [limit]).fetchall()
+        return [dict(row) for row in rows]
+
+    def counts(self) -> Dict[str, int]:
+        conn = self.connection()
+        return {table: conn.execute(f'SELECT COUNT(*) FROM {table}').fetchone()[0]
+                for table in ('articles', 'companies', 'keywords', 'company_matches', 'keyword_matches')}
+
+    def top_terms(self, table: str, limit: int = 10) -> List[tuple]:
+        """Most matched companies or keywords as (name, article count)"""
+        match_table, column = ('company_matches', 'company_id') if table == 'companies' else ('keyword_matches', 'keyword_id')
+        return [tuple(row) for row in self.connection().execute(f"""
+            SELECT t.name, COUNT(*) AS articles FROM {match_table} m JOIN {table} t ON t.id = m.{column}
+            GROUP BY t.id ORDER BY articles DESC LIMIT ?
+        """, (limit,))]
+
+
+def import_files(db: ResultsDatabase, patterns: List[str]) -> int:
+    """Load earlier news_results_*.json exports into the database, keyed like the crawler's own upserts"""
+    from news_crawler import UrlCanonicalizer  # imported here: news_crawler imports this module
+    canonicalize = UrlCanonicalizer().canonicalize
+    total = 0
+    for pattern in patterns:
+        for path in sorted(glob.glob(pattern)):
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    results = json.load(f)
+                count = db.upsert(results, canonicalize)
+                total += count
+                print(f"Imported {count} articles from {path}")
+            except Exception as e:
+                print(f"Warning: Could not import {path}: {e}")
+    return total
+
+
+def main(argv: List[str] = None):
+    parser = argparse.ArgumentParser(description="Query and maintain the news crawler's SQLite results store")
+    parser.add_argument('--db', default='output/news_results.db', help="Results database (default: output/news_results.db)")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    query = commands.add_parser('query', help="Find stored articles")
+    query.add_argument('--text', help="Full-text query over title and content (FTS5 syntax)")
+    query.add_argument('--company', action='append', default=[], help="Company that must be matched (repeatable)")
+    query.add_argument('--keyword', action='append', default=[], help="Keyword that must be matched (repeatable)")
+    query.add_argument('--since', help="Earliest publish date, YYYY-MM-DD")
+    query.add_argument('--until', help="Latest publish date, YYYY-MM-DD")
+    query.add_argument('--limit', type=int, default=50, help="Maximum articles returned (default: 50)")
+    query.add_argument('--json', action='store_true', help="Print results as JSON")
+
+    importer = commands.add_parser('import', help="Load earlier news_results_*.json files")
+    importer.add_argument('files', nargs='+', help="JSON result files or glob patterns")
+
+    commands.add_parser('stats', help="Show table sizes and the most matched companies and keywords")
+    args = parser.parse_args(argv)
+
+    if args.command != 'import' and not os.path.exists(args.db):
+        print(f"Error: Results database not found: {args.db}")
+        return 1
+    db = ResultsDatabase(args.db)
+
+    if args.command == 'import':
+        print(f"Imported {import_files(db, args.files)} articles into {args.db}")
+    elif args.command == 'stats':
+        for table, count in db.counts().items():
+            print(f"{table:<18}{count:>10,}")
+        for table in ('companies', 'keywords'):
+            top = db.top_terms(table)
+            if top:
+                print(f"\nTop {table}: " + ", ".join(f"{name} ({count})" for name, count in top))
+    else:
+        try:
+            articles = db.query(args.text, args.company, args.keyword, args.since, args.until, args.limit)
+        except sqlite3.OperationalError as e:
+            print(f"Error: Invalid query: {e}")
+            return 1
+        if args.json:
+            print(json.dumps(articles, indent=2, ensure_ascii=False))
+        else:
+            for article in articles:
+                print(f"{article['published']}  {article['title'] or article['url']}")
+                print(f"            {article['url']}")
+                print(f"            Companies: {article['found_companies'] or '-'} | Keywords: {article['found_keywords'] or '-'}")
+            print(f"\n{len(articles)} article(s)")
+    db.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""Tests for the per-host circuit breaker state transitions"""
+
+import time
+
+from news_crawler import CircuitBreaker
+
+HOST = 'news.example.com'
+
+
+def open_breaker(cooldown: float = 0.05) -> CircuitBreaker:
+    breaker = CircuitBreaker(failure_rate=0.5, min_requests=4, window=10, cooldown=cooldown, max_cooldown=0.15)
+    changes = [breaker.record(HOST, 'timeout') for _ in range(4)]
+    assert changes == [None, None, None, 'opened']
+    return breaker
+
+
+def test_stays_closed_below_min_requests_and_failure_rate():
+    breaker = CircuitBreaker(failure_rate=0.5, min_requests=4, window=10)
+    # Three failures are not enough outcomes to judge the host yet
+    assert [breaker.record(HOST, 'timeout') for _ in range(3)] == [None, None, None]
+    other = CircuitBreaker(failure_rate=0.5, min_requests=4, window=10)
+    # One failure in four is below the failure rate
+    assert [other.record(HOST, failure) for failure in ('timeout', None, None, None)] == [None, None, None, None]
+    assert breaker.allow(HOST) == 0.0
+    assert other.allow(HOST) == 0.0
+    assert breaker.hosts[HOST]['state'] == CircuitBreaker.CLOSED
+
+
+def test_open_refuses_until_cooldown():
+    breaker = open_breaker(cooldown=60)
+    assert breaker.allow(HOST) > 59
+    assert breaker.retry_in(HOST) > 59
+    assert breaker.tripped()[HOST]['refused'] == 1
+    # Fetches that were already running when the circuit opened don't change it
+    assert breaker.record(HOST) is None
+    assert breaker.hosts[HOST]['state'] == CircuitBreaker.OPEN
+
+
+def test_half_open_probe_success_closes():
+    breaker = open_breaker()
+    time.sleep(0.06)
+    assert breaker.allow(HOST) == 0.0
+    assert breaker.hosts[HOST]['state'] == CircuitBreaker.HALF_OPEN
+    # Only one probe at a time
+    assert breaker.allow(HOST) == CircuitBreaker.PROBE_WAIT
+    assert breaker.record(HOST) == 'closed'
+    assert breaker.allow(HOST) == 0.0
+    assert breaker.hosts[HOST]['cooldown'] == 0.05
+
+
+def test_half_open_probe_failure_reopens_with_longer_cooldown():
+    breaker = open_breaker()
+    time.sleep(0.06)
+    assert breaker.allow(HOST) == 0.0
+    assert breaker.record(HOST, 'HTTP 503') == 'reopened'
+    assert breaker.hosts[HOST]['cooldown'] == 0.1
+    assert breaker.allow(HOST) > 0
+    time.sleep(0.11)
+    assert breaker.allow(HOST) == 0.0
+    assert breaker.record(HOST, 'HTTP 503') == 'reopened'
+    assert breaker.hosts[HOST]['cooldown'] == 0.15  # capped at max_cooldown
+    assert breaker.tripped()[HOST]['last_failure'] == 'HTTP 503'
+
+
+def test_hosts_are_independent():
+    breaker = open_breaker(cooldown=60)
+    assert breaker.allow('other.example.com') == 0.0
+    assert breaker.retry_in('other.example.com') == 0.0
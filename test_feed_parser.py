@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""Tests for the streaming RSS/Atom parser and its feedparser fallback"""
+
+import logging
+import threading
+from collections import Counter
+from types import SimpleNamespace
+from xml.etree import ElementTree
+
+import pytest
+import requests
+
+from news_crawler import NewsWebsiteCrawler, StreamingFeedParser
+
+RSS = b"""<?xml version="1.0" encoding="UTF-8"?>
+<rss version="2.0" xmlns:content="http://purl.org/rss/1.0/modules/content/">
+<channel><title>Example</title>
+<item><title>First</title><link>https://example.com/news/first</link>
+<pubDate>Mon, 06 Oct 2025 10:00:00 GMT</pubDate>
+<description>Summary one</description>
+<content:encoded><![CDATA[<p>Full text one</p>]]></content:encoded></item>
+<item><title>Guid only</title><guid>https://example.com/news/second</guid></item>
+<item><title>No link</title><guid isPermaLink="false">item-3</guid></item>
+</channel></rss>"""
+
+ATOM = b"""<?xml version="1.0" encoding="utf-8"?>
+<feed xmlns="http://www.w3.org/2005/Atom"><title>Example</title>
+<entry><title>Atom entry</title>
+<link rel="self" href="https://example.com/api/entries/1"/>
+<link rel="alternate" href="https://example.com/news/atom-entry"/>
+<updated>2025-10-05T08:00:00Z</updated><published>2025-10-04T08:00:00Z</published>
+<summary>Atom summary</summary></entry>
+</feed>"""
+
+
+def test_rss_items():
+    entries = StreamingFeedParser.parse(RSS)
+    assert [entry.link for entry in entries] == ['https://example.com/news/first', 'https://example.com/news/second']
+    first = entries[0]
+    assert first.title == 'First'
+    assert first.summary == 'Summary one'
+    assert first.content == '<p>Full text one</p>'
+    assert first.published == 'Mon, 06 Oct 2025 10:00:00 GMT'
+    assert first.timestamp == 1759744800.0
+
+
+def test_rss_limit():
+    assert len(StreamingFeedParser.parse(RSS, limit=1)) == 1
+
+
+def test_atom_prefers_alternate_link_and_published_date():
+    entries = StreamingFeedParser.parse(ATOM)
+    assert len(entries) == 1
+    assert entries[0].link == 'https://example.com/news/atom-entry'
+    assert entries[0].published == '2025-10-04T08:00:00Z'
+    assert entries[0].summary == 'Atom summary'
+
+
+def test_truncated_feed():
+    truncated = RSS[:RSS.index(b'<item><title>Guid only')] + b'<item><title>Cut'
+    # Entries before the cut are enough when the limit is reached first
+    assert [entry.title for entry in StreamingFeedParser.parse(truncated, limit=1)] == ['First']
+    with pytest.raises(ElementTree.ParseError):
+        StreamingFeedParser.parse(truncated)
+
+
+def test_rejects_html_page():
+    with pytest.raises(ValueError):
+        StreamingFeedParser.parse(b'<html><body><p>Not a feed</p></body></html>')
+
+
+def feed_reader():
+    """Just the state read_feed_entries() uses"""
+    return SimpleNamespace(config={'max_articles_per_site': 50, 'streaming_feed_parser': True},
+                           lock=threading.Lock(), stats=Counter(), logger=logging.getLogger(__name__))
+
+
+def feed_response(content: bytes) -> requests.Response:
+    response = requests.models.Response()
+    response.status_code = 200
+    response.url = 'https://example.com/feed'
+    response.headers['Content-Type'] = 'application/rss+xml'
+    response._content = content
+    return response
+
+
+def test_undefined_entity_falls_back_to_feedparser():
+    content = RSS.replace(b'Summary one', b'Summary&nbsp;one')
+    with pytest.raises(ElementTree.ParseError):
+        StreamingFeedParser.parse(content)
+    reader = feed_reader()
+    entries = NewsWebsiteCrawler.read_feed_entries(reader, feed_response(content))
+    assert reader.stats == {'feeds_feedparser': 1}
+    assert entries[0].link == 'https://example.com/news/first'
+    assert entries[0].timestamp == 1759744800.0
+
+
+def test_well_formed_feed_is_streamed():
+    reader = feed_reader()
+    entries = NewsWebsiteCrawler.read_feed_entries(reader, feed_response(RSS))
+    assert reader.stats == {'feeds_streamed': 1}
+    assert len(entries) == 2
@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+"""Tests for the compact seen-URL set"""
+
+import threading
+
+from news_crawler import UrlFingerprintSet
+
+
+def test_add_and_contains():
+    urls = UrlFingerprintSet(stripes=4)
+    assert urls.add('https://example.com/a')
+    assert not urls.add('https://example.com/a')
+    assert 'https://example.com/a' in urls
+    assert 'https://example.com/b' not in urls
+    assert len(urls) == 1
+
+
+def test_many_urls_survive_merges():
+    urls = UrlFingerprintSet(stripes=2)
+    added = [f"https://example.com/news/{i}" for i in range(5000)]
+    assert all(urls.add(url) for url in added)
+    assert len(urls) == 5000
+    assert all(url in urls for url in added)
+    assert not any(urls.add(url) for url in added[::7])
+    assert f"https://example.com/news/{5000}" not in urls
+    assert urls.memory_bytes() < 5000 * 32
+
+
+def test_concurrent_adds_count_each_url_once():
+    urls = UrlFingerprintSet()
+    results = []
+
+    def add_all():
+        results.append(sum(urls.add(f"https://example.com/{i}") for i in range(2000)))
+
+    threads = [threading.Thread(target=add_all) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert sum(results) == 2000
+    assert len(urls) == 2000
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""Tests for the shared SQLite work queue used by distributed crawls"""
+
+import time
+
+import pytest
+
+from distributed_crawl import SQLiteWorkQueue, WorkQueue, open_work_queue
+
+
+@pytest.fixture
+def work_queue(tmp_path):
+    return SQLiteWorkQueue(str(tmp_path / 'queue.db'))
+
+
+def test_work_queue_is_abstract():
+    with pytest.raises(TypeError):
+        WorkQueue()
+
+
+def test_open_work_queue(tmp_path):
+    assert isinstance(open_work_queue(str(tmp_path / 'bare.db')), SQLiteWorkQueue)
+    with pytest.raises(ValueError):
+        open_work_queue('redis://localhost/0')
+
+
+def test_add_tasks_ignores_duplicate_keys(work_queue):
+    assert work_queue.add_tasks('article', [('a', 'https://a.example/1', 1.0), ('b', 'https://b.example/1', 2.0)]) == 2
+    assert work_queue.add_tasks('article', [('a', 'https://a.example/1', 1.0)]) == 0
+    assert work_queue.counts()['pending'] == 2
+
+
+def test_lease_order_discovery_first_then_newest(work_queue):
+    work_queue.add_tasks('article', [('old', 'https://a.example/old', 1.0), ('new', 'https://b.example/new', 5.0)])
+    work_queue.add_tasks('discover', [('site', 'https://c.example/', 0.0)])
+    kinds = [work_queue.lease('w1', 60) for _ in range(3)]
+    assert [(task['kind'], task['payload']) for task in kinds] == [
+        ('discover', 'https://c.example/'), ('article', 'https://b.example/new'), ('article', 'https://a.example/old')]
+    assert work_queue.lease('w1', 60) is None
+    assert work_queue.counts() == {'pending': 0, 'leased': 3, 'done': 0, 'failed': 0}
+
+
+def test_lease_prefers_hosts_nobody_is_working_on(work_queue):
+    work_queue.add_tasks('article', [('a1', 'https://a.example/1', 3.0), ('a2', 'https://a.example/2', 2.0),
+                                     ('b1', 'https://b.example/1', 1.0)])
+    assert work_queue.lease('w1', 60)['payload'] == 'https://a.example/1'
+    assert work_queue.lease('w2', 60)['payload'] == 'https://b.example/1'
+    assert work_queue.lease('w3', 60)['payload'] == 'https://a.example/2'
+
+
+def test_complete_only_by_lease_holder(work_queue):
+    work_queue.add_tasks('article', [('a', 'https://a.example/1', 1.0)])
+    task = work_queue.lease('w1', 60)
+    work_queue.complete(task['id'], 'w2')
+    assert work_queue.counts()['leased'] == 1
+    work_queue.complete(task['id'], 'w1')
+    assert work_queue.counts()['done'] == 1
+
+
+def test_expired_leases_are_requeued_then_failed(work_queue):
+    work_queue.add_tasks('article', [('a', 'https://a.example/1', 1.0)])
+    work_queue.lease('w1', -1)
+    assert work_queue.requeue_expired(max_attempts=2) == 1
+    assert work_queue.counts()['pending'] == 1
+    work_queue.lease('w2', -1)
+    assert work_queue.requeue_expired(max_attempts=2) == 1
+    assert work_queue.counts()['failed'] == 1
+    assert work_queue.lease('w3', 60) is None
+
+
+def test_heartbeat_keeps_lease_alive(work_queue):
+    work_queue.add_tasks('article', [('a', 'https://a.example/1', 1.0)])
+    work_queue.lease('w1', -1)
+    assert work_queue.heartbeat('w1', 60) == 1
+    assert work_queue.requeue_expired(max_attempts=3) == 0
+    assert work_queue.counts()['leased'] == 1
+
+
+def test_fail_gives_task_back_until_max_attempts(work_queue):
+    work_queue.add_tasks('article', [('a', 'https://a.example/1', 1.0)])
+    task = work_queue.lease('w1', 60)
+    work_queue.fail(task['id'], 'w1', 'boom', max_attempts=2)
+    task = work_queue.lease('w1', 60)
+    assert task is not None
+    work_queue.fail(task['id'], 'w1', 'boom', max_attempts=2)
+    assert work_queue.counts()['failed'] == 1
+
+
+def test_retry_waits_for_delay_and_does_not_use_up_attempts(work_queue):
+    work_queue.add_tasks('article', [('a', 'https://a.example/1', 1.0)])
+    for retries in range(3):
+        task = work_queue.lease('w1', 60)
+        assert task['retries'] == retries
+        work_queue.retry(task['id'], 'w1', 0.05)
+        assert work_queue.lease('w1', 60) is None
+        assert work_queue.counts()['pending'] == 1
+        time.sleep(0.06)
+    # Retries are not lost leases: max_attempts still allows the next expiry
+    work_queue.lease('w1', -1)
+    assert work_queue.requeue_expired(max_attempts=2) == 1
+    assert work_queue.counts()['pending'] == 1
+
+
+def test_results_and_meta(work_queue):
+    work_queue.add_result('default https://a.example/1', {'url': 'https://a.example/1', 'title': 'A'})
+    work_queue.add_result('default https://a.example/1', {'url': 'https://a.example/1', 'title': 'A2'})
+    assert list(work_queue.iter_results()) == [{'url': 'https://a.example/1', 'title': 'A2'}]
+    assert work_queue.get_meta('seeded') is None
+    work_queue.set_meta('seeded', '1')
+    assert work_queue.get_meta('seeded') == '1'
+    work_queue.reset()
+    assert work_queue.get_meta('seeded') is None
+    assert list(work_queue.iter_results()) == []